@@ -1,13 +1,19 @@
-"""Tracks which authentication method API requests use.
+"""Tracks which authentication method API requests use, and keeps Basic
+Auth affordable until it is gone.
 
 Part of the Basic Auth deprecation migration: lets us measure adoption of
 token-based auth over time before removing Basic Auth entirely.
 """
 
 import logging
+import threading
+import time
 from datetime import UTC, datetime
 
+from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.utils.crypto import constant_time_compare, salted_hmac
 from knox.auth import TokenAuthentication
 from rest_framework.authentication import BasicAuthentication, SessionAuthentication
 
@@ -60,3 +66,100 @@ def record_auth_method_usage(request, user):
         ip,
         extra={"username": user.username, "auth_method": slug, "ip": ip},
     )
+
+
+# Process-local verifications are kept at most this long (and never longer
+# than API_BASIC_AUTH_CACHE_TTL), and at most this many of them.
+LOCAL_VERIFICATION_TTL = 60
+LOCAL_VERIFICATION_MAX = 10_000
+
+_local_lock = threading.Lock()
+_local_verifications: dict[str, tuple[int, str, float]] = {}
+
+
+def _credential_digest(userid, password) -> str:
+    # Keyed with SECRET_KEY, so neither the cache keys nor their values reveal
+    # usernames or let a password be brute-forced offline from Redis.
+    return salted_hmac(
+        "api.authentication.basic", f"{userid}\0{password}", algorithm="sha256"
+    ).hexdigest()
+
+
+def _verification_key(digest: str) -> str:
+    return f"basicauth:{digest}"
+
+
+def _get_verification(digest: str):
+    now = time.monotonic()
+    with _local_lock:
+        entry = _local_verifications.get(digest)
+        if entry is not None:
+            if entry[2] > now:
+                return entry[:2]
+            del _local_verifications[digest]
+    entry = cache.get(_verification_key(digest))
+    if entry is not None:
+        _remember_locally(digest, entry)
+    return entry
+
+
+def _remember_locally(digest: str, entry) -> None:
+    expires = time.monotonic() + min(LOCAL_VERIFICATION_TTL, settings.API_BASIC_AUTH_CACHE_TTL)
+    with _local_lock:
+        if len(_local_verifications) >= LOCAL_VERIFICATION_MAX:
+            _local_verifications.clear()
+        _local_verifications[digest] = (*entry, expires)
+
+
+def _forget_verification(digest: str) -> None:
+    with _local_lock:
+        _local_verifications.pop(digest, None)
+    cache.delete(_verification_key(digest))
+
+
+def reset_local_verifications() -> None:
+    """Drop this process's cached verifications (tests)."""
+    with _local_lock:
+        _local_verifications.clear()
+
+
+class CachedBasicAuthentication(BasicAuthentication):
+    """BasicAuthentication that skips the password hash for credentials that
+    verified recently.
+
+    Every Basic Auth request used to run the full PBKDF2 hasher. A successful
+    verification is now remembered, in Redis for API_BASIC_AUTH_CACHE_TTL
+    seconds and in-process for up to LOCAL_VERIFICATION_TTL, under a keyed
+    digest of the username and password, as the user's pk and their session
+    auth hash (an HMAC of the stored password hash, as used by
+    django.contrib.auth to end sessions on password change). A cached entry
+    only counts while that hash still matches and the user is active, so
+    changing the password or deactivating the account invalidates it at once.
+
+    Failed attempts are never cached: a wrong password, or an unknown user,
+    always goes through authenticate() and the hasher as before, so timings
+    and responses don't tell either case apart.
+    """
+
+    def authenticate_credentials(self, userid, password, request=None):
+        if not settings.API_BASIC_AUTH_CACHE_TTL:
+            return super().authenticate_credentials(userid, password, request)
+
+        digest = _credential_digest(userid, password)
+        entry = _get_verification(digest)
+        if entry is not None:
+            user_pk, auth_hash = entry
+            user = get_user_model()._default_manager.filter(pk=user_pk).first()
+            if (
+                user is not None
+                and user.is_active
+                and constant_time_compare(user.get_session_auth_hash(), auth_hash)
+            ):
+                return (user, None)
+            _forget_verification(digest)
+
+        user, auth = super().authenticate_credentials(userid, password, request)
+        entry = (user.pk, user.get_session_auth_hash())
+        cache.set(_verification_key(digest), entry, settings.API_BASIC_AUTH_CACHE_TTL)
+        _remember_locally(digest, entry)
+        return (user, auth)
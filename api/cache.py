@@ -10,20 +10,58 @@ Two independent invalidation schemes are used, depending on endpoint shape:
 * List responses (list, and collection-scoped actions like series_list) are
   cached under a key that includes a per-model cache-generation counter in
   Redis, bumped by signal handlers (see comicsdb/signals.py) whenever data a
-  list response could embed changes.
+  list response could embed changes. A list request filtered down to one
+  series or publisher (e.g. `/api/issue/?series_id=`) is keyed on that
+  scope's own counters instead -- see `scoped_label()` -- so an edit to some
+  other series doesn't invalidate it.
+
+Both kinds are filled through `get_or_render()`, which coalesces concurrent
+misses on the same key: one worker renders while the rest wait for its
+result (or, for list keys, briefly keep serving the previous generation's
+payload), so a generation bump on a hot list costs one render instead of
+one per in-flight request.
+
+What gets cached is the final rendered body (see `CachedBody`), not the
+serializer data, so a hit is written straight back out without unpickling a
+large nested structure and re-encoding it as JSON on every request. Each
+body's ETag is also stored on its own under `etag_cache_key()`, so an
+`If-None-Match` request for an unchanged response is answered from that
+small key alone, without fetching the body.
 """
 
 import hashlib
-from collections.abc import Iterable
+import time
+import zlib
+from collections.abc import Callable, Iterable
 from enum import StrEnum
-from typing import Any, Protocol
+from typing import Any, NamedTuple, Protocol
 
+from django.conf import settings
 from django.core.cache import cache
 
 DETAIL_CACHE_TTL = 60 * 60 * 24  # 24h safety net; live keys self-invalidate on write.
 LIST_CACHE_TTL = 60 * 2  # 2min; bounds staleness from nested-object changes we don't chase.
 
 _VERSION_KEY_PREFIX = "cachever"
+_LOCK_KEY_PREFIX = "api:lock"
+_STALE_KEY_PREFIX = "api:stale"
+_OUTCOME_KEY_PREFIX = "api:outcome"
+_ETAG_KEY_PREFIX = "api:etag"
+#: Seconds the per-bucket hit/miss counters live before starting over.
+CACHE_OUTCOME_TTL = 60 * 60 * 24
+
+#: Seconds a worker may hold a key's render lock before it is presumed dead.
+RENDER_LOCK_TIMEOUT = 10
+#: Seconds other workers wait on that render before rendering it themselves.
+RENDER_WAIT_TIMEOUT = 2.0
+_RENDER_POLL_INTERVAL = 0.05
+#: Seconds a list payload stays servable after its generation is bumped,
+#: while one worker re-renders it (0 disables stale-while-revalidate).
+STALE_CACHE_TTL = settings.API_CACHE_STALE_TTL
+#: Bodies at least this many bytes long are zlib-compressed in Redis (0
+#: disables compression). Large JSON lists shrink several-fold, which is most
+#: of what audit_response_cache reports for the api:list categories.
+COMPRESS_MIN_BYTES = settings.API_CACHE_COMPRESS_MIN_BYTES
 
 
 class ModelLabel(StrEnum):
@@ -40,6 +78,42 @@ class ModelLabel(StrEnum):
     UNIVERSE = "universe"
 
 
+class CacheScope(StrEnum):
+    """Narrower cache generations a list response can be keyed on."""
+
+    SERIES = "series"
+    PUBLISHER = "publisher"
+
+
+class CacheStatus(StrEnum):
+    """How get_or_render() produced a payload; sent as the X-Cache header."""
+
+    HIT = "HIT"
+    MISS = "MISS"
+    STALE = "STALE"
+
+
+class CachedBody(NamedTuple):
+    """A rendered response body as stored in the cache."""
+
+    content: bytes
+    content_type: str
+    etag: str
+    compressed: bool = False
+
+    @classmethod
+    def encode(cls, body: bytes, content_type: str) -> CachedBody:
+        """Wrap a freshly rendered `body`, tagging it with a strong ETag and
+        compressing it when it is large enough to be worth it."""
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        if COMPRESS_MIN_BYTES and len(body) >= COMPRESS_MIN_BYTES:
+            return cls(zlib.compress(body, 1), content_type, etag, compressed=True)
+        return cls(body, content_type, etag)
+
+    def body(self) -> bytes:
+        return zlib.decompress(self.content) if self.compressed else self.content
+
+
 class _CacheKeyRequest(Protocol):
     """The subset of DRF's Request that cache-key builders need -- narrowed
     so cache.py doesn't have to import rest_framework.request.Request just
@@ -137,18 +211,33 @@ def get_model_versions(model_labels: Iterable[str]) -> dict[str, int]:
     }
 
 
-def bump_model_version(model_label: str) -> None:
+def bump_model_version(model_label: str) -> int:
     """Invalidate list caches that depend on `model_label` by advancing its
-    generation counter."""
+    generation counter. Returns the new counter value."""
     key = f"{_VERSION_KEY_PREFIX}:{model_label}"
     try:
-        cache.incr(key)
+        return cache.incr(key)
     except ValueError:
         # Key doesn't exist yet. At most one concurrent caller's `add` wins;
         # the other's bump is harmlessly absorbed, since a version key that
         # didn't exist means no list cache entry was ever computed under any
         # version of it either.
         cache.add(key, 1, timeout=None)
+        return get_model_version(model_label)
+
+
+def scoped_label(model_label: str, scope: CacheScope, scope_id: Any) -> str:
+    """Version-counter label for `model_label` rows under one series or
+    publisher, e.g. "issue@series:42"."""
+    return f"{model_label}@{scope}:{scope_id}"
+
+
+def bump_scoped_versions(model_label: str, scope: CacheScope, scope_ids: Iterable[Any]) -> None:
+    """Invalidate the list caches keyed on `model_label` within each of
+    `scope_ids`. Callers still bump the global counter as well, for the
+    lists that aren't filtered down to one scope."""
+    for scope_id in {scope_id for scope_id in scope_ids if scope_id is not None}:
+        bump_model_version(scoped_label(model_label, scope, scope_id))
 
 
 def list_cache_key(
@@ -156,6 +245,7 @@ def list_cache_key(
     *dependent_labels: str,
     request: _CacheKeyRequest,
     scope: str = "",
+    cache_scope: tuple[CacheScope, Any] | None = None,
 ) -> str:
     """Cache key for a list-type response: one or more model versions plus a
     normalized hash of the request's origin and query params -- see
@@ -163,9 +253,100 @@ def list_cache_key(
     not `.dict()` -- `.dict()` silently drops all-but-the-last value for
     repeated params (e.g. IssueFilter's `role_id`), which would let distinct
     multi-value requests collide on the same key.
+
+    `cache_scope` is a `(CacheScope, id)` pair for a response that only
+    contains rows from that one series/publisher: every label is then read
+    from its scoped counter (see `scoped_label()`) instead of the global one.
     """
     labels = (model_label, *dependent_labels)
+    if cache_scope is not None:
+        scope = f"{scope}@{cache_scope[0]}:{cache_scope[1]}"
+        labels = tuple(scoped_label(label, *cache_scope) for label in labels)
     version_map = get_model_versions(labels)
     versions = "-".join(str(version_map[lbl]) for lbl in labels)
     digest = _request_digest(request)
     return f"api:list:{model_label}:{scope}:{versions}:{digest}"
+
+
+def stale_cache_key(key: str) -> str:
+    """The generation-independent twin of a `list_cache_key()` key: same
+    model, scope and request digest, minus the version segment -- so it
+    still holds the previous generation's payload after a bump."""
+    head, _versions, digest = key.rsplit(":", 2)
+    return f"{_STALE_KEY_PREFIX}:{head.removeprefix('api:list:')}:{digest}"
+
+
+def etag_cache_key(key: str) -> str:
+    """Key holding just the ETag of the body cached under `key`."""
+    return f"{_ETAG_KEY_PREFIX}:{key}"
+
+
+def get_cached_etag(key: str) -> str | None:
+    return cache.get(etag_cache_key(key))
+
+
+def record_cache_outcome(bucket: str, cache_status: CacheStatus) -> None:
+    """Count a HIT/MISS/STALE for `bucket` (e.g. "list:issue@series"), for
+    `audit_response_cache`'s per-scope hit rates."""
+    key = f"{_OUTCOME_KEY_PREFIX}:{bucket}:{cache_status}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        # First outcome for this bucket; a concurrent first one may be lost.
+        cache.add(key, 1, CACHE_OUTCOME_TTL)
+
+
+def get_or_render(
+    key: str,
+    render: Callable[[], Any],
+    timeout: int,
+    *,
+    stale_key: str | None = None,
+) -> tuple[Any, CacheStatus]:
+    """Return the cached payload for `key`, rendering it on a miss.
+
+    `render()` returns the payload to cache, or None for a response that
+    mustn't be cached (e.g. a non-200). Only one worker at a time renders
+    a given key (a Redis `add` lock); the others serve the `stale_key`
+    payload if there is one, else poll for the renderer's result for up to
+    RENDER_WAIT_TIMEOUT before rendering it themselves -- the lock is a
+    load optimization, never something a request fails on.
+    """
+    cached = cache.get(key)
+    if cached is not None:
+        return cached, CacheStatus.HIT
+
+    lock_key = f"{_LOCK_KEY_PREFIX}:{key}"
+    if not cache.add(lock_key, 1, RENDER_LOCK_TIMEOUT):
+        if stale_key and STALE_CACHE_TTL:
+            stale = cache.get(stale_key)
+            if stale is not None:
+                return stale, CacheStatus.STALE
+        deadline = time.monotonic() + RENDER_WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(_RENDER_POLL_INTERVAL)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached, CacheStatus.HIT
+            if cache.get(lock_key) is None:
+                # The renderer finished without caching anything (e.g. a 404).
+                break
+        return _render_and_store(key, render, timeout, stale_key), CacheStatus.MISS
+
+    try:
+        return _render_and_store(key, render, timeout, stale_key), CacheStatus.MISS
+    finally:
+        cache.delete(lock_key)
+
+
+def _render_and_store(key, render, timeout, stale_key):
+    payload = render()
+    if payload is None:
+        return None
+    entries = {key: payload}
+    if isinstance(payload, CachedBody):
+        entries[etag_cache_key(key)] = payload.etag
+    cache.set_many(entries, timeout)
+    if stale_key and STALE_CACHE_TTL:
+        cache.set(stale_key, payload, timeout + STALE_CACHE_TTL)
+    return payload
@@ -4,10 +4,15 @@ A client that keeps retrying after a 429 instead of backing off puts
 unnecessary load on production. This logs and counts those events (per
 user/day where a user can be identified) so the offending client can be
 traced back to a specific account and contacted.
+
+Throttled accounts are also indexed per scope and day, in a Redis hash
+`throttled:{scope}:{date}` of username -> count, and the scopes seen so far
+in the set `throttled:scopes`, so the repeat-offender report reads a few
+hashes instead of scanning the whole keyspace (which also holds the response
+cache and thumbnail entries) for individual counters.
 """
 
 import logging
-import re
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
@@ -19,30 +24,55 @@ logger = logging.getLogger(__name__)
 # Counters are keyed per day, so this is cleanup headroom, not a retention window.
 CLIENT_HEALTH_COUNTER_TTL = 60 * 60 * 24 * 35
 
-# Matches the tail of a `throttled:{scope}:user:{username}:{date}` cache key,
-# regardless of the `:1:` version prefix Django's cache framework adds.
-_THROTTLE_KEY_RE = re.compile(
-    r"throttled:(?P<scope>[^:]+):user:(?P<username>[^:]+):(?P<date>[^:]+)$"
-)
+THROTTLED_SCOPES_KEY = "throttled:scopes"
 
 
 def _today():
     return datetime.now(UTC).date().isoformat()
 
 
-def _request_identity(request):
+def _throttled_users_key(scope: str, date_str: str) -> str:
+    return f"throttled:{scope}:{date_str}"
+
+
+def _authenticated_username(request):
     user = getattr(request, "user", None)
     if user is not None and getattr(user, "is_authenticated", False):
-        return f"user:{user.username}"
+        return user.username
+    return None
+
+
+def _request_identity(request):
+    username = _authenticated_username(request)
+    if username is not None:
+        return f"user:{username}"
     return f"ip:{request.META.get('REMOTE_ADDR', 'unknown')}"
 
 
+def _index_throttled_user(scope: str, username: str, date_str: str) -> None:
+    # Django's cache API has no hashes or sets, so this uses the redis-py
+    # client behind the cache backend (the same one find_repeat_offenders reads).
+    client = cache._cache.get_client(write=True)
+    users_key = cache.make_key(_throttled_users_key(scope, date_str))
+    scopes_key = cache.make_key(THROTTLED_SCOPES_KEY)
+    pipe = client.pipeline(transaction=False)
+    pipe.hincrby(users_key, username, 1)
+    pipe.expire(users_key, CLIENT_HEALTH_COUNTER_TTL)
+    pipe.sadd(scopes_key, scope)
+    pipe.expire(scopes_key, CLIENT_HEALTH_COUNTER_TTL)
+    pipe.execute()
+
+
 def record_throttled_request(request, scope):
     """Called whenever a throttle denies a request (a 429 is about to be returned)."""
     identity = _request_identity(request)
-    cache_key = f"throttled:{scope}:{identity}:{_today()}"
+    today = _today()
+    cache_key = f"throttled:{scope}:{identity}:{today}"
     cache.add(cache_key, 0, timeout=CLIENT_HEALTH_COUNTER_TTL)
     count = cache.incr(cache_key)
+    username = _authenticated_username(request)
+    if username is not None:
+        _index_throttled_user(scope, username, today)
 
     logger.warning(
         "Request throttled (%s limit) for %s (%d today)",
@@ -68,7 +98,7 @@ def find_repeat_offenders(
     extreme_day_threshold: int = 100,
     exclude_through: dict[str, date] | None = None,
 ) -> list[RepeatOffender]:
-    """Scan the throttled-request counters for accounts that keep getting
+    """Read the per-day throttled-user hashes for accounts that keep getting
     rate-limited without backing off. Flags an account if either is true, within
     the last `lookback_days`:
 
@@ -87,41 +117,38 @@ def find_repeat_offenders(
     happens to overlap it (e.g. a weekly run 7 days after a spike, or any run
     the same day a notice was just sent).
 
-    Django's cache framework has no key-scanning API, so this drops to the
-    underlying redis-py client (the same one the cache backend itself uses) to
-    SCAN for matching keys.
+    This costs one SMEMBERS plus one HGETALL per scope and day in the window,
+    all in a single pipeline.
     """
     exclude_through = exclude_through or {}
-    cutoff = (datetime.now(UTC) - timedelta(days=lookback_days)).date()
+    today = datetime.now(UTC).date()
+    days = [today - timedelta(days=n) for n in range(lookback_days + 1)]
     client = cache._cache.get_client(write=False)
 
-    daily_counts_by_user: dict[str, dict[str, int]] = defaultdict(dict)
-    for raw_key in client.scan_iter(match="*throttled:*:user:*"):
-        key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
-        match = _THROTTLE_KEY_RE.search(key)
-        if not match:
-            continue
-
-        date_str = match["date"]
-        try:
-            day = datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
-            continue
-        if day < cutoff:
-            continue
-
-        username = match["username"]
-        already_notified_through = exclude_through.get(username)
-        if already_notified_through is not None and day <= already_notified_through:
-            continue
-
-        value = client.get(raw_key)
-        if value is None:
-            continue
+    scopes = sorted(
+        scope.decode() if isinstance(scope, bytes) else scope
+        for scope in client.smembers(cache.make_key(THROTTLED_SCOPES_KEY))
+    )
+    pipe = client.pipeline(transaction=False)
+    for day in days:
+        for scope in scopes:
+            pipe.hgetall(cache.make_key(_throttled_users_key(scope, day.isoformat())))
+    results = iter(pipe.execute())
 
-        daily_counts_by_user[username][date_str] = daily_counts_by_user[username].get(
-            date_str, 0
-        ) + int(value)
+    daily_counts_by_user: dict[str, dict[str, int]] = defaultdict(dict)
+    for day in days:
+        date_str = day.isoformat()
+        for _scope in scopes:
+            for raw_username, value in next(results).items():
+                username = (
+                    raw_username.decode() if isinstance(raw_username, bytes) else raw_username
+                )
+                already_notified_through = exclude_through.get(username)
+                if already_notified_through is not None and day <= already_notified_through:
+                    continue
+                daily_counts_by_user[username][date_str] = daily_counts_by_user[username].get(
+                    date_str, 0
+                ) + int(value)
 
     offenders = []
     for username, daily_counts in daily_counts_by_user.items():
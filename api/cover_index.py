@@ -0,0 +1,168 @@
+"""In-process Hamming-distance index over Issue.cover_hash.
+
+`comicsdb.models.issue.pre_save_cover_hash` stores a 64-bit perceptual hash
+(16 hex chars) for every cover, but an exact-match filter misses a scan that
+differs by even one bit. This answers "every cover within N bits of this
+hash" without pulling every hash out of Postgres per request.
+
+The index is a multi-index hash table: each 64-bit hash is split into four
+16-bit bands, and each band gets its own `band value -> issue ids` table. By
+the pigeonhole principle, two hashes within distance `d` share at least one
+band that differs in at most `d // 4` bits, so a query only has to probe each
+band table with the query's band value and its neighbours within that many
+bit flips, then verify the few candidates with a popcount.
+
+Each worker process builds its own copy lazily from one `values_list()`
+query. Cross-process freshness piggybacks on the same Redis generation
+counters as the response cache (see api/cache.py): every cover_hash change
+bumps a dedicated counter, and a worker whose copy was built under an older
+generation rebuilds it on its next search. The worker that handled the write
+applies the change in place instead, when its copy was current.
+"""
+
+import itertools
+import threading
+
+from api.cache import bump_model_version, get_model_version
+
+COVER_HASH_VERSION_LABEL = "cover_hash"
+
+HASH_BITS = 64
+BAND_COUNT = 4
+BAND_BITS = HASH_BITS // BAND_COUNT
+_BAND_MASK = (1 << BAND_BITS) - 1
+
+#: Largest accepted `max_distance`. Keeps the per-band probe radius at two bit
+#: flips (137 probes per band); anything looser stops being a useful
+#: "same cover" match for a 64-bit pHash anyway.
+MAX_DISTANCE = 10
+
+
+def parse_hash(value: str) -> int | None:
+    """Parse a 16-hex-digit cover hash, returning None for anything else
+    (including the empty string stored for issues without a cover)."""
+    if len(value) != HASH_BITS // 4:
+        return None
+    try:
+        return int(value, 16)
+    except ValueError:
+        return None
+
+
+def _bands(hash_value: int) -> tuple[int, ...]:
+    return tuple((hash_value >> (BAND_BITS * i)) & _BAND_MASK for i in range(BAND_COUNT))
+
+
+def _flip_masks(radius: int) -> list[int]:
+    """Every BAND_BITS-wide mask with at most `radius` bits set."""
+    masks = [0]
+    for flips in range(1, radius + 1):
+        for bits in itertools.combinations(range(BAND_BITS), flips):
+            masks.append(sum(1 << bit for bit in bits))
+    return masks
+
+
+class CoverHashIndex:
+    """Multi-index hash table mapping cover hashes to issue ids."""
+
+    def __init__(self, rows=()):
+        self._hashes: dict[int, int] = {}
+        self._tables: list[dict[int, set[int]]] = [{} for _ in range(BAND_COUNT)]
+        for issue_id, cover_hash in rows:
+            self.add(issue_id, cover_hash)
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def add(self, issue_id: int, cover_hash: str) -> None:
+        """Insert or replace an issue's hash. An unparseable/empty hash
+        just removes the issue from the index."""
+        self.remove(issue_id)
+        hash_value = parse_hash(cover_hash)
+        if hash_value is None:
+            return
+        self._hashes[issue_id] = hash_value
+        for table, band in zip(self._tables, _bands(hash_value), strict=True):
+            table.setdefault(band, set()).add(issue_id)
+
+    def remove(self, issue_id: int) -> None:
+        hash_value = self._hashes.pop(issue_id, None)
+        if hash_value is None:
+            return
+        for table, band in zip(self._tables, _bands(hash_value), strict=True):
+            ids = table.get(band)
+            if ids is None:
+                continue
+            ids.discard(issue_id)
+            if not ids:
+                del table[band]
+
+    def search(self, hash_value: int, max_distance: int) -> list[tuple[int, int]]:
+        """Return `(issue_id, distance)` pairs within `max_distance` bits of
+        `hash_value`, nearest first (ties broken by issue id)."""
+        masks = _flip_masks(max_distance // BAND_COUNT)
+        candidates: set[int] = set()
+        for table, band in zip(self._tables, _bands(hash_value), strict=True):
+            for mask in masks:
+                ids = table.get(band ^ mask)
+                if ids:
+                    candidates.update(ids)
+
+        matches = []
+        for issue_id in candidates:
+            distance = (self._hashes[issue_id] ^ hash_value).bit_count()
+            if distance <= max_distance:
+                matches.append((issue_id, distance))
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+
+_lock = threading.Lock()
+_index: CoverHashIndex | None = None
+_index_version: int | None = None
+
+
+def _build_index() -> CoverHashIndex:
+    from comicsdb.models import Issue  # noqa: PLC0415
+
+    rows = Issue.objects.exclude(cover_hash="").values_list("id", "cover_hash").iterator()
+    return CoverHashIndex(rows)
+
+
+def get_cover_index() -> CoverHashIndex:
+    """Return this process's index, rebuilding it first if another process
+    has changed a cover hash since it was built."""
+    global _index, _index_version  # noqa: PLW0603
+
+    version = get_model_version(COVER_HASH_VERSION_LABEL)
+    with _lock:
+        if _index is None or _index_version != version:
+            _index = _build_index()
+            _index_version = version
+        return _index
+
+
+def record_cover_hash_change(issue_id: int, cover_hash: str) -> None:
+    """Signal-side hook: publish a cover hash change to every process, and
+    apply it in place to this process's index if that was up to date --
+    saving this worker a full rebuild for its own write. An empty
+    `cover_hash` records a removal."""
+    global _index_version  # noqa: PLW0603
+
+    current = bump_model_version(COVER_HASH_VERSION_LABEL)
+    with _lock:
+        if _index is None or _index_version != current - 1:
+            # Stale already, or another process bumped in between -- leave
+            # it for the next search to rebuild.
+            return
+        _index.add(issue_id, cover_hash)
+        _index_version = current
+
+
+def reset_cover_index() -> None:
+    """Drop this process's index (tests, or to force a rebuild)."""
+    global _index, _index_version  # noqa: PLW0603
+
+    with _lock:
+        _index = None
+        _index_version = None
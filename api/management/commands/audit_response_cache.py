@@ -7,6 +7,10 @@ from django.core.management.base import BaseCommand
 
 _DETAIL_PREFIX = "api:detail:"
 _LIST_PREFIX = "api:list:"
+_STALE_PREFIX = "api:stale:"
+_LOCK_PREFIX = "api:lock:"
+_OUTCOME_PREFIX = "api:outcome:"
+_ETAG_PREFIX = "api:etag:"
 _VERSION_PREFIX = "cachever:"
 _BYTES_PER_UNIT = 1024
 
@@ -15,10 +19,12 @@ class Command(BaseCommand):
     help = (
         "One-off audit of the Redis-backed API response cache -- key counts and "
         "estimated memory footprint per category (api:detail:<model>, "
-        "api:list:<model>, cachever, everything else), plus global hit-rate and "
-        "eviction stats. Meant to be run against production shortly after the "
-        "caching PR deploys (and again later) to see whether DETAIL_CACHE_TTL/"
-        "LIST_CACHE_TTL (api/cache.py) need tuning, rather than guessing."
+        "api:list:<model>, api:stale:<model>, api:lock, api:etag, api:outcome, "
+        "cachever, everything else), global hit-rate and eviction stats, and the "
+        "API's own hit rate per endpoint kind and cache scope. Meant to be run "
+        "against production shortly after the caching PR deploys (and again "
+        "later) to see whether DETAIL_CACHE_TTL/LIST_CACHE_TTL (api/cache.py) "
+        "need tuning, rather than guessing."
     )
 
     def add_arguments(self, parser) -> None:
@@ -48,6 +54,7 @@ class Command(BaseCommand):
         categories, total_keys, elapsed = self._scan_and_categorize(client, options["scan_count"])
         self.stdout.write(f"\nScanned {total_keys:,} keys in {elapsed:.1f}s.")
         self._print_category_report(client, categories, options["sample_size"])
+        self._print_outcome_report(client, categories.get("api:outcome", []))
 
     def _print_global_stats(self, client) -> None:
         try:
@@ -104,12 +111,13 @@ class Command(BaseCommand):
         # Substring match rather than startswith(): robust to however Django's
         # RedisCache backend wraps the logical key (e.g. a ":<version>:"
         # prefix), without needing to know its exact format.
-        if _DETAIL_PREFIX in key:
-            model = key.split(_DETAIL_PREFIX, 1)[1].split(":", 1)[0]
-            return f"api:detail:{model}"
-        if _LIST_PREFIX in key:
-            model = key.split(_LIST_PREFIX, 1)[1].split(":", 1)[0]
-            return f"api:list:{model}"
+        for prefix in (_LOCK_PREFIX, _ETAG_PREFIX, _OUTCOME_PREFIX):
+            if prefix in key:
+                return prefix.rstrip(":")
+        for prefix in (_STALE_PREFIX, _DETAIL_PREFIX, _LIST_PREFIX):
+            if prefix in key:
+                model = key.split(prefix, 1)[1].split(":", 1)[0]
+                return f"{prefix}{model}"
         if _VERSION_PREFIX in key:
             return "cachever"
         return "other (Select2, throttling, etc.)"
@@ -142,6 +150,31 @@ class Command(BaseCommand):
             "re-run periodically and compare, not just once.)"
         )
 
+    def _print_outcome_report(self, client, keys: list) -> None:
+        """Hit rate per bucket from the counters record_cache_outcome()
+        (api/cache.py) keeps, e.g. "list:issue@series" vs "list:issue" --
+        i.e. whether the scoped list generations are actually paying off."""
+        self.stdout.write(self.style.MIGRATE_HEADING("\nHit rate by scope (last 24h)"))
+        outcomes: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for raw_key in keys:
+            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+            bucket, cache_status = key.split(_OUTCOME_PREFIX, 1)[1].rsplit(":", 1)
+            value = client.get(raw_key)
+            if value is not None:
+                outcomes[bucket][cache_status] += int(value)
+        if not outcomes:
+            self.stdout.write("  No outcomes recorded.")
+            return
+
+        for bucket in sorted(outcomes):
+            counts = outcomes[bucket]
+            hits, misses, stale = counts["HIT"], counts["MISS"], counts["STALE"]
+            total = hits + misses + stale
+            self.stdout.write(
+                f"  {bucket:<32} {(hits + stale) / total:>6.1%}   "
+                f"({hits:,} hits / {stale:,} stale / {misses:,} misses)"
+            )
+
     @staticmethod
     def _sample_avg_memory(client, keys: list, sample_size: int) -> float | None:
         sample = keys if len(keys) <= sample_size else random.sample(keys, sample_size)
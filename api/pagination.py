@@ -0,0 +1,188 @@
+"""Pagination for the API's list endpoints.
+
+Page-number pagination stays the default, but OFFSET paging plus a COUNT(*)
+over the whole filtered queryset gets linearly slower the deeper a client
+pages. Passing `?cursor=` (empty for the first page) switches a list
+endpoint into keyset mode instead: each page is fetched with a
+`WHERE (ordering columns) > (last row's values)` predicate on the view's
+`cursor_ordering`, so a page costs the same regardless of depth and no
+COUNT is run at all.
+"""
+
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from functools import reduce
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _encode_position(values: list) -> str:
+    raw = json.dumps(values, cls=DjangoJSONEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_position(cursor: str, expected_length: int) -> list | None:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as err:
+        raise NotFound(KeysetPageNumberPagination.invalid_cursor_message) from err
+    if not isinstance(values, list) or len(values) != expected_length:
+        raise NotFound(KeysetPageNumberPagination.invalid_cursor_message)
+    return values
+
+
+def _field_is_nullable(model, path: str) -> bool:
+    """Whether any hop along a `related__field` ordering path can be NULL
+    (a nullable FK makes everything after it nullable too)."""
+    opts = model._meta
+    for part in path.split(LOOKUP_SEP):
+        try:
+            field = opts.get_field(part)
+        except FieldDoesNotExist:
+            return True
+        if field.null:
+            return True
+        if field.is_relation:
+            opts = field.related_model._meta
+    return False
+
+
+def _to_python(model, path: str, value):
+    """A cursor value as the Python value of the field it was taken from, so
+    a tampered cursor fails here instead of while the lookup is built."""
+    if value is None:
+        return None
+    opts = model._meta
+    for part in path.split(LOOKUP_SEP):
+        field = opts.get_field(part)
+        if field.is_relation:
+            opts = field.related_model._meta
+    if field.is_relation:
+        field = field.target_field
+    return field.to_python(value)
+
+
+def _after_position(model, ordering: tuple[str, ...], values: list) -> Q:
+    """Rows strictly after `values` in `ordering`, written out as the
+    expanded lexicographic comparison (a row-value comparison can't mix
+    ASC/DESC columns or NULLs). Follows Postgres' default NULL placement:
+    NULLS LAST for ascending columns, NULLS FIRST for descending ones."""
+    condition = Q(pk__in=[])
+    equal_so_far = Q()
+    for order_field, raw_value in zip(ordering, values, strict=True):
+        descending = order_field.startswith("-")
+        field = order_field.removeprefix("-")
+        nullable = _field_is_nullable(model, field)
+        value = _to_python(model, field, raw_value)
+
+        if value is None:
+            after = Q(**{f"{field}__isnull": False}) if descending else None
+            equal = Q(**{f"{field}__isnull": True})
+        else:
+            after = Q(**{f"{field}__{'lt' if descending else 'gt'}": value})
+            if nullable and not descending:
+                after |= Q(**{f"{field}__isnull": True})
+            equal = Q(**{field: value})
+
+        if after is not None:
+            condition |= equal_so_far & after
+        equal_so_far &= equal
+    return condition
+
+
+class KeysetPageNumberPagination(PageNumberPagination):
+    """PageNumberPagination with an opt-in keyset ("cursor") mode.
+
+    Keyset mode applies to a view's `list` action when the view declares a
+    `cursor_ordering` -- a total ordering (ending in a unique column) that
+    should match the list's normal ordering, so both modes return rows in
+    the same order. Detail-scoped actions (issue_list, etc.) paginate other
+    querysets and always use page numbers.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = _(
+        "Keyset pagination cursor. Pass an empty value for the first page, then follow `next`. "
+        "Skips the total count, and is as fast on the last page as on the first."
+    )
+    invalid_cursor_message = _("Invalid cursor")
+
+    def _get_cursor_ordering(self, request, view) -> tuple[str, ...] | None:
+        if self.cursor_query_param not in request.query_params:
+            return None
+        if getattr(view, "action", None) != "list":
+            return None
+        return getattr(view, "cursor_ordering", None)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_ordering = self._get_cursor_ordering(request, view)
+        if self.cursor_ordering is None:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        position = _decode_position(
+            request.query_params[self.cursor_query_param], len(self.cursor_ordering)
+        )
+        queryset = queryset.order_by(*self.cursor_ordering)
+        if position is not None:
+            try:
+                queryset = queryset.filter(
+                    _after_position(queryset.model, self.cursor_ordering, position)
+                )
+            except (TypeError, ValueError, ValidationError) as err:
+                raise NotFound(self.invalid_cursor_message) from err
+
+        # One extra row tells us whether there's a next page, without a COUNT.
+        rows = list(queryset[: page_size + 1])
+        page = rows[:page_size]
+        self.next_position = None
+        if len(rows) > page_size:
+            last = page[-1]
+            self.next_position = [
+                reduce(getattr, field.removeprefix("-").split(LOOKUP_SEP), last)
+                for field in self.cursor_ordering
+            ]
+        return page
+
+    def get_next_link(self):
+        if self.cursor_ordering is None:
+            return super().get_next_link()
+        if self.next_position is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, _encode_position(self.next_position)
+        )
+
+    def get_paginated_response(self, data):
+        if self.cursor_ordering is None:
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([("next", self.get_next_link()), ("results", data)]))
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        if getattr(view, "cursor_ordering", None):
+            parameters.append(
+                {
+                    "name": self.cursor_query_param,
+                    "required": False,
+                    "in": "query",
+                    "description": str(self.cursor_query_description),
+                    "schema": {"type": "string"},
+                }
+            )
+        return parameters
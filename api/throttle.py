@@ -5,19 +5,122 @@ from rest_framework.throttling import UserRateThrottle
 from api.authentication import record_auth_method_usage
 from api.client_health import record_throttled_request
 
+# Generic cell rate algorithm: a limit of N requests per window is one request
+# per `interval` (window / N), with up to N of them allowed back to back. The
+# only state is the "theoretical arrival time" (TAT): the moment the client's
+# budget would be fully restored. Charging a request pushes it `cost` intervals
+# further; it is refused if that would put it more than one window ahead.
+# Times are whole milliseconds: Redis truncates numbers returned from Lua to
+# integers and Lua's tostring() keeps only 14 significant digits, so
+# fractional epoch seconds would be rounded on every trip.
+#
+# KEYS[1]: throttle key
+# ARGV: now, interval, window (ms), cost (units)
+# Returns {allowed (0/1), TAT after the request (ms)}.
+_GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local tat = tonumber(redis.call("GET", KEYS[1])) or now
+if tat < now then
+    tat = now
+end
+local new_tat = tat + interval * cost
+if new_tat - now > window then
+    return {0, tat}
+end
+redis.call("SET", KEYS[1], tostring(new_tat), "PX", new_tat - now)
+return {1, new_tat}
+"""
+
+# Gives back `ARGV[1]` ms of a TAT set by _GCRA_SCRIPT, if it still exists.
+_REFUND_SCRIPT = """
+local tat = tonumber(redis.call("GET", KEYS[1]))
+if not tat then
+    return 0
+end
+redis.call("SET", KEYS[1], tostring(tat - tonumber(ARGV[1])), "KEEPTTL")
+return 1
+"""
+
+
+def _redis_client(cache):
+    # Django's cache API has no atomic read-modify-write, so this uses the
+    # redis-py client behind the RedisCache backend (see also client_health).
+    return cache._cache.get_client(write=True)
+
+
+def _ms(seconds) -> int:
+    return round(seconds * 1000)
+
+
+def units_in_use(cache, key, interval, now) -> int:
+    """Units a client has used of a limit whose state is stored under the
+    (unprefixed) throttle `key`, where each unit takes `interval` seconds to
+    be given back."""
+    tat = _redis_client(cache).get(cache.make_key(key))
+    try:
+        tat = int(tat)
+    except TypeError, ValueError:
+        # Missing, or a history list left by the old DRF-style throttle,
+        # which the script overwrites on the client's next request.
+        return 0
+    return max(0, math.ceil((tat - _ms(now)) / max(1, _ms(interval))))
+
+
+class RedisRateThrottle(UserRateThrottle):
+    """UserRateThrottle with its state kept as a single GCRA timestamp in
+    Redis, checked and updated by a Lua script in one round trip, instead of
+    a list of every request timestamp in the window read and rewritten by
+    each request."""
+
+    #: Units charged for the current request; see RateLimitHeadersMixin.
+    cost = 1
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        self.interval = self.duration / self.num_requests
+        script = _redis_client(self.cache).register_script(_GCRA_SCRIPT)
+        allowed, tat = script(
+            keys=[self.cache.make_key(self.key)],
+            args=[_ms(self.now), self._interval_ms, _ms(self.duration), self.cost],
+        )
+        self.tat = tat / 1000
+        return bool(allowed)
+
+    @property
+    def _interval_ms(self) -> int:
+        return max(1, _ms(self.interval))
+
+    def units_used(self) -> int:
+        return max(0, math.ceil((_ms(self.tat) - _ms(self.now)) / self._interval_ms))
+
+    def wait(self):
+        """Seconds until the refused request would fit in the window."""
+        return max(0.0, self.tat + self.interval * self.cost - self.duration - self.now)
+
 
 class RateLimitHeadersMixin:
     def allow_request(self, request, view):
+        # Views may charge more than one unit for a request that does the
+        # work of many (e.g. IssueViewSet.bulk_lookup).
+        get_throttle_cost = getattr(view, "get_throttle_cost", None)
+        self.cost = get_throttle_cost(request) if get_throttle_cost else 1
         result = super().allow_request(request, view)
-        if hasattr(self, "num_requests") and self.num_requests is not None:
+        if getattr(self, "num_requests", None) is not None and hasattr(self, "tat"):
             django_request = request._request
             if not hasattr(django_request, "_throttle_headers"):
                 django_request._throttle_headers = {}
-            remaining = max(0, self.num_requests - len(self.history))
-            if self.history:
-                reset_time = math.ceil(self.history[-1] + self.duration)
-            else:
-                reset_time = math.ceil(self.now + self.duration)
+            remaining = max(0, self.num_requests - self.units_used())
+            reset_time = math.ceil(max(self.tat, self.now))
             scope = getattr(self, "scope", "default").capitalize()
             django_request._throttle_headers[f"X-RateLimit-{scope}-Limit"] = str(self.num_requests)
             django_request._throttle_headers[f"X-RateLimit-{scope}-Remaining"] = str(remaining)
@@ -27,11 +130,11 @@ class RateLimitHeadersMixin:
         return result
 
 
-class BurstRateThrottle(RateLimitHeadersMixin, UserRateThrottle):
+class BurstRateThrottle(RateLimitHeadersMixin, RedisRateThrottle):
     scope = "burst"
 
 
-class SustainedRateThrottle(RateLimitHeadersMixin, UserRateThrottle):
+class SustainedRateThrottle(RateLimitHeadersMixin, RedisRateThrottle):
     scope = "sustained"
 
     def allow_request(self, request, view):
@@ -41,4 +144,28 @@ class SustainedRateThrottle(RateLimitHeadersMixin, UserRateThrottle):
             if supporter_limit:
                 self.num_requests, self.duration = self.parse_rate(f"{supporter_limit}/day")
             record_auth_method_usage(request, user)
-        return super().allow_request(request, view)
+        allowed = super().allow_request(request, view)
+        if allowed and getattr(self, "key", None) is not None:
+            request._request._sustained_throttle_charge = (self.key, self.interval * self.cost)
+        return allowed
+
+
+def refund_sustained_throttle(request) -> None:
+    """Give back the sustained-limit slot `request` was charged. Used for
+    conditional GETs answered with a 304 straight from the response cache,
+    so polling for changes doesn't eat into a client's daily budget; the
+    burst limit still applies to them."""
+    django_request = request._request
+    charge = getattr(django_request, "_sustained_throttle_charge", None)
+    if charge is None:
+        return
+    key, seconds = charge
+    del django_request._sustained_throttle_charge
+    throttle_cache = SustainedRateThrottle.cache
+    script = _redis_client(throttle_cache).register_script(_REFUND_SCRIPT)
+    if not script(keys=[throttle_cache.make_key(key)], args=[_ms(seconds)]):
+        return
+    headers = getattr(django_request, "_throttle_headers", {})
+    remaining = headers.get("X-RateLimit-Sustained-Remaining")
+    if remaining is not None:
+        headers["X-RateLimit-Sustained-Remaining"] = str(int(remaining) + 1)
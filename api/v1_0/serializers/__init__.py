@@ -18,6 +18,9 @@ from api.v1_0.serializers.creator import (
 )
 from api.v1_0.serializers.genre import GenreSerializer
 from api.v1_0.serializers.issue import (
+    BulkLookupRequestSerializer,
+    CoverSearchRequestSerializer,
+    CoverSearchResultSerializer,
     IssueListSerializer,
     IssueListSeriesSerializer,
     IssueReadSerializer,
@@ -54,6 +57,8 @@ from api.v1_0.serializers.reading_list import (
 )
 from api.v1_0.serializers.collection import (
     CollectionAddItemSerializer,
+    BulkScrobbleItemSerializer,
+    BulkScrobbleResponseSerializer,
     CollectionListSerializer,
     CollectionRatingUpdateSerializer,
     CollectionReadSerializer,
@@ -69,6 +74,9 @@ __all__ = [
     "AssociatedSeriesSerializer",
     "BasicImprintSerializer",
     "BasicPublisherSerializer",
+    "BulkLookupRequestSerializer",
+    "BulkScrobbleItemSerializer",
+    "BulkScrobbleResponseSerializer",
     "CharacterListSerializer",
     "CharacterReadSerializer",
     "CharacterSerializer",
@@ -76,6 +84,8 @@ __all__ = [
     "CollectionListSerializer",
     "CollectionRatingUpdateSerializer",
     "CollectionReadSerializer",
+    "CoverSearchRequestSerializer",
+    "CoverSearchResultSerializer",
     "CreatorListSerializer",
     "CreatorSerializer",
     "CreditReadSerializer",
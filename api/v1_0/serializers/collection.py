@@ -9,6 +9,9 @@ from comicsdb.models import Issue, Series
 from metron.choices import CURRENCY_CHOICES
 from user_collection.models import CollectionItem, ReadDate
 
+#: Most entries accepted by one `POST /api/collection/scrobble/bulk/`.
+BULK_SCROBBLE_MAX_ENTRIES = 500
+
 
 class ReadDateSerializer(serializers.ModelSerializer):
     """Serializer for read dates."""
@@ -202,13 +205,21 @@ class MissingIssueSerializer(serializers.ModelSerializer):
         )
 
 
-class ScrobbleRequestSerializer(serializers.Serializer):
-    """Serializer for scrobble request validation."""
+class BulkScrobbleItemSerializer(serializers.Serializer):
+    """Serializer for one entry of a bulk scrobble request.
+
+    Issue ids aren't checked here: the view validates the whole batch with
+    a single query instead of one per entry.
+    """
 
     issue_id = serializers.IntegerField()
     date_read = serializers.DateTimeField(required=False, allow_null=True)
     rating = serializers.IntegerField(required=False, allow_null=True, min_value=1, max_value=5)
 
+
+class ScrobbleRequestSerializer(BulkScrobbleItemSerializer):
+    """Serializer for scrobble request validation."""
+
     def validate_issue_id(self, value):
         """Verify issue exists."""
         try:
@@ -237,3 +248,12 @@ class ScrobbleResponseSerializer(serializers.ModelSerializer):
             "created",
             "modified",
         )
+
+
+class BulkScrobbleResponseSerializer(serializers.Serializer):
+    """Serializer for the bulk scrobble response."""
+
+    created = serializers.IntegerField()
+    updated = serializers.IntegerField()
+    read_dates = serializers.IntegerField()
+    results = ScrobbleResponseSerializer(many=True)
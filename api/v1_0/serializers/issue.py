@@ -6,6 +6,7 @@ from djmoney.money import Money
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
+from api.cover_index import MAX_DISTANCE
 from api.v1_0.serializers import CreditReadSerializer
 from api.v1_0.serializers.arc import ArcListSerializer
 from api.v1_0.serializers.character import CharacterListSerializer
@@ -189,6 +190,47 @@ class IssueListSerializer(serializers.ModelSerializer):
         )
 
 
+class CoverSearchRequestSerializer(serializers.Serializer):
+    """Query parameters for the issue cover_search action."""
+
+    hash = serializers.RegexField(r"^[0-9a-fA-F]{16}$")
+    max_distance = serializers.IntegerField(
+        required=False, default=4, min_value=0, max_value=MAX_DISTANCE
+    )
+
+
+#: Most identifiers (of all types combined) one bulk_lookup request may carry.
+BULK_LOOKUP_MAX_IDENTIFIERS = 100
+
+
+class BulkLookupRequestSerializer(serializers.Serializer):
+    """Request body for the issue bulk_lookup action."""
+
+    id = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+    upc = serializers.ListField(child=serializers.CharField(max_length=20), required=False)
+    isbn = serializers.ListField(child=serializers.CharField(max_length=13), required=False)
+    cv_id = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+    gcd_id = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+
+    def validate(self, attrs):
+        count = sum(len(values) for values in attrs.values())
+        if not count:
+            raise serializers.ValidationError(_("Provide at least one identifier."))
+        if count > BULK_LOOKUP_MAX_IDENTIFIERS:
+            raise serializers.ValidationError(
+                _("At most %(max)d identifiers may be looked up per request.")
+                % {"max": BULK_LOOKUP_MAX_IDENTIFIERS}
+            )
+        return attrs
+
+
+class CoverSearchResultSerializer(IssueListSerializer):
+    distance = serializers.IntegerField(read_only=True)
+
+    class Meta(IssueListSerializer.Meta):
+        fields = (*IssueListSerializer.Meta.fields, "distance")
+
+
 class ReprintSerializer(serializers.ModelSerializer):
     issue = serializers.CharField(source="__str__")
 
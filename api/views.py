@@ -1,40 +1,55 @@
-from django.core.cache import cache
-from django.db import models
+import math
+from collections import defaultdict
+from datetime import date
+
 from django.db.models import (
     Avg,
-    Case,
     Count,
     DecimalField,
     F,
-    IntegerField,
     Prefetch,
     Q,
-    Sum,
-    When,
 )
-from django.http import Http404
+from django.db.models.functions import Coalesce
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 from djmoney.money import Money
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework_condition import last_modified
 
 from api.cache import (
     DETAIL_CACHE_TTL,
     LIST_CACHE_TTL,
+    CachedBody,
+    CacheScope,
+    CacheStatus,
     ModelLabel,
     detail_cache_key,
+    get_cached_etag,
+    get_or_render,
     list_cache_key,
+    record_cache_outcome,
+    stale_cache_key,
 )
+from api.cover_index import get_cover_index
+from api.throttle import refund_sustained_throttle
 from api.v1_0.serializers import (
     ArcListSerializer,
     ArcSerializer,
+    BulkLookupRequestSerializer,
+    BulkScrobbleItemSerializer,
+    BulkScrobbleResponseSerializer,
     CharacterListSerializer,
     CharacterReadSerializer,
     CharacterSerializer,
@@ -42,6 +57,8 @@ from api.v1_0.serializers import (
     CollectionListSerializer,
     CollectionRatingUpdateSerializer,
     CollectionReadSerializer,
+    CoverSearchRequestSerializer,
+    CoverSearchResultSerializer,
     CreatorListSerializer,
     CreatorSerializer,
     CreditSerializer,
@@ -73,6 +90,8 @@ from api.v1_0.serializers import (
     UniverseSerializer,
     VariantSerializer,
 )
+from api.v1_0.serializers.collection import BULK_SCROBBLE_MAX_ENTRIES
+from api.v1_0.serializers.issue import BULK_LOOKUP_MAX_IDENTIFIERS
 from api.v1_0.serializers.pull_list import (
     PullListIssueSerializer,
     PullListReadSerializer,
@@ -107,11 +126,16 @@ from comicsdb.models import (
 from comicsdb.models.series import SeriesType
 from comicsdb.models.variant import Variant
 from pull_list.models import PullList, PullListSeries
+from pull_list.release_index import load_issues, upcoming_issue_ids
 from reading_lists.models import ReadingList
-from user_collection.models import CollectionItem
+from user_collection.models import CollectionItem, CollectionStats
 from users.models import CustomUser
 from wish_list.models import WishList, WishListItem
 
+# Series issue counts come from the precomputed stats table
+# (comicsdb/models/stats.py) rather than a COUNT over every series' issues.
+_SERIES_ISSUE_COUNT = Coalesce(F("stats__issue_count"), 0)
+
 
 class ReadingListItemsPagination(PageNumberPagination):
     """Custom pagination for reading list items with 50 items per page."""
@@ -119,17 +143,101 @@ class ReadingListItemsPagination(PageNumberPagination):
     page_size = 50
 
 
-def _mark_cache_status(response: Response, *, hit: bool) -> Response:
+def _mark_cache_status(response, cache_status: CacheStatus):
     """Tag a response with whether it came from the Redis response cache,
     so cache behavior can be checked in production with `curl -I` instead
     of inspecting Redis directly. Only called on the paths that actually
     went through a cache.get()/cache.set() -- a viewset/action with caching
     disabled (no cache_model_label) gets no header at all, rather than a
     misleading MISS."""
-    response["X-Cache"] = "HIT" if hit else "MISS"
+    response["X-Cache"] = cache_status
+    return response
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Weak comparison, as If-None-Match calls for (RFC 9110 13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+def _not_modified(request, etag: str):
+    """304 for a conditional GET whose ETag still matches. Answered without
+    the response body, and refunded from the client's sustained rate limit
+    -- checking "anything new?" shouldn't cost a client its daily budget."""
+    response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+    response["ETag"] = etag
+    refund_sustained_throttle(request)
     return response
 
 
+def _parse_day(value: str | None) -> date | None:
+    """A YYYY-MM-DD query parameter as a date, or None if missing/invalid."""
+    try:
+        return parse_date(value) if value else None
+    except ValueError:
+        return None
+
+
+def _cached_response(view, key, timeout, render_response, *, bucket, stale_key=None):  # noqa: PLR0913
+    """Serve `key` through get_or_render() (single-flight, optionally
+    stale-while-revalidate), caching `render_response()`'s rendered JSON
+    body only when it is a 200. Hits are written back out as-is, skipping
+    the serializer and renderer entirely. The outcome is counted under
+    `bucket` for audit_response_cache.
+
+    Responses carry the cached body's strong ETag, and an `If-None-Match`
+    that still matches is answered with a 304 from the separately cached
+    ETag alone (see api/cache.py).
+
+    Only JSON responses are cached: the browsable API's HTML embeds
+    per-user forms, and is for humans poking at the API anyway."""
+    request = view.request
+    if not isinstance(request.accepted_renderer, JSONRenderer):
+        return render_response()
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        etag = get_cached_etag(key)
+        if etag is not None and _etag_matches(etag, if_none_match):
+            record_cache_outcome(bucket, CacheStatus.HIT)
+            return _mark_cache_status(_not_modified(request, etag), CacheStatus.HIT)
+
+    rendered = None
+    body = None
+
+    def render():
+        nonlocal rendered, body
+        rendered = render_response()
+        if rendered.status_code != status.HTTP_200_OK:
+            return None
+        renderer = request.accepted_renderer
+        context = view.get_renderer_context()
+        context["response"] = rendered
+        body = renderer.render(rendered.data, request.accepted_media_type, context)
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+        return CachedBody.encode(body, content_type)
+
+    entry, cache_status = get_or_render(key, render, timeout, stale_key=stale_key)
+    if rendered is not None:
+        response, cache_status = rendered, CacheStatus.MISS
+        if body is not None:
+            # Hand DRF the body rendered above rather than have it encode
+            # the data a second time.
+            response.content = body
+            response["Content-Type"] = entry.content_type
+    elif if_none_match and _etag_matches(entry.etag, if_none_match):
+        response = _not_modified(request, entry.etag)
+    else:
+        response = HttpResponse(entry.body(), content_type=entry.content_type)
+    if entry is not None:
+        response["ETag"] = entry.etag
+    record_cache_outcome(bucket, cache_status)
+    return _mark_cache_status(response, cache_status)
+
+
 class CachedObjectMixin:
     #: Set on concrete viewsets to enable response caching; None disables it
     #: (fail-open -- behaves exactly as before this attribute existed).
@@ -237,14 +345,13 @@ class ConditionalRetrieveModelMixin(CachedObjectMixin, mixins.RetrieveModelMixin
             *self.cache_detail_dependent_labels,
             request=self.request,
         )
-        cached = cache.get(key)
-        if cached is not None:
-            return _mark_cache_status(Response(cached), hit=True)
-
-        response = mixins.RetrieveModelMixin.retrieve(self, request, *args, **kwargs)
-        if response.status_code == status.HTTP_200_OK:
-            cache.set(key, response.data, DETAIL_CACHE_TTL)
-        return _mark_cache_status(response, hit=False)
+        return _cached_response(
+            self,
+            key,
+            DETAIL_CACHE_TTL,
+            lambda: mixins.RetrieveModelMixin.retrieve(self, request, *args, **kwargs),
+            bucket=f"detail:{self.cache_model_label}",
+        )
 
 
 class UserTrackingMixin:
@@ -264,24 +371,50 @@ class CachedListModelMixin(mixins.ListModelMixin):
 
     cache_model_label: str | None = None
     cache_dependent_labels: tuple[str, ...] = ()
+    #: Total ordering used by `?cursor=` keyset pagination (see
+    #: api/pagination.py); must match the list's normal ordering plus a
+    #: unique tiebreaker. None leaves the endpoint page-number only.
+    cursor_ordering: tuple[str, ...] | None = None
+    #: Filter params that narrow the list to a single series/publisher. A
+    #: request carrying exactly one of them is keyed on that scope's own
+    #: generation counters (see api/cache.py) instead of the global ones.
+    cache_scope_filters: dict[str, CacheScope] = {}
+
+    def get_list_cache_scope(self, request) -> tuple[CacheScope, int] | None:
+        scopes = [
+            (scope, request.query_params.getlist(param))
+            for param, scope in self.cache_scope_filters.items()
+            if param in request.query_params
+        ]
+        if len(scopes) != 1:
+            return None
+        scope, values = scopes[0]
+        if len(values) != 1 or not values[0].isdigit():
+            return None
+        return scope, int(values[0])
 
     def list(self, request, *args, **kwargs):
         if not self.cache_model_label:
             return super().list(request, *args, **kwargs)
 
+        cache_scope = self.get_list_cache_scope(request)
         key = list_cache_key(
             self.cache_model_label,
             *self.cache_dependent_labels,
             request=request,
+            cache_scope=cache_scope,
+        )
+        bucket = f"list:{self.cache_model_label}"
+        if cache_scope is not None:
+            bucket = f"{bucket}@{cache_scope[0]}"
+        return _cached_response(
+            self,
+            key,
+            LIST_CACHE_TTL,
+            lambda: super(CachedListModelMixin, self).list(request, *args, **kwargs),
+            bucket=bucket,
+            stale_key=stale_cache_key(key),
         )
-        cached = cache.get(key)
-        if cached is not None:
-            return _mark_cache_status(Response(cached), hit=True)
-
-        response = super().list(request, *args, **kwargs)
-        if response.status_code == status.HTTP_200_OK:
-            cache.set(key, response.data, LIST_CACHE_TTL)
-        return _mark_cache_status(response, hit=False)
 
 
 class CachedDetailActionMixin(CachedObjectMixin):
@@ -301,31 +434,68 @@ class CachedDetailActionMixin(CachedObjectMixin):
     cache_action_dependent_labels: tuple[str, ...] = ()
 
     def _cached_paginated_action(self, *, build_queryset, serializer_class):
+        def render():
+            obj = self.get_object()
+            queryset = build_queryset(obj)
+            page = self.paginate_queryset(queryset)
+            if page is None:
+                raise Http404
+            serializer = serializer_class(page, many=True, context={"request": self.request})
+            return self.get_paginated_response(serializer.data)
+
         pk, modified = self.get_object_modified()
-        key = None
-        if self.cache_model_label and modified is not None:
-            key = detail_cache_key(
-                self.cache_model_label,
-                self.action,
-                pk,
-                modified,
-                *self.cache_action_dependent_labels,
-                request=self.request,
-            )
-            cached = cache.get(key)
-            if cached is not None:
-                return _mark_cache_status(Response(cached), hit=True)
+        if not self.cache_model_label or modified is None:
+            return render()
 
-        obj = self.get_object()
-        queryset = build_queryset(obj)
-        page = self.paginate_queryset(queryset)
-        if page is None:
-            raise Http404
-        serializer = serializer_class(page, many=True, context={"request": self.request})
-        response = self.get_paginated_response(serializer.data)
-        if key is not None:
-            cache.set(key, response.data, DETAIL_CACHE_TTL)
-            response = _mark_cache_status(response, hit=False)
+        key = detail_cache_key(
+            self.cache_model_label,
+            self.action,
+            pk,
+            modified,
+            *self.cache_action_dependent_labels,
+            request=self.request,
+        )
+        return _cached_response(
+            self, key, DETAIL_CACHE_TTL, render, bucket=f"detail:{self.cache_model_label}"
+        )
+
+
+class NdjsonExportMixin:
+    """Adds an `export` action streaming every (filtered) object as
+    newline-delimited JSON, one retrieve-shaped object per line.
+
+    Meant for sync clients mirroring the catalogue: instead of walking the
+    paginated list endpoint (a COUNT(*) per page, and a throttle charge per
+    page), a whole sync is one long request -- charged as a single
+    throttle unit -- read off a server-side cursor in fixed-size chunks,
+    so memory stays constant regardless of how many rows match. The
+    viewset's filterset still applies (e.g. `?modified_gt=` for
+    incremental syncs), and rows are ordered by id so an interrupted sync
+    can resume from the last id it received.
+    """
+
+    #: Serializer used for each exported row; defaults to the retrieve one.
+    export_serializer_class = None
+    #: Rows fetched per round trip from the server-side cursor (and per
+    #: prefetch_related batch).
+    export_chunk_size = 500
+
+    @extend_schema(responses={(200, "application/x-ndjson"): str})
+    @action(detail=False, permission_classes=[IsAuthenticated])
+    def export(self, request):
+        """Stream all matching objects as newline-delimited JSON."""
+        queryset = self.filter_queryset(self.get_queryset()).order_by("pk")
+        serializer_class = self.export_serializer_class
+        context = self.get_serializer_context()
+        encoder = JSONEncoder(ensure_ascii=False)
+
+        def rows():
+            for obj in queryset.iterator(chunk_size=self.export_chunk_size):
+                data = serializer_class(obj, context=context).data
+                yield encoder.encode(data) + "\n"
+
+        response = StreamingHttpResponse(rows(), content_type="application/x-ndjson")
+        response["Cache-Control"] = "no-store"
         return response
 
 
@@ -383,6 +553,7 @@ class ArcViewSet(
     filterset_class = ComicVineFilter
     parser_classes = (MultiPartParser, FormParser)
     cache_model_label = ModelLabel.ARC
+    cursor_ordering = ("name", "id")
     # issue_list embeds fields from Issue rows (and their Series) that don't
     # cascade a `modified` bump onto this Arc except on M2M add/remove/
     # clear. ModelLabel.ISSUE/SERIES are deliberately NOT used as
@@ -426,6 +597,7 @@ class CharacterViewSet(
     filterset_class = ComicVineFilter
     parser_classes = (MultiPartParser, FormParser)
     cache_model_label = ModelLabel.CHARACTER
+    cursor_ordering = ("name", "id")
     # retrieve also embeds Creator/Universe names (CharacterReadSerializer)
     # that don't cascade a `modified` bump onto this Character either, but
     # those are deliberately left as bounded (TTL-limited) staleness rather
@@ -481,6 +653,7 @@ class CreatorViewSet(
     filterset_class = ComicVineFilter
     parser_classes = (MultiPartParser, FormParser)
     cache_model_label = ModelLabel.CREATOR
+    cursor_ordering = ("name", "id")
 
     def get_serializer_class(self):
         match self.action:
@@ -538,6 +711,7 @@ class ImprintViewSet(
     filterset_class = ComicVineFilter
     parser_classes = (MultiPartParser, FormParser)
     cache_model_label = ModelLabel.IMPRINT
+    cursor_ordering = ("name", "id")
     # Imprint retrieve embeds its Publisher's name, which doesn't cascade a
     # `modified` bump onto this Imprint when renamed.
     cache_detail_dependent_labels = (ModelLabel.PUBLISHER,)
@@ -560,6 +734,7 @@ class ImprintViewSet(
 
 class IssueViewSet(
     UserTrackingMixin,
+    NdjsonExportMixin,
     mixins.CreateModelMixin,
     ConditionalRetrieveModelMixin,
     CachedListModelMixin,
@@ -573,6 +748,12 @@ class IssueViewSet(
     retrieve:
     Returns the information of an individual issue.
 
+    export:
+    Streams every matching issue, in the retrieve format, as newline-delimited JSON.
+
+    bulk_lookup:
+    Resolves a batch of issue ids, UPCs, ISBNs, Comic Vine and GCD ids in one request.
+
     Note: cover_hash is a Perceptual hashing created with
     ImageHash. https://github.com/JohannesBuchner/imagehash
     """
@@ -581,6 +762,9 @@ class IssueViewSet(
     filterset_class = IssueFilter
     parser_classes = (JSONParser, MultiPartParser, FormParser)
     cache_model_label = ModelLabel.ISSUE
+    cache_scope_filters = {"series_id": CacheScope.SERIES, "publisher_id": CacheScope.PUBLISHER}
+    cursor_ordering = ("series__sort_name", "cover_date", "store_date", "number", "id")
+    export_serializer_class = IssueReadSerializer
     # Issue retrieve embeds its Series/Publisher/Imprint names, which don't
     # cascade a `modified` bump onto this Issue when renamed. Only
     # PUBLISHER/IMPRINT are tracked here:
@@ -598,6 +782,20 @@ class IssueViewSet(
     #   churn than the staleness they'd prevent.
     # Both cases accept staleness up to DETAIL_CACHE_TTL as the tradeoff.
     cache_detail_dependent_labels = (ModelLabel.PUBLISHER, ModelLabel.IMPRINT)
+    #: bulk_lookup is charged one throttle unit per this many identifiers.
+    bulk_lookup_identifiers_per_unit = 25
+
+    def get_throttle_cost(self, request) -> int:
+        if self.action != "bulk_lookup" or not isinstance(request.data, dict):
+            return 1
+        fields = BulkLookupRequestSerializer().fields
+        count = sum(
+            len(values)
+            for field, values in request.data.items()
+            if field in fields and isinstance(values, list)
+        )
+        count = min(count, BULK_LOOKUP_MAX_IDENTIFIERS)
+        return max(1, math.ceil(count / self.bulk_lookup_identifiers_per_unit))
 
     def get_modified_queryset(self):
         # get_queryset() annotates average_rating/rating_count for the
@@ -649,11 +847,81 @@ class IssueViewSet(
         match self.action:
             case "list":
                 return IssueListSerializer
-            case "retrieve":
+            case "retrieve" | "export":
                 return IssueReadSerializer
+            case "cover_search":
+                return CoverSearchResultSerializer
+            case "bulk_lookup":
+                return BulkLookupRequestSerializer
             case _:
                 return IssueSerializer
 
+    @extend_schema(
+        parameters=[CoverSearchRequestSerializer],
+        responses={200: CoverSearchResultSerializer(many=True)},
+        filters=False,
+    )
+    @action(detail=False)
+    def cover_search(self, request):
+        """
+        Returns issues whose cover hash is within `max_distance` bits (Hamming
+        distance, default 4, max 10) of `hash`, nearest first.
+        """
+        params = CoverSearchRequestSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        hash_value = int(params.validated_data["hash"], 16)
+        matches = get_cover_index().search(hash_value, params.validated_data["max_distance"])
+
+        page = self.paginate_queryset(matches)
+        if page is None:
+            raise Http404
+        distances = dict(page)
+        issues = Issue.objects.select_related("series", "series__series_type").in_bulk(distances)
+        results = []
+        for issue_id, distance in page:
+            # The index can briefly trail a delete made in another process.
+            if issue := issues.get(issue_id):
+                issue.distance = distance
+                results.append(issue)
+        serializer = CoverSearchResultSerializer(results, many=True, context={"request": request})
+        return self.get_paginated_response(serializer.data)
+
+    @extend_schema(
+        request=BulkLookupRequestSerializer,
+        responses={200: OpenApiTypes.OBJECT},
+        filters=False,
+    )
+    @action(detail=False, methods=["post"], permission_classes=[IsAuthenticated])
+    def bulk_lookup(self, request):
+        """
+        Looks up to 100 issues by `id`, `upc`, `isbn`, `cv_id` and/or `gcd_id`
+        in one request. Returns, per identifier type, a map from each
+        requested value to the list of matching issues (empty when nothing
+        matches). Charged as one request per 25 identifiers.
+        """
+        params = BulkLookupRequestSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+
+        queryset = Issue.objects.select_related("series", "series__series_type")
+        matches = {}
+        issues = {}
+        # One query per identifier type, each an IN over an indexed column.
+        for field, values in params.validated_data.items():
+            found = defaultdict(list)
+            for issue in queryset.filter(**{f"{field}__in": values}).order_by("pk"):
+                found[str(getattr(issue, field))].append(issue.pk)
+                issues[issue.pk] = issue
+            matches[field] = {str(value): found[str(value)] for value in values}
+
+        serializer = IssueListSerializer(issues.values(), many=True, context={"request": request})
+        payloads = {item["id"]: item for item in serializer.data}
+        return Response(
+            {
+                field: {value: [payloads[pk] for pk in pks] for value, pks in found.items()}
+                for field, found in matches.items()
+            }
+        )
+
 
 class PublisherViewSet(
     UserTrackingMixin,
@@ -681,6 +949,7 @@ class PublisherViewSet(
     filterset_class = PublisherFilter
     parser_classes = (MultiPartParser, FormParser)
     cache_model_label = ModelLabel.PUBLISHER
+    cursor_ordering = ("name", "id")
 
     def get_serializer_class(self):
         match self.action:
@@ -712,24 +981,30 @@ class PublisherViewSet(
             ModelLabel.SERIES,
             ModelLabel.ISSUE,
             request=request,
-            scope=f"publisher:{pk}:series_list",
+            scope="series_list",
+            cache_scope=(CacheScope.PUBLISHER, pk),
         )
-        cached = cache.get(key)
-        if cached is not None:
-            return _mark_cache_status(Response(cached), hit=True)
 
-        queryset = (
-            publisher.series.select_related("series_type")
-            .annotate(num_issues=Count("issues", distinct=True))
-            .order_by("sort_name", "year_began")
+        def render():
+            queryset = (
+                publisher.series.select_related("series_type")
+                .annotate(num_issues=_SERIES_ISSUE_COUNT)
+                .order_by("sort_name", "year_began")
+            )
+            page = self.paginate_queryset(queryset)
+            if page is None:
+                raise Http404
+            serializer = SeriesListSerializer(page, many=True, context={"request": request})
+            return self.get_paginated_response(serializer.data)
+
+        return _cached_response(
+            self,
+            key,
+            LIST_CACHE_TTL,
+            render,
+            bucket=f"list:{ModelLabel.SERIES}@{CacheScope.PUBLISHER}",
+            stale_key=stale_cache_key(key),
         )
-        page = self.paginate_queryset(queryset)
-        if page is None:
-            raise Http404
-        serializer = SeriesListSerializer(page, many=True, context={"request": request})
-        response = self.get_paginated_response(serializer.data)
-        cache.set(key, response.data, LIST_CACHE_TTL)
-        return _mark_cache_status(response, hit=False)
 
 
 class RoleViewset(mixins.ListModelMixin, viewsets.GenericViewSet):
@@ -745,6 +1020,7 @@ class RoleViewset(mixins.ListModelMixin, viewsets.GenericViewSet):
 
 class SeriesViewSet(
     UserTrackingMixin,
+    NdjsonExportMixin,
     IssueListMixin,
     mixins.CreateModelMixin,
     ConditionalRetrieveModelMixin,
@@ -764,36 +1040,42 @@ class SeriesViewSet(
 
     update:
     Update a Series information.
+
+    export:
+    Streams every matching series, in the retrieve format, as newline-delimited JSON.
     """
 
     queryset = Series.objects.select_related("series_type", "publisher")
     filterset_class = SeriesFilter
     cache_model_label = ModelLabel.SERIES
+    cursor_ordering = ("sort_name", "year_began", "id")
+    export_serializer_class = SeriesReadSerializer
     # Series list embeds num_issues, which changes on every Issue write.
     cache_dependent_labels = (ModelLabel.ISSUE,)
+    cache_scope_filters = {"publisher_id": CacheScope.PUBLISHER}
     # Series retrieve embeds its Publisher/Imprint name, which don't cascade
     # a `modified` bump onto this Series when renamed.
     cache_detail_dependent_labels = (ModelLabel.PUBLISHER, ModelLabel.IMPRINT)
 
     def get_modified_queryset(self):
-        # get_queryset() annotates num_issues for list/retrieve -- an
-        # aggregate that survives into (pk, modified) values_list() as an
-        # extra JOIN + GROUP BY even though the annotated field isn't
-        # selected. This lookup only needs the row's own pk/modified.
+        # get_queryset() annotates num_issues for list/retrieve -- a join
+        # against the series stats table that survives into (pk, modified)
+        # values_list() even though the annotated field isn't selected.
+        # This lookup only needs the row's own pk/modified.
         return Series.objects.all()
 
     def get_queryset(self):
         queryset = super().get_queryset()
         match self.action:
             case "list":
-                queryset = queryset.annotate(num_issues=Count("issues", distinct=True)).order_by(
+                queryset = queryset.annotate(num_issues=_SERIES_ISSUE_COUNT).order_by(
                     "sort_name", "year_began"
                 )
-            case "retrieve":
+            case "retrieve" | "export":
                 queryset = (
                     queryset.select_related("imprint")
                     .prefetch_related("genres", "associated")
-                    .annotate(num_issues=Count("issues", distinct=True))
+                    .annotate(num_issues=_SERIES_ISSUE_COUNT)
                 )
         return queryset
 
@@ -803,7 +1085,7 @@ class SeriesViewSet(
                 return SeriesListSerializer
             case "issue_list":
                 return IssueListSerializer
-            case "retrieve":
+            case "retrieve" | "export":
                 return SeriesReadSerializer
             case _:
                 return SeriesSerializer
@@ -859,6 +1141,7 @@ class TeamViewSet(
     queryset = Team.objects.all()
     filterset_class = ComicVineFilter
     cache_model_label = ModelLabel.TEAM
+    cursor_ordering = ("name", "id")
     parser_classes = (MultiPartParser, FormParser)
     # retrieve also embeds Creator/Universe names (TeamReadSerializer) that
     # don't cascade a `modified` bump onto this Team either, but those are
@@ -915,6 +1198,7 @@ class UniverseViewSet(
     filterset_class = UniverseFilter
     parser_classes = (MultiPartParser, FormParser)
     cache_model_label = ModelLabel.UNIVERSE
+    cursor_ordering = ("name", "designation", "id")
     # Universe retrieve embeds its Publisher's name, which doesn't cascade a
     # `modified` bump onto this Universe when renamed.
     cache_detail_dependent_labels = (ModelLabel.PUBLISHER,)
@@ -1058,6 +1342,14 @@ class CollectionViewSet(
 
     permission_classes = [IsAuthenticated]
     filterset_class = CollectionFilter
+    #: Bulk scrobbles are charged one throttle request per this many entries.
+    bulk_scrobble_entries_per_unit = 100
+
+    def get_throttle_cost(self, request) -> int:
+        if self.action != "bulk_scrobble" or not isinstance(request.data, list):
+            return 1
+        count = min(len(request.data), BULK_SCROBBLE_MAX_ENTRIES)
+        return max(1, math.ceil(count / self.bulk_scrobble_entries_per_unit))
 
     def get_queryset(self):
         """Only return collection items belonging to the authenticated user."""
@@ -1144,24 +1436,15 @@ class CollectionViewSet(
     @action(detail=False, methods=["get"])
     def stats(self, request):
         """Return statistics about the user's collection."""
-        queryset = CollectionItem.objects.filter(user=self.request.user)
-        stats = queryset.aggregate(
-            total_items=Count("id"),
-            total_quantity=Sum("quantity"),
-            total_value=Sum("purchase_price"),
-            read_count=Count(Case(When(is_read=True, then=1), output_field=IntegerField())),
-            unread_count=Count(Case(When(is_read=False, then=1), output_field=IntegerField())),
-        )
-        format_counts = queryset.values("book_format").annotate(count=Count("id"))
-
+        stats = CollectionStats.for_user(request.user)
         return Response(
             {
-                "total_items": stats["total_items"] or 0,
-                "total_quantity": stats["total_quantity"] or 0,
-                "total_value": str(stats["total_value"]) if stats["total_value"] else "0.00",
-                "read_count": stats["read_count"],
-                "unread_count": stats["unread_count"],
-                "by_format": format_counts,
+                "total_items": stats.total_items,
+                "total_quantity": stats.total_quantity,
+                "total_value": str(stats.total_value) if stats.total_value else "0.00",
+                "read_count": stats.read_count,
+                "unread_count": stats.unread_count,
+                "by_format": stats.format_breakdown(),
             }
         )
 
@@ -1169,29 +1452,13 @@ class CollectionViewSet(
     @action(detail=False, methods=["get"])
     def missing_series(self, request):
         """Return series where the user has some issues but is missing others."""
-        user = request.user
-
-        # Annotate all series with total and owned issue counts
-        # Then filter to only show series with missing issues
-        queryset = (
-            Series.objects.annotate(
-                total_issues=Count("issues", distinct=True),
-                owned_issues=Count(
-                    "issues", filter=models.Q(issues__in_collections__user=user), distinct=True
-                ),
-            )
-            .annotate(missing_count=F("total_issues") - F("owned_issues"))
-            .filter(owned_issues__gt=0, missing_count__gt=0)
-            .select_related("publisher", "series_type", "imprint")
-            .order_by("-missing_count", "sort_name")
-        )
+        rows = CollectionItem.missing_series_counts(request.user)
 
-        page = self.paginate_queryset(queryset)
+        page = self.paginate_queryset(rows)
+        series = CollectionItem.series_with_missing_counts(rows if page is None else page)
+        serializer = MissingSeriesSerializer(series, many=True, context={"request": request})
         if page is not None:
-            serializer = MissingSeriesSerializer(page, many=True, context={"request": request})
             return self.get_paginated_response(serializer.data)
-
-        serializer = MissingSeriesSerializer(queryset, many=True, context={"request": request})
         return Response(serializer.data)
 
     @extend_schema(
@@ -1309,6 +1576,57 @@ class CollectionViewSet(
             status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
         )
 
+    @extend_schema(
+        request=BulkScrobbleItemSerializer(many=True),
+        responses={200: BulkScrobbleResponseSerializer, 400: {"type": "object"}},
+        description=(
+            f"Mark up to {BULK_SCROBBLE_MAX_ENTRIES} issues as read in one request. "
+            "Auto-creates collection items if needed."
+        ),
+    )
+    @action(detail=False, methods=["post"], url_path="scrobble/bulk")
+    def bulk_scrobble(self, request):
+        """
+        Scrobble a list of `{issue_id, date_read, rating}` entries at once,
+        e.g. to import reading history from another service.
+
+        Each entry behaves like a single scrobble, and the same issue may be
+        listed more than once to record re-reads. The batch is all-or-nothing:
+        if any issue id doesn't exist, nothing is recorded.
+
+        Returns:
+        - 200: Every entry was recorded
+        - 400: Validation error (including unknown issue ids)
+        """
+        serializer = BulkScrobbleItemSerializer(
+            data=request.data, many=True, allow_empty=False, max_length=BULK_SCROBBLE_MAX_ENTRIES
+        )
+        serializer.is_valid(raise_exception=True)
+        entries = serializer.validated_data
+
+        issue_ids = {entry["issue_id"] for entry in entries}
+        missing = issue_ids - set(
+            Issue.objects.filter(pk__in=issue_ids).values_list("pk", flat=True)
+        )
+        if missing:
+            return Response(
+                {"detail": "Some issues were not found.", "missing_issue_ids": sorted(missing)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        items = CollectionItem.scrobble_many(request.user, entries)
+        created = sum(item.created for item in items)
+        return Response(
+            {
+                "created": created,
+                "updated": len(items) - created,
+                "read_dates": len(entries),
+                "results": ScrobbleResponseSerializer(
+                    items, many=True, context={"request": request}
+                ).data,
+            }
+        )
+
 
 class PullListViewSet(
     ConditionalRetrieveModelMixin,
@@ -1400,18 +1718,31 @@ class PullListViewSet(
         series_ids = PullListSeries.objects.filter(pull_list=pull_list).values_list(
             "series_id", flat=True
         )
-        queryset = (
-            Issue.objects.filter(series_id__in=series_ids)
-            .select_related("series__series_type", "series__publisher")
-            .order_by("store_date", "series__sort_name", "number")
-        )
         after = request.query_params.get("store_date_after")
         before = request.query_params.get("store_date_before")
-        if after:
-            queryset = queryset.filter(store_date__gte=after)
-        if before:
-            queryset = queryset.filter(store_date__lte=before)
-        page = self.paginate_queryset(queryset)
+
+        # Upcoming ranges (the common "this week" request) are answered from
+        # the shared release index; anything reaching into the past queries
+        # Issue directly.
+        after_day, before_day = _parse_day(after), _parse_day(before)
+        issue_ids = None
+        if after_day is not None and (not before or before_day is not None):
+            issue_ids = upcoming_issue_ids(list(series_ids), after_day, before_day)
+        if issue_ids is not None:
+            page = self.paginate_queryset(issue_ids)
+            if page is not None:
+                page = load_issues(page)
+        else:
+            queryset = (
+                Issue.objects.filter(series_id__in=series_ids)
+                .select_related("series__series_type", "series__publisher")
+                .order_by("store_date", "series__sort_name", "number")
+            )
+            if after:
+                queryset = queryset.filter(store_date__gte=after)
+            if before:
+                queryset = queryset.filter(store_date__lte=before)
+            page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = PullListIssueSerializer(page, many=True, context={"request": request})
             return self.get_paginated_response(serializer.data)
@@ -1,15 +1,31 @@
 from functools import partial
 
-from django.apps import AppConfig
-from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.apps import AppConfig, apps
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from simple_history.signals import post_create_historical_record
 
 from api.cache import ModelLabel
 from comicsdb.signals import (
     bump_cache,
+    bump_series_scoped_caches_on_series_change,
+    count_daily_catalog_addition,
+    count_daily_catalog_removal,
+    create_stats_row,
+    move_daily_issue_count_on_issue_save,
+    move_daily_issue_counts_on_series_save,
     pre_delete_credit,
     pre_delete_image,
+    refresh_series_stats_on_rating_delete,
+    refresh_series_stats_on_rating_save,
+    refresh_stats_on_delete,
+    refresh_stats_on_save,
+    remember_stats_parent,
+    store_history_delta,
+    update_announcement_cache,
     update_arc_modified,
     update_character_modified,
+    update_cover_index_on_issue_delete,
+    update_cover_index_on_issue_save,
     update_issue_modified_on_credit_change,
     update_issue_modified_on_credit_role_change,
     update_issue_modified_on_reprint_change,
@@ -26,6 +42,18 @@ class ComicsdbConfig(AppConfig):
     verbose_name = "Comics DB"
 
     def ready(self):
+        announcement = self.get_model("Announcement")
+        post_save.connect(
+            update_announcement_cache,
+            sender=announcement,
+            dispatch_uid="post_save_announcement_cache",
+        )
+        post_delete.connect(
+            update_announcement_cache,
+            sender=announcement,
+            dispatch_uid="post_delete_announcement_cache",
+        )
+
         arc = self.get_model("Arc")
         pre_delete.connect(pre_delete_image, sender=arc, dispatch_uid="pre_delete_arc")
 
@@ -47,6 +75,16 @@ class ComicsdbConfig(AppConfig):
             sender=issue,
             dispatch_uid="post_delete_issue_series_modified",
         )
+        post_save.connect(
+            update_cover_index_on_issue_save,
+            sender=issue,
+            dispatch_uid="post_save_issue_cover_index",
+        )
+        post_delete.connect(
+            update_cover_index_on_issue_delete,
+            sender=issue,
+            dispatch_uid="post_delete_issue_cover_index",
+        )
         m2m_changed.connect(
             update_arc_modified,
             sender=issue.arcs.through,
@@ -79,6 +117,16 @@ class ComicsdbConfig(AppConfig):
         pre_delete.connect(pre_delete_image, sender=publisher, dispatch_uid="pre_delete_publisher")
 
         series = self.get_model("Series")
+        post_save.connect(
+            bump_series_scoped_caches_on_series_change,
+            sender=series,
+            dispatch_uid="post_save_series_scoped_cache",
+        )
+        post_delete.connect(
+            bump_series_scoped_caches_on_series_change,
+            sender=series,
+            dispatch_uid="post_delete_series_scoped_cache",
+        )
 
         team = self.get_model("Team")
         pre_delete.connect(pre_delete_image, sender=team, dispatch_uid="pre_delete_team")
@@ -144,3 +192,107 @@ class ComicsdbConfig(AppConfig):
             post_delete.connect(
                 bumper, sender=model, weak=False, dispatch_uid=f"post_delete_{label}_cache"
             )
+
+        self._connect_stats_signals()
+        self._connect_history_signals()
+
+    def _connect_history_signals(self):
+        from comicsdb.models.history import history_delta_models  # noqa: PLC0415
+
+        for name, history_model in history_delta_models().items():
+            post_create_historical_record.connect(
+                store_history_delta,
+                sender=history_model,
+                dispatch_uid=f"post_create_{name}_history_delta",
+            )
+
+    def _connect_stats_signals(self):
+        series = self.get_model("Series")
+        creator = self.get_model("Creator")
+        publisher = self.get_model("Publisher")
+        issue = self.get_model("Issue")
+        credits_ = self.get_model("Credits")
+
+        # Precomputed counts/averages (comicsdb/models/stats.py): each
+        # (stats model, child model, FK to the parent) triple is refreshed
+        # whenever a child row is added, removed, or moved to another parent.
+        series_stats = self.get_model("SeriesStats")
+        creator_stats = self.get_model("CreatorStats")
+        publisher_stats = self.get_model("PublisherStats")
+        for stats_model, parent in (
+            (series_stats, series),
+            (creator_stats, creator),
+            (publisher_stats, publisher),
+        ):
+            post_save.connect(
+                partial(create_stats_row, stats_model),
+                sender=parent,
+                weak=False,
+                dispatch_uid=f"post_save_{parent._meta.model_name}_stats_row",
+            )
+        stats_children = (
+            (series_stats, issue, "series_id"),
+            (creator_stats, credits_, "creator_id"),
+            (publisher_stats, series, "publisher_id"),
+        )
+        for stats_model, child, field in stats_children:
+            uid = f"{child._meta.model_name}_{stats_model._meta.model_name}"
+            pre_save.connect(
+                partial(remember_stats_parent, field),
+                sender=child,
+                weak=False,
+                dispatch_uid=f"pre_save_{uid}",
+            )
+            post_save.connect(
+                partial(refresh_stats_on_save, stats_model, field),
+                sender=child,
+                weak=False,
+                dispatch_uid=f"post_save_{uid}",
+            )
+            post_delete.connect(
+                partial(refresh_stats_on_delete, stats_model, field),
+                sender=child,
+                weak=False,
+                dispatch_uid=f"post_delete_{uid}",
+            )
+
+        # Per-day "rows added" rollup behind the statistics page.
+        daily_stats = self.get_model("DailyCatalogStats")
+        for kind, (label, date_field) in daily_stats.SOURCES.items():
+            model = apps.get_model(label)
+            post_save.connect(
+                partial(count_daily_catalog_addition, kind, date_field),
+                sender=model,
+                weak=False,
+                dispatch_uid=f"post_save_{kind}_daily_stats",
+            )
+            post_delete.connect(
+                partial(count_daily_catalog_removal, kind, date_field),
+                sender=model,
+                weak=False,
+                dispatch_uid=f"post_delete_{kind}_daily_stats",
+            )
+
+        # Issues counted under one publisher that end up under another.
+        post_save.connect(
+            move_daily_issue_count_on_issue_save,
+            sender=issue,
+            dispatch_uid="post_save_issue_daily_stats_publisher",
+        )
+        post_save.connect(
+            move_daily_issue_counts_on_series_save,
+            sender=series,
+            dispatch_uid="post_save_series_daily_stats_publisher",
+        )
+
+        issue_rating = apps.get_model("issue_ratings", "IssueRating")
+        post_save.connect(
+            refresh_series_stats_on_rating_save,
+            sender=issue_rating,
+            dispatch_uid="post_save_issue_rating_series_stats",
+        )
+        post_delete.connect(
+            refresh_series_stats_on_rating_delete,
+            sender=issue_rating,
+            dispatch_uid="post_delete_issue_rating_series_stats",
+        )
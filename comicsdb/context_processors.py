@@ -1,5 +1,8 @@
+from django.utils.functional import SimpleLazyObject
+
 from comicsdb.models.announcement import Announcement
 
 
 def announcement_context_processor(request):
-    return {"active_announcements": Announcement.active_announcements()}
+    # Lazy, so pages that don't show the banners don't even check the cache.
+    return {"active_announcements": SimpleLazyObject(Announcement.cached_active_announcements)}
@@ -1,7 +1,8 @@
 from django.core.management.base import BaseCommand, CommandParser
 
-from comicsdb.models import Arc, Character, Creator, Issue, Publisher, Series, Team
-from users.models import CustomUser
+from comicsdb.models import DailyCatalogStats
+
+Kind = DailyCatalogStats.Kind
 
 
 class Command(BaseCommand):
@@ -14,19 +15,20 @@ class Command(BaseCommand):
     def handle(self, *args: any, **options: any) -> None:
         year = options["year"]
 
-        # Aggregate counts in a single query
-        results = {
-            CustomUser: CustomUser.objects.filter(date_joined__year=year).count(),
-            Arc: Arc.objects.filter(created_on__year=year).count(),
-            Character: Character.objects.filter(created_on__year=year).count(),
-            Creator: Creator.objects.filter(created_on__year=year).count(),
-            Issue: Issue.objects.filter(created_on__year=year).count(),
-            Publisher: Publisher.objects.filter(created_on__year=year).count(),
-            Series: Series.objects.filter(created_on__year=year).count(),
-            Team: Team.objects.filter(created_on__year=year).count(),
-        }
+        kinds = [
+            Kind.USER,
+            Kind.ARC,
+            Kind.CHARACTER,
+            Kind.CREATOR,
+            Kind.ISSUE,
+            Kind.PUBLISHER,
+            Kind.SERIES,
+            Kind.TEAM,
+        ]
+        counts = DailyCatalogStats.totals(kinds, day__year=year)
 
         title = f"{year} New Additions Statistics"
         self.stdout.write(self.style.SUCCESS(f"{title}\n{len(title) * '-'}"))
-        for model, count in results.items():
-            self.stdout.write(self.style.WARNING(f"{model.__name__}: {count:,}"))
+        for kind in kinds:
+            model = DailyCatalogStats.source_model(kind)
+            self.stdout.write(self.style.WARNING(f"{model.__name__}: {counts[kind]:,}"))
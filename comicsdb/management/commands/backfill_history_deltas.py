@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+
+from comicsdb.models.history import history_delta_models
+
+
+class Command(BaseCommand):
+    help = "Store the changes of history records written before deltas were stored"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--model",
+            choices=sorted(history_delta_models()),
+            action="append",
+            help="Only backfill the history of this model (may be repeated). Defaults to all.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of history records to update per query",
+        )
+
+    def handle(self, *args, **options) -> None:
+        history_models = history_delta_models()
+        for name in options["model"] or sorted(history_models):
+            count = self._backfill(history_models[name], options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"Stored {count} {name} history deltas"))
+
+    @staticmethod
+    def _backfill(history_model, batch_size: int) -> int:
+        # Each object's records in order, so every record's predecessor is
+        # the one just before it; records that already have a delta are only
+        # read to serve as the next one's predecessor.
+        records = history_model.objects.order_by("id", "history_date", "history_id")
+        previous = None
+        pending = []
+        count = 0
+        for record in records.iterator(chunk_size=batch_size):
+            if previous is not None and previous.id != record.id:
+                previous = None
+            if record.history_delta is None and previous is not None:
+                record.history_delta = record.compute_delta(previous)
+                pending.append(record)
+            previous = record
+            if len(pending) >= batch_size:
+                history_model.objects.bulk_update(pending, ["history_delta"])
+                count += len(pending)
+                pending = []
+        if pending:
+            history_model.objects.bulk_update(pending, ["history_delta"])
+            count += len(pending)
+        return count
@@ -2,9 +2,9 @@ from datetime import date
 
 from django.core.management.base import BaseCommand
 
-from comicsdb.models import Character, Creator, Issue
-from reading_lists.models import ReadingList
-from users.models import CustomUser
+from comicsdb.models import DailyCatalogStats
+
+Kind = DailyCatalogStats.Kind
 
 
 class Command(BaseCommand):
@@ -18,30 +18,12 @@ class Command(BaseCommand):
         month = options["month"]
         year = options["year"]
 
-        # Combine queries using annotation
-        results = [
-            {
-                "model": CustomUser,
-                "count": CustomUser.objects.filter(
-                    date_joined__month=month, date_joined__year=year
-                ).count(),
-            }
-        ]
-
-        # Efficient counting for other models
-        models = [Issue, Creator, Character, ReadingList]
-        results.extend(
-            {
-                "model": mod,
-                "count": mod.objects.filter(created_on__month=month, created_on__year=year).count(),
-            }
-            for mod in models
-        )
+        kinds = [Kind.USER, Kind.ISSUE, Kind.CREATOR, Kind.CHARACTER, Kind.READING_LIST]
+        counts = DailyCatalogStats.totals(kinds, day__year=year, day__month=month)
         title = f"Stats for {date(year, month, 1).strftime('%B %Y')}"
 
         self.stdout.write(self.style.SUCCESS(title))
         self.stdout.write(self.style.SUCCESS(f"{'-' * len(title)}"))
-        for result in results:
-            self.stdout.write(
-                self.style.WARNING(f"{result['model'].__name__}: {result['count']:,}")
-            )
+        for kind in kinds:
+            model = DailyCatalogStats.source_model(kind)
+            self.stdout.write(self.style.WARNING(f"{model.__name__}: {counts[kind]:,}"))
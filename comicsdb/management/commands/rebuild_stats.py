@@ -0,0 +1,52 @@
+from itertools import batched
+
+from django.core.management.base import BaseCommand
+
+from comicsdb.models import (
+    Creator,
+    CreatorStats,
+    DailyCatalogStats,
+    Publisher,
+    PublisherStats,
+    Series,
+    SeriesStats,
+)
+
+STATS_MODELS = {
+    "series": (Series, SeriesStats),
+    "creator": (Creator, CreatorStats),
+    "publisher": (Publisher, PublisherStats),
+}
+DAILY = "daily"
+
+
+class Command(BaseCommand):
+    help = "Recompute the precomputed series, creator, publisher, and daily catalog stats"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--model",
+            choices=sorted([*STATS_MODELS, DAILY]),
+            action="append",
+            help="Only rebuild the stats for this model (may be repeated). Defaults to all.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows to recompute per query",
+        )
+
+    def handle(self, *args, **options) -> None:
+        for name in options["model"] or [*STATS_MODELS, DAILY]:
+            if name == DAILY:
+                count = DailyCatalogStats.rebuild()
+                self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} daily catalog stats rows"))
+                continue
+            parent_model, stats_model = STATS_MODELS[name]
+            ids = parent_model.objects.order_by("pk").values_list("pk", flat=True)
+            count = 0
+            for batch in batched(ids.iterator(), options["batch_size"], strict=False):
+                stats_model.refresh(batch)
+                count += len(batch)
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {name} stats for {count} rows"))
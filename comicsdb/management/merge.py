@@ -3,9 +3,12 @@ from django.db.models import ManyToManyField, ManyToManyRel, ManyToOneRel
 
 def update_related(canonical, obj):
     """update all the models with fk to the object being removed"""
-    # move related models to canonical
+    # move related models to canonical. One-to-one rows (the precomputed
+    # stats) belong to each object and are recomputed as the rows above move.
     related_models = [
-        (r.remote_field.name, r.related_model) for r in canonical._meta.related_objects
+        (r.remote_field.name, r.related_model)
+        for r in canonical._meta.related_objects
+        if not r.one_to_one
     ]
     for related_field, related_model in related_models:
         # Skip the ManyToMany fields that aren`t auto-created. These
@@ -0,0 +1,96 @@
+# Generated by Django 6.0.7 on 2026-10-17 07:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL_SQL = """
+INSERT INTO comicsdb_seriesstats (series_id, issue_count, rating_count, average_rating)
+SELECT s.id,
+       (SELECT COUNT(*) FROM comicsdb_issue i WHERE i.series_id = s.id),
+       (SELECT COUNT(*) FROM issue_ratings_issuerating r
+          JOIN comicsdb_issue i ON i.id = r.issue_id WHERE i.series_id = s.id),
+       (SELECT ROUND(AVG(r.rating), 2) FROM issue_ratings_issuerating r
+          JOIN comicsdb_issue i ON i.id = r.issue_id WHERE i.series_id = s.id)
+FROM comicsdb_series s;
+
+INSERT INTO comicsdb_creatorstats (creator_id, credit_count)
+SELECT c.id, (SELECT COUNT(*) FROM comicsdb_credits cr WHERE cr.creator_id = c.id)
+FROM comicsdb_creator c;
+
+INSERT INTO comicsdb_publisherstats (publisher_id, series_count)
+SELECT p.id, (SELECT COUNT(*) FROM comicsdb_series s WHERE s.publisher_id = p.id)
+FROM comicsdb_publisher p;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0056_historicalpublisher_alt_names_and_more"),
+        ("issue_ratings", "0002_alter_issuerating_rating"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CreatorStats",
+            fields=[
+                (
+                    "creator",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="comicsdb.creator",
+                    ),
+                ),
+                ("credit_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "Creator stats",
+            },
+        ),
+        migrations.CreateModel(
+            name="PublisherStats",
+            fields=[
+                (
+                    "publisher",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="comicsdb.publisher",
+                    ),
+                ),
+                ("series_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "Publisher stats",
+            },
+        ),
+        migrations.CreateModel(
+            name="SeriesStats",
+            fields=[
+                (
+                    "series",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="comicsdb.series",
+                    ),
+                ),
+                ("issue_count", models.PositiveIntegerField(default=0)),
+                ("rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "average_rating",
+                    models.DecimalField(blank=True, decimal_places=2, max_digits=3, null=True),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Series stats",
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,106 @@
+# Generated by Django 6.0.7 on 2026-10-17 08:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+SOURCES = {
+    "arc": ("comicsdb", "Arc", "created_on"),
+    "character": ("comicsdb", "Character", "created_on"),
+    "creator": ("comicsdb", "Creator", "created_on"),
+    "issue": ("comicsdb", "Issue", "created_on"),
+    "publisher": ("comicsdb", "Publisher", "created_on"),
+    "reading_list": ("reading_lists", "ReadingList", "created_on"),
+    "series": ("comicsdb", "Series", "created_on"),
+    "team": ("comicsdb", "Team", "created_on"),
+    "user": ("users", "CustomUser", "date_joined"),
+}
+
+
+def backfill_daily_stats(apps, schema_editor):
+    """Same as DailyCatalogStats.rebuild(), against the historical models."""
+    DailyCatalogStats = apps.get_model("comicsdb", "DailyCatalogStats")
+    rows = []
+    for kind, (app_label, model_name, date_field) in SOURCES.items():
+        fields = ["day", "series__publisher"] if kind == "issue" else ["day"]
+        queryset = (
+            apps.get_model(app_label, model_name)
+            .objects.annotate(day=TruncDate(date_field))
+            .values(*fields)
+            .annotate(count=Count("pk"))
+            .order_by()
+        )
+        rows.extend(
+            DailyCatalogStats(
+                day=row["day"],
+                kind=kind,
+                publisher_id=row.get("series__publisher"),
+                count=row["count"],
+            )
+            for row in queryset
+        )
+    DailyCatalogStats.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0057_series_stats"),
+        ("reading_lists", "0012_merge_20260721_0836"),
+        ("users", "0009_signupsettings"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyCatalogStats",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("day", models.DateField()),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("arc", "Arc"),
+                            ("character", "Character"),
+                            ("creator", "Creator"),
+                            ("issue", "Issue"),
+                            ("publisher", "Publisher"),
+                            ("reading_list", "Reading List"),
+                            ("series", "Series"),
+                            ("team", "Team"),
+                            ("user", "User"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "publisher",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="comicsdb.publisher",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Daily catalog stats",
+                "indexes": [models.Index(fields=["kind", "day"], name="daily_stats_kind_day_idx")],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "kind", "publisher"),
+                        name="unique_daily_catalog_stats",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.7 on 2026-10-17 09:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0058_daily_catalog_stats"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(fields=["upc"], name="issue_upc_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(fields=["isbn"], name="issue_isbn_idx"),
+        ),
+    ]
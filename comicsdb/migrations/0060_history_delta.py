@@ -0,0 +1,62 @@
+# Generated by Django 6.0.7 on 2026-10-17 10:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("comicsdb", "0059_issue_upc_isbn_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicalarc",
+            name="history_delta",
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="historicalcharacter",
+            name="history_delta",
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="historicalcreator",
+            name="history_delta",
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="historicalgenre",
+            name="history_delta",
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="historicalimprint",
+            name="history_delta",
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="historicalissue",
+            name="history_delta",
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="historicalpublisher",
+            name="history_delta",
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="historicalseries",
+            name="history_delta",
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="historicalteam",
+            name="history_delta",
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="historicaluniverse",
+            name="history_delta",
+            field=models.JSONField(editable=False, null=True),
+        ),
+    ]
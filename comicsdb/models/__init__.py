@@ -13,6 +13,7 @@ from comicsdb.models.team import Team
 from comicsdb.models.universe import Universe
 from comicsdb.models.variant import Variant
 from comicsdb.models.imprint import Imprint  # This need to be *after* Publisher model.
+from comicsdb.models.stats import CreatorStats, DailyCatalogStats, PublisherStats, SeriesStats
 
 __all__ = [
     "Announcement",
@@ -20,14 +21,18 @@ __all__ = [
     "Attribution",
     "Character",
     "Creator",
+    "CreatorStats",
     "Credits",
+    "DailyCatalogStats",
     "Genre",
     "Imprint",
     "Issue",
     "Publisher",
+    "PublisherStats",
     "Rating",
     "Role",
     "Series",
+    "SeriesStats",
     "SeriesType",
     "Team",
     "Universe",
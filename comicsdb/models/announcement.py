@@ -1,8 +1,19 @@
+import threading
+import time
+
 from django.db import models
 from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from api.cache import bump_model_version, get_model_version
+
+ANNOUNCEMENT_VERSION_LABEL = "announcement"
+#: How long a process trusts its copy of the active announcements before
+#: checking the Redis version counter again, i.e. how long an admin's change
+#: can take to show everywhere.
+ANNOUNCEMENT_RECHECK_SECONDS = 5
+
 DisplayTypes = [
     ("primary", _("Primary")),
     ("success", _("Success")),
@@ -31,3 +42,50 @@ class Announcement(models.Model):  # noqa: DJ008
             Q(end_date__isnull=True) | Q(end_date__gte=now),
             active=True,
         )
+
+    @classmethod
+    def cached_active_announcements(cls) -> list:
+        """active_announcements(), from this process's copy when it's still
+        current. The copy is checked against a Redis version counter, bumped
+        whenever an announcement is saved or deleted (see record_change()), at
+        most every ANNOUNCEMENT_RECHECK_SECONDS, and rebuilt when the counter
+        or the day changes."""
+        global _cached, _cached_version, _cached_day, _checked_at  # noqa: PLW0603
+
+        now = time.monotonic()
+        today = timezone.localdate()
+        with _lock:
+            if _cached is not None and _cached_day == today:
+                if now - _checked_at < ANNOUNCEMENT_RECHECK_SECONDS:
+                    return _cached
+                version = get_model_version(ANNOUNCEMENT_VERSION_LABEL)
+                if version == _cached_version:
+                    _checked_at = now
+                    return _cached
+            else:
+                version = get_model_version(ANNOUNCEMENT_VERSION_LABEL)
+            _cached = list(cls.active_announcements())
+            _cached_version, _cached_day, _checked_at = version, today, now
+            return _cached
+
+    @staticmethod
+    def record_change() -> None:
+        """Make every process reload its active announcements within
+        ANNOUNCEMENT_RECHECK_SECONDS."""
+        bump_model_version(ANNOUNCEMENT_VERSION_LABEL)
+        reset_announcement_cache()
+
+
+_lock = threading.Lock()
+_cached: list | None = None
+_cached_version: int | None = None
+_cached_day = None
+_checked_at = 0.0
+
+
+def reset_announcement_cache() -> None:
+    """Drop this process's copy of the active announcements."""
+    global _cached  # noqa: PLW0603
+
+    with _lock:
+        _cached = None
@@ -1,12 +1,14 @@
 from django.db import models
 from simple_history.models import HistoricalRecords
 
+from comicsdb.models.history import HistoryDeltaModel
+
 
 class Genre(models.Model):
     name = models.CharField(max_length=25)
     desc = models.TextField("Description", blank=True)
     modified = models.DateTimeField(auto_now=True)
-    history = HistoricalRecords()
+    history = HistoricalRecords(bases=[HistoryDeltaModel])
 
     class Meta:
         ordering = ["name"]
@@ -0,0 +1,120 @@
+import datetime as dt
+from decimal import Decimal
+
+from django.apps import apps
+from django.db import models
+from django.db.models import Q
+from djmoney.money import Money
+from simple_history.models import ModelChange, ModelDelta
+from simple_history.utils import get_history_manager_from_history
+
+#: Key marking a stored value that has to be turned back into a Python object.
+_TYPE_KEY = "__type__"
+
+#: (marker, type, to JSON, from JSON) for the values stored with a type marker.
+#: datetime is a subclass of date, so it has to come first.
+_TYPED_VALUES = (
+    ("datetime", dt.datetime, dt.datetime.isoformat, dt.datetime.fromisoformat),
+    ("date", dt.date, dt.date.isoformat, dt.date.fromisoformat),
+    ("time", dt.time, dt.time.isoformat, dt.time.fromisoformat),
+    ("decimal", Decimal, str, Decimal),
+    (
+        "money",
+        Money,
+        lambda money: [str(money.amount), str(money.currency)],
+        lambda value: Money(*value),
+    ),
+)
+
+
+def _json_value(value):
+    """Values as diff_against() returns them, made storable in a JSONField.
+    FK changes are raw pks and M2M changes lists of dicts of pks already;
+    dates, decimals and money are stored in plain form with a type marker so
+    `_python_value()` can restore them, anything else (files etc.) as its
+    string form."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, list):
+        return [_json_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _json_value(item) for key, item in value.items()}
+    for marker, value_type, to_json, _from_json in _TYPED_VALUES:
+        if isinstance(value, value_type):
+            return {_TYPE_KEY: marker, "value": to_json(value)}
+    return str(value)
+
+
+def _python_value(value):
+    """Reverse `_json_value()`, so the history pages format dates, decimals and
+    money the way they would the values diff_against() returned."""
+    if isinstance(value, list):
+        return [_python_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    for marker, _value_type, _to_json, from_json in _TYPED_VALUES:
+        if value.get(_TYPE_KEY) == marker:
+            return from_json(value["value"])
+    return {key: _python_value(item) for key, item in value.items()}
+
+
+class HistoryDeltaModel(models.Model):
+    """Base for the historical models (`HistoricalRecords(bases=[...])`) that
+    stores each record's changes against the record before it.
+
+    The history pages used to compute `diff_against()` for every row shown,
+    one query (plus one per M2M field) each. It is now computed once, when
+    the record is written (see store_history_delta in comicsdb/signals.py),
+    and rows written before that are filled in by `backfill_history_deltas`.
+    """
+
+    #: `[[field, old, new], ...]`, or null for an object's first record.
+    history_delta = models.JSONField(null=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def get_previous_record(self):
+        """The record this one follows, in the history pages' order."""
+        return (
+            get_history_manager_from_history(self)
+            .filter(
+                Q(history_date__lt=self.history_date)
+                | Q(history_date=self.history_date, history_id__lt=self.history_id)
+            )
+            .order_by("-history_date", "-history_id")
+            .first()
+        )
+
+    def compute_delta(self, previous) -> list | None:
+        if previous is None:
+            return None
+        return [
+            [change.field, _json_value(change.old), _json_value(change.new)]
+            for change in self.diff_against(previous).changes
+        ]
+
+    @property
+    def stored_delta(self) -> ModelDelta | None:
+        """`history_delta` as the ModelDelta diff_against() would have returned."""
+        if self.history_delta is None:
+            return None
+        changes = [
+            ModelChange(field, _python_value(old), _python_value(new))
+            for field, old, new in self.history_delta
+        ]
+        return ModelDelta(changes, [change.field for change in changes], None, self)
+
+
+def history_delta_models() -> dict:
+    """Tracked comicsdb model name -> its historical model, for every model
+    whose history stores deltas."""
+    found = {}
+    for model in apps.get_app_config("comicsdb").get_models():
+        manager_name = getattr(model._meta, "simple_history_manager_attribute", None)
+        if manager_name is None:
+            continue
+        history_model = getattr(model, manager_name).model
+        if issubclass(history_model, HistoryDeltaModel):
+            found[model._meta.model_name] = history_model
+    return found
@@ -23,6 +23,7 @@ from comicsdb.models.attribution import Attribution
 from comicsdb.models.character import Character
 from comicsdb.models.common import CommonInfo
 from comicsdb.models.creator import Creator
+from comicsdb.models.history import HistoryDeltaModel
 from comicsdb.models.rating import Rating
 from comicsdb.models.series import Series
 from comicsdb.models.team import Team
@@ -82,7 +83,9 @@ class Issue(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="issues_edited"
     )
-    history = HistoricalRecords(m2m_fields=[arcs, characters, teams, universes, reprints])
+    history = HistoricalRecords(
+        m2m_fields=[arcs, characters, teams, universes, reprints], bases=[HistoryDeltaModel]
+    )
 
     objects = models.Manager()
     graphic_novels = GraphicNovelManager()
@@ -142,6 +145,8 @@ class Issue(CommonInfo):
             models.Index(fields=["foc_date"], name="issue_foc_date_idx"),
             models.Index(fields=["cv_id"], name="issue_cv_id_idx"),
             models.Index(fields=["gcd_id"], name="issue_gcd_id_idx"),
+            models.Index(fields=["upc"], name="issue_upc_idx"),
+            models.Index(fields=["isbn"], name="issue_isbn_idx"),
         ]
         ordering = ["series__sort_name", "cover_date", "store_date", "number"]
         unique_together = ["series", "number"]
@@ -167,6 +172,22 @@ def generate_issue_slug(instance: Issue):
     return base_slug  # pragma: no cover
 
 
+#: Columns of an issue's saved row that pre_save/post_save handlers compare against.
+SAVED_ROW_FIELDS = ("image", "series_id", "store_date", "number")
+
+
+def pre_save_remember_saved_row(sender, instance: Issue, *args, **kwargs) -> None:
+    """Fetch the saved row once per save, for the handlers that need to know
+    what changed: the cover hash below, the stats tables (remember_stats_parent
+    in comicsdb/signals.py) and the pull-list release index
+    (pull_list/signals.py). None for a new issue."""
+    instance._saved_row = (
+        None
+        if instance.pk is None
+        else Issue.objects.filter(pk=instance.pk).values(*SAVED_ROW_FIELDS).first()
+    )
+
+
 def pre_save_issue_slug(sender, instance: Issue, *args, **kwargs) -> None:
     if not instance.slug:
         instance.slug = generate_issue_slug(instance)
@@ -184,13 +205,9 @@ def generate_cover_hash(instance: Issue) -> str:
 def pre_save_cover_hash(sender, instance: Issue, *args, **kwargs) -> None:
     if instance.image:
         # Skip S3 download if the image field hasn't changed
-        if instance.pk:
-            try:
-                old_image = Issue.objects.filter(pk=instance.pk).values_list("image", flat=True)[0]
-                if old_image == instance.image.name and instance.cover_hash:
-                    return
-            except IndexError:
-                pass
+        saved_row = getattr(instance, "_saved_row", None)
+        if saved_row and saved_row["image"] == instance.image.name and instance.cover_hash:
+            return
         ch = generate_cover_hash(instance)
         if instance.cover_hash != ch:
             LOGGER.info(
@@ -200,13 +217,18 @@ def pre_save_cover_hash(sender, instance: Issue, *args, **kwargs) -> None:
                 instance,
             )
             instance.cover_hash = ch
+            # Read by update_cover_index_on_issue_save (comicsdb/signals.py).
+            instance._cover_hash_changed = True
         return
 
     if instance.cover_hash:
         LOGGER.info("Updating cover hash from '%s' to '' for %s", instance.cover_hash, instance)
         instance.cover_hash = ""
+        instance._cover_hash_changed = True
         return
 
 
+# Connected first, so every other Issue pre_save handler can use it.
+pre_save.connect(pre_save_remember_saved_row, sender=Issue)
 pre_save.connect(pre_save_issue_slug, sender=Issue)
 pre_save.connect(pre_save_cover_hash, sender=Issue)
@@ -18,6 +18,7 @@ from comicsdb.db_functions import ArrayToString
 from comicsdb.models.attribution import Attribution
 from comicsdb.models.common import CommonInfo
 from comicsdb.models.genre import Genre
+from comicsdb.models.history import HistoryDeltaModel
 from comicsdb.models.imprint import Imprint
 from comicsdb.models.publisher import Publisher
 from users.models import CustomUser
@@ -85,7 +86,7 @@ class Series(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="series_edited"
     )
-    history = HistoricalRecords(m2m_fields=[genres, associated])
+    history = HistoricalRecords(m2m_fields=[genres, associated], bases=[HistoryDeltaModel])
 
     def get_absolute_url(self):
         return reverse("series:detail", args=[self.slug])
@@ -0,0 +1,283 @@
+"""Denormalized aggregates for the catalog list and detail pages.
+
+Issue counts, rating averages and series counts used to be correlated
+COUNT/AVG subqueries evaluated for every row of every list page. These side
+tables hold the same numbers precomputed instead: the signal handlers in
+comicsdb/signals.py refresh the affected rows whenever an Issue, Credits,
+IssueRating or Series row is added, moved or removed, and the `rebuild_stats`
+management command recomputes everything for backfill and drift repair.
+
+DailyCatalogStats does the same for the statistics page: how many rows of
+each kind were added per day (issues additionally split by publisher), so
+the charts and the monthly/annual reports sum a few hundred rollup rows
+instead of grouping the whole Issue, Creator and Character tables.
+"""
+
+from decimal import Decimal
+
+from django.apps import apps
+from django.db import IntegrityError, models, transaction
+from django.db.models import Avg, Count, DecimalField, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from comicsdb.models.creator import Creator
+from comicsdb.models.credits import Credits
+from comicsdb.models.issue import Issue
+from comicsdb.models.publisher import Publisher
+from comicsdb.models.series import Series
+
+
+def _clean_ids(ids) -> set[int]:
+    return {pk for pk in ids if pk is not None}
+
+
+def _save_rows(model, rows, fields: list[str], *, create: bool) -> None:
+    """Upsert `rows`, or with `create=False` only update the ones that already
+    exist. Delete paths use the latter: the parent may itself be in the middle
+    of a cascading delete, and must not get a fresh stats row re-inserted."""
+    if create:
+        model.objects.bulk_create(
+            rows, update_conflicts=True, unique_fields=["pk"], update_fields=fields
+        )
+    else:
+        model.objects.bulk_update(rows, fields)
+
+
+class SeriesStats(models.Model):
+    series = models.OneToOneField(
+        Series,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+    issue_count = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    average_rating = models.DecimalField(max_digits=3, decimal_places=2, null=True, blank=True)
+
+    class Meta:
+        verbose_name_plural = "Series stats"
+
+    def __str__(self) -> str:
+        return f"Stats for series {self.series_id}"
+
+    @classmethod
+    def refresh(cls, series_ids, *, create: bool = True) -> None:
+        """Recompute the issue count and rating aggregates for `series_ids`."""
+        from issue_ratings.models import IssueRating  # noqa: PLC0415
+
+        ids = _clean_ids(series_ids)
+        if not ids:
+            return
+        issue_counts = dict(
+            Issue.objects.filter(series_id__in=ids)
+            .values("series")
+            .annotate(count=Count("pk"))
+            .values_list("series", "count")
+        )
+        ratings = {
+            row["issue__series"]: row
+            for row in IssueRating.objects.filter(issue__series_id__in=ids)
+            .values("issue__series")
+            .annotate(
+                count=Count("pk"),
+                avg=Avg("rating", output_field=DecimalField(max_digits=3, decimal_places=2)),
+            )
+        }
+        rows = []
+        for pk in ids:
+            rating = ratings.get(pk, {})
+            average = rating.get("avg")
+            rows.append(
+                cls(
+                    series_id=pk,
+                    issue_count=issue_counts.get(pk, 0),
+                    rating_count=rating.get("count", 0),
+                    average_rating=(
+                        None if average is None else Decimal(average).quantize(Decimal("0.01"))
+                    ),
+                )
+            )
+        _save_rows(cls, rows, ["issue_count", "rating_count", "average_rating"], create=create)
+
+
+class CreatorStats(models.Model):
+    creator = models.OneToOneField(
+        Creator,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+    credit_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "Creator stats"
+
+    def __str__(self) -> str:
+        return f"Stats for creator {self.creator_id}"
+
+    @classmethod
+    def refresh(cls, creator_ids, *, create: bool = True) -> None:
+        """Recompute the credit count for `creator_ids`."""
+        ids = _clean_ids(creator_ids)
+        if not ids:
+            return
+        counts = dict(
+            Credits.objects.filter(creator_id__in=ids)
+            .values("creator")
+            .annotate(count=Count("pk"))
+            .values_list("creator", "count")
+        )
+        _save_rows(
+            cls,
+            [cls(creator_id=pk, credit_count=counts.get(pk, 0)) for pk in ids],
+            ["credit_count"],
+            create=create,
+        )
+
+
+class PublisherStats(models.Model):
+    publisher = models.OneToOneField(
+        Publisher,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+    series_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "Publisher stats"
+
+    def __str__(self) -> str:
+        return f"Stats for publisher {self.publisher_id}"
+
+    @classmethod
+    def refresh(cls, publisher_ids, *, create: bool = True) -> None:
+        """Recompute the series count for `publisher_ids`."""
+        ids = _clean_ids(publisher_ids)
+        if not ids:
+            return
+        counts = dict(
+            Series.objects.filter(publisher_id__in=ids)
+            .values("publisher")
+            .annotate(count=Count("pk"))
+            .values_list("publisher", "count")
+        )
+        _save_rows(
+            cls,
+            [cls(publisher_id=pk, series_count=counts.get(pk, 0)) for pk in ids],
+            ["series_count"],
+            create=create,
+        )
+
+
+class DailyCatalogStats(models.Model):
+    class Kind(models.TextChoices):
+        ARC = "arc", "Arc"
+        CHARACTER = "character", "Character"
+        CREATOR = "creator", "Creator"
+        ISSUE = "issue", "Issue"
+        PUBLISHER = "publisher", "Publisher"
+        READING_LIST = "reading_list", "Reading List"
+        SERIES = "series", "Series"
+        TEAM = "team", "Team"
+        USER = "user", "User"
+
+    #: The model and creation timestamp each kind counts.
+    SOURCES = {
+        Kind.ARC: ("comicsdb.Arc", "created_on"),
+        Kind.CHARACTER: ("comicsdb.Character", "created_on"),
+        Kind.CREATOR: ("comicsdb.Creator", "created_on"),
+        Kind.ISSUE: ("comicsdb.Issue", "created_on"),
+        Kind.PUBLISHER: ("comicsdb.Publisher", "created_on"),
+        Kind.READING_LIST: ("reading_lists.ReadingList", "created_on"),
+        Kind.SERIES: ("comicsdb.Series", "created_on"),
+        Kind.TEAM: ("comicsdb.Team", "created_on"),
+        Kind.USER: ("users.CustomUser", "date_joined"),
+    }
+
+    day = models.DateField()
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    # Only set for issues, for the issues-by-publisher chart.
+    publisher = models.ForeignKey(
+        Publisher, null=True, blank=True, on_delete=models.CASCADE, related_name="+"
+    )
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "kind", "publisher"],
+                nulls_distinct=False,
+                name="unique_daily_catalog_stats",
+            )
+        ]
+        indexes = [models.Index(fields=["kind", "day"], name="daily_stats_kind_day_idx")]
+        verbose_name_plural = "Daily catalog stats"
+
+    def __str__(self) -> str:
+        return f"{self.kind} on {self.day}: {self.count}"
+
+    @classmethod
+    def source_model(cls, kind: str) -> type[models.Model]:
+        return apps.get_model(cls.SOURCES[kind][0])
+
+    @classmethod
+    def totals(cls, kinds, **day_filters) -> dict[str, int]:
+        """Sum the counts per kind, e.g. `totals(kinds, day__year=2024)`."""
+        totals = dict(
+            cls.objects.filter(kind__in=kinds, **day_filters)
+            .values("kind")
+            .annotate(total=Sum("count"))
+            .values_list("kind", "total")
+        )
+        return {kind: totals.get(kind, 0) for kind in kinds}
+
+    @classmethod
+    def record(cls, kind: str, created, delta: int, publisher_id: int | None = None) -> None:
+        """Add `delta` to the count for the day `created` falls on."""
+        cls._add(timezone.localdate(created), kind, delta, publisher_id)
+
+    @classmethod
+    def move(cls, kind: str, day, count: int, from_publisher_id, to_publisher_id) -> None:
+        """Move `count` of the rows counted on `day` from one publisher to
+        another, when issues change publisher through their series."""
+        cls._add(day, kind, -count, from_publisher_id)
+        cls._add(day, kind, count, to_publisher_id)
+
+    @classmethod
+    def _add(cls, day, kind: str, delta: int, publisher_id: int | None) -> None:
+        lookup = {"day": day, "kind": kind, "publisher_id": publisher_id}
+        if cls.objects.filter(**lookup).update(count=F("count") + delta) or delta < 0:
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(**lookup, count=delta)
+        except IntegrityError:
+            # Another request created the row first.
+            cls.objects.filter(**lookup).update(count=F("count") + delta)
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """Recompute every rollup row from the source tables. Returns the
+        number of rows written."""
+        rows = []
+        for kind, (label, date_field) in cls.SOURCES.items():
+            fields = ["day", "series__publisher"] if kind == cls.Kind.ISSUE else ["day"]
+            rows.extend(
+                cls(
+                    day=row["day"],
+                    kind=kind,
+                    publisher_id=row.get("series__publisher"),
+                    count=row["count"],
+                )
+                for row in apps.get_model(label)
+                ._default_manager.annotate(day=TruncDate(date_field))
+                .values(*fields)
+                .annotate(count=Count("pk"))
+                .order_by()
+            )
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
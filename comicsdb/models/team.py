@@ -15,6 +15,7 @@ from sorl.thumbnail import ImageField
 from comicsdb.models.attribution import Attribution
 from comicsdb.models.common import CommonInfo, pre_save_slug
 from comicsdb.models.creator import Creator
+from comicsdb.models.history import HistoryDeltaModel
 from comicsdb.models.universe import Universe
 from users.models import CustomUser
 
@@ -32,7 +33,7 @@ class Team(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="teams_edited"
     )
-    history = HistoricalRecords(m2m_fields=[creators, universes])
+    history = HistoricalRecords(m2m_fields=[creators, universes], bases=[HistoryDeltaModel])
 
     def save(self, *args, **kwargs) -> None:
         # Let's delete the original image if we're replacing it by uploading a new one.
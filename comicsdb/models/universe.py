@@ -14,6 +14,7 @@ from sorl.thumbnail import ImageField
 
 from comicsdb.models.attribution import Attribution
 from comicsdb.models.common import CommonInfo, pre_save_slug
+from comicsdb.models.history import HistoryDeltaModel
 from comicsdb.models.publisher import Publisher
 from users.models import CustomUser
 
@@ -31,7 +32,7 @@ class Universe(CommonInfo):
     edited_by = models.ForeignKey(
         CustomUser, default=1, on_delete=models.SET_DEFAULT, related_name="universes_edited"
     )
-    history = HistoricalRecords()
+    history = HistoricalRecords(bases=[HistoryDeltaModel])
 
     def save(self, *args, **kwargs) -> None:
         # Let's delete the original image if we're replacing it by uploading a new one.
@@ -1,9 +1,14 @@
 import logging
+from functools import partial
 
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from sorl.thumbnail import delete
 
-from api.cache import ModelLabel, bump_model_version
+from api.cache import CacheScope, ModelLabel, bump_model_version, bump_scoped_versions
+from api.cover_index import record_cover_hash_change
 
 LOGGER = logging.getLogger(__name__)
 
@@ -17,12 +22,34 @@ def pre_delete_credit(sender, instance, **kwargs):
     LOGGER.info("Deleting %s credit for %s", instance.creator, instance.issue)
 
 
+def bump_series_scoped_caches(series_ids, labels, publisher_ids=()):
+    """Bump the series- and publisher-scoped list generations (see
+    `scoped_label()` in api/cache.py) of `labels` for `series_ids` and the
+    publishers they belong to, plus any extra `publisher_ids` (e.g. the one
+    a series was just moved away from). The global counters are bumped
+    separately by the callers."""
+    from comicsdb.models import Series  # noqa: PLC0415
+
+    series_ids = {pk for pk in series_ids if pk is not None}
+    publisher_ids = {
+        *publisher_ids,
+        *Series.objects.filter(pk__in=series_ids).values_list("publisher_id", flat=True),
+    }
+    for label in labels:
+        bump_scoped_versions(label, CacheScope.SERIES, series_ids)
+        bump_scoped_versions(label, CacheScope.PUBLISHER, publisher_ids)
+
+
 def update_series_modified_on_issue_save(sender, instance, **kwargs):
     from comicsdb.models import Series  # noqa: PLC0415
 
     Series.objects.filter(pk=instance.series_id).update(modified=timezone.now())
     bump_model_version(ModelLabel.ISSUE)
     bump_model_version(ModelLabel.SERIES)
+    bump_series_scoped_caches(
+        {instance.series_id, getattr(instance, "_stats_previous_parent", None)},
+        (ModelLabel.ISSUE, ModelLabel.SERIES),
+    )
 
 
 def update_series_modified_on_issue_delete(sender, instance, **kwargs):
@@ -31,6 +58,34 @@ def update_series_modified_on_issue_delete(sender, instance, **kwargs):
     Series.objects.filter(pk=instance.series_id).update(modified=timezone.now())
     bump_model_version(ModelLabel.ISSUE)
     bump_model_version(ModelLabel.SERIES)
+    bump_series_scoped_caches({instance.series_id}, (ModelLabel.ISSUE, ModelLabel.SERIES))
+
+
+def bump_series_scoped_caches_on_series_change(sender, instance, **kwargs):
+    """Series post_save/post_delete: issue lists scoped to the series embed
+    its name, and publisher-scoped series/issue lists include it -- under
+    both its current publisher and, after a move, the previous one."""
+    bump_series_scoped_caches(
+        {instance.pk},
+        (ModelLabel.ISSUE, ModelLabel.SERIES),
+        publisher_ids=(instance.publisher_id, getattr(instance, "_stats_previous_parent", None)),
+    )
+
+
+def update_cover_index_on_issue_save(sender, instance, **kwargs):
+    """Keep the cover_search index (api/cover_index.py) current. Only fires
+    for saves where pre_save_cover_hash actually changed the hash, so
+    ordinary issue edits don't force every worker to rebuild its index.
+    After commit, so no process can rebuild from the uncommitted rows under
+    the new version, and a rollback leaves the index alone."""
+    if getattr(instance, "_cover_hash_changed", False):
+        instance._cover_hash_changed = False
+        transaction.on_commit(partial(record_cover_hash_change, instance.pk, instance.cover_hash))
+
+
+def update_cover_index_on_issue_delete(sender, instance, **kwargs):
+    if instance.cover_hash:
+        transaction.on_commit(partial(record_cover_hash_change, instance.pk, ""))
 
 
 def update_related_modified(parent_model, instance, action, pk_set):
@@ -137,6 +192,10 @@ def update_issue_modified_on_credit_change(sender, instance, **kwargs):
 
     Issue.objects.filter(pk=instance.issue_id).update(modified=timezone.now())
     bump_model_version(ModelLabel.ISSUE)
+    bump_series_scoped_caches(
+        Issue.objects.filter(pk=instance.issue_id).values_list("series_id", flat=True),
+        (ModelLabel.ISSUE,),
+    )
 
 
 def update_issue_modified_on_credit_role_change(sender, instance, action, pk_set, **kwargs):
@@ -155,6 +214,10 @@ def update_issue_modified_on_credit_role_change(sender, instance, action, pk_set
 
     Issue.objects.filter(pk=instance.issue_id).update(modified=timezone.now())
     bump_model_version(ModelLabel.ISSUE)
+    bump_series_scoped_caches(
+        Issue.objects.filter(pk=instance.issue_id).values_list("series_id", flat=True),
+        (ModelLabel.ISSUE,),
+    )
 
 
 def bump_cache(label, sender, instance, **kwargs):
@@ -164,3 +227,139 @@ def bump_cache(label, sender, instance, **kwargs):
     functools.partial(bump_cache, label) in comicsdb/apps.py so one
     function covers all eight instead of eight near-identical wrappers."""
     bump_model_version(label)
+
+
+def remember_stats_parent(field, sender, instance, **kwargs):
+    """pre_save: note which parent row (`field`, e.g. "series_id") an existing
+    row currently points at, so refresh_stats_on_save() can also fix up the
+    parent it is being moved away from."""
+    if instance._state.adding:
+        instance._stats_previous_parent = None
+        return
+    if hasattr(instance, "_saved_row"):
+        # Issue: already fetched by pre_save_remember_saved_row.
+        saved_row = instance._saved_row
+        instance._stats_previous_parent = saved_row[field] if saved_row else None
+        return
+    instance._stats_previous_parent = (
+        sender._default_manager.filter(pk=instance.pk).values_list(field, flat=True).first()
+    )
+
+
+def refresh_stats_on_save(stats_model, field, sender, instance, created, **kwargs):
+    """post_save: refresh the precomputed aggregates (comicsdb/models/stats.py)
+    of the parent `field` points at. Ordinary edits that leave the row under
+    the same parent don't change any count, so they skip the refresh."""
+    current = getattr(instance, field)
+    previous = getattr(instance, "_stats_previous_parent", None)
+    if created or previous != current:
+        stats_model.refresh({current, previous})
+
+
+def refresh_stats_on_delete(stats_model, field, sender, instance, **kwargs):
+    stats_model.refresh({getattr(instance, field)}, create=False)
+
+
+def create_stats_row(stats_model, sender, instance, created, **kwargs):
+    """post_save on Series/Creator/Publisher: start every new row with a
+    (zeroed) stats row, so the delete paths only ever need to update."""
+    if created:
+        stats_model.refresh({instance.pk})
+
+
+def refresh_series_stats_on_rating_save(sender, instance, **kwargs):
+    from comicsdb.models import Issue, SeriesStats  # noqa: PLC0415
+
+    series_ids = Issue.objects.filter(pk=instance.issue_id).values_list("series_id", flat=True)
+    SeriesStats.refresh(series_ids)
+
+
+def refresh_series_stats_on_rating_delete(sender, instance, **kwargs):
+    from comicsdb.models import Issue, SeriesStats  # noqa: PLC0415
+
+    series_ids = Issue.objects.filter(pk=instance.issue_id).values_list("series_id", flat=True)
+    SeriesStats.refresh(series_ids, create=False)
+
+
+def _daily_stats_publisher_id(kind, instance):
+    from comicsdb.models import DailyCatalogStats, Series  # noqa: PLC0415
+
+    if kind != DailyCatalogStats.Kind.ISSUE:
+        return None
+    return (
+        Series.objects.filter(pk=instance.series_id).values_list("publisher_id", flat=True).first()
+    )
+
+
+def count_daily_catalog_addition(kind, date_field, sender, instance, created, **kwargs):
+    """post_save: count a new row in the statistics page's daily rollup."""
+    from comicsdb.models import DailyCatalogStats  # noqa: PLC0415
+
+    if created:
+        DailyCatalogStats.record(
+            kind, getattr(instance, date_field), 1, _daily_stats_publisher_id(kind, instance)
+        )
+
+
+def count_daily_catalog_removal(kind, date_field, sender, instance, **kwargs):
+    from comicsdb.models import DailyCatalogStats  # noqa: PLC0415
+
+    DailyCatalogStats.record(
+        kind, getattr(instance, date_field), -1, _daily_stats_publisher_id(kind, instance)
+    )
+
+
+def move_daily_issue_count_on_issue_save(sender, instance, created, **kwargs):
+    """post_save: an issue moved to a series of another publisher moves its
+    count in the daily rollup too, so a later delete finds it there."""
+    from comicsdb.models import DailyCatalogStats, Series  # noqa: PLC0415
+
+    previous = getattr(instance, "_stats_previous_parent", None)
+    if created or previous is None or previous == instance.series_id:
+        return
+    publishers = dict(
+        Series.objects.filter(pk__in={previous, instance.series_id}).values_list(
+            "pk", "publisher_id"
+        )
+    )
+    old, new = publishers.get(previous), publishers.get(instance.series_id)
+    if old != new:
+        DailyCatalogStats.move(
+            DailyCatalogStats.Kind.ISSUE, timezone.localdate(instance.created_on), 1, old, new
+        )
+
+
+def move_daily_issue_counts_on_series_save(sender, instance, created, **kwargs):
+    """post_save: a series moved to another publisher takes its issues'
+    counts in the daily rollup with it."""
+    from comicsdb.models import DailyCatalogStats, Issue  # noqa: PLC0415
+
+    previous = getattr(instance, "_stats_previous_parent", None)
+    if created or previous is None or previous == instance.publisher_id:
+        return
+    days = (
+        Issue.objects.filter(series=instance)
+        .annotate(day=TruncDate("created_on"))
+        .values("day")
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+    for row in days:
+        DailyCatalogStats.move(
+            DailyCatalogStats.Kind.ISSUE, row["day"], row["count"], previous, instance.publisher_id
+        )
+
+
+def store_history_delta(sender, history_instance, **kwargs):
+    """post_create_historical_record: store the new record's changes against
+    the one before it (see HistoryDeltaModel), now that its M2M rows exist."""
+    delta = history_instance.compute_delta(history_instance.get_previous_record())
+    if delta is None:
+        return
+    history_instance.history_delta = delta
+    sender.objects.filter(pk=history_instance.pk).update(history_delta=delta)
+
+
+def update_announcement_cache(sender, instance, **kwargs):
+    # After commit, so no process can reload the old rows under the new version.
+    transaction.on_commit(sender.record_change)
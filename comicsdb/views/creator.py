@@ -1,7 +1,7 @@
 import logging
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.db.models import Count, OuterRef, Subquery
+from django.db.models import Count, F
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
 from django.views.generic import DetailView, ListView
@@ -23,13 +23,6 @@ from comicsdb.views.mixins import (
 
 LOGGER = logging.getLogger(__name__)
 
-_issue_count_sq = (
-    Credits.objects.filter(creator=OuterRef("pk"))
-    .values("creator")
-    .annotate(count=Count("pk"))
-    .values("count")
-)
-
 
 class CreatorSeriesList(ListView):
     paginate_by = PAGINATE_BY
@@ -70,13 +63,13 @@ class CreatorIssueList(ListView):
 class CreatorList(ListView):
     model = Creator
     paginate_by = PAGINATE_BY
-    queryset = Creator.objects.annotate(issue_count=Subquery(_issue_count_sq))
+    queryset = Creator.objects.annotate(issue_count=F("stats__credit_count"))
 
 
 class CreatorDetail(NavigationMixin, DetailView):
     model = Creator
     queryset = Creator.objects.select_related("edited_by").annotate(
-        issue_count=Subquery(_issue_count_sq)
+        issue_count=F("stats__credit_count")
     )
 
     def get_context_data(self, **kwargs):
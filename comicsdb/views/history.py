@@ -217,45 +217,16 @@ class HistoryListView(LoginRequiredMixin, ListView):
         # Return the name if found, otherwise return the original value
         return id_to_name.get(value, value)
 
-    def get_context_data(self, **kwargs):  # noqa: PLR0912
-        """
-        Add the object and delta information to the context.
-        Computing deltas only for the current page is more efficient.
-        """
+    def get_context_data(self, **kwargs):
+        """Add the object and delta information to the context."""
         context = super().get_context_data(**kwargs)
         context["object"] = self.obj
         context["model_name"] = self.model._meta.verbose_name
 
-        # Add delta information for each record on the current page
+        # Deltas are stored on each record when it's written (HistoryDeltaModel)
         history_list = list(context["history_list"])
-
-        # Get the next record (if exists) for the last item on the page
-        page_obj = context.get("page_obj")
-        if page_obj and page_obj.has_next() and history_list:
-            try:
-                # Get one more record after the page for delta calculation
-                # Use list slicing to avoid expensive count() query
-                queryset = self.get_queryset()
-                last_index = page_obj.number * self.paginate_by
-                try:
-                    next_record = queryset[last_index]
-                except IndexError:
-                    next_record = None
-            except AttributeError:
-                next_record = None
-        else:
-            next_record = None
-
-        # Compute deltas for this page
-        for i, record in enumerate(history_list):
-            if i < len(history_list) - 1:
-                # Compare with the next record in the list (previous in time)
-                record.delta = record.diff_against(history_list[i + 1])
-            elif next_record:
-                # For the last record on page, compare with first of next page
-                record.delta = record.diff_against(next_record)
-            else:
-                record.delta = None
+        for record in history_list:
+            record.delta = record.stored_delta
 
         # Prefetch all FK and M2M names in batch to avoid N+1 queries
         fk_cache = self._prefetch_fk_names(history_list)
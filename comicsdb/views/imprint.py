@@ -1,14 +1,13 @@
 import logging
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.db.models import Count, OuterRef, Subquery
+from django.db.models import Count, F, OuterRef, Subquery
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
 from django.views.generic import CreateView, DeleteView, DetailView, ListView, UpdateView
 
 from comicsdb.forms.imprint import ImprintForm
 from comicsdb.models import Imprint, Series
-from comicsdb.models.issue import Issue
 from comicsdb.views.constants import PAGINATE_BY
 from comicsdb.views.history import HistoryListView
 from comicsdb.views.mixins import (
@@ -21,13 +20,6 @@ from comicsdb.views.mixins import (
 
 LOGGER = logging.getLogger(__name__)
 
-_issue_count_sq = (
-    Issue.objects.filter(series=OuterRef("pk"))
-    .values("series")
-    .annotate(count=Count("pk"))
-    .values("count")
-)
-
 _series_count_qs = (
     Series.objects.filter(imprint=OuterRef("pk"))
     .values("imprint")
@@ -56,7 +48,7 @@ class ImprintSeriesList(ListView):
             Series.objects.select_related("series_type")
             .filter(imprint=self.imprint)
             .prefetch_related("issues")
-            .annotate(issue_count=Subquery(_issue_count_sq))
+            .annotate(issue_count=F("stats__issue_count"))
         )
 
     def get_context_data(self, **kwargs):
@@ -1,7 +1,7 @@
 import logging
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.db.models import Count, OuterRef, Subquery
+from django.db.models import Count, F, OuterRef, Subquery
 from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
@@ -27,20 +27,6 @@ from comicsdb.views.mixins import (
 
 LOGGER = logging.getLogger(__name__)
 
-_issue_count_sq = (
-    Issue.objects.filter(series=OuterRef("pk"))
-    .values("series")
-    .annotate(count=Count("pk"))
-    .values("count")
-)
-
-_series_count_sq = (
-    Series.objects.filter(publisher=OuterRef("pk"))
-    .values("publisher")
-    .annotate(count=Count("pk"))
-    .values("count")
-)
-
 _imprint_count_sq = (
     Imprint.objects.filter(publisher=OuterRef("pk"))
     .values("publisher")
@@ -73,7 +59,7 @@ _universe_issue_count_sq = (
 class PublisherList(ListView):
     model = Publisher
     paginate_by = PAGINATE_BY
-    queryset = Publisher.objects.annotate(series_count=Subquery(_series_count_sq)).order_by("name")
+    queryset = Publisher.objects.annotate(series_count=F("stats__series_count")).order_by("name")
 
 
 class PublisherSeriesList(ListView):
@@ -86,7 +72,7 @@ class PublisherSeriesList(ListView):
             Series.objects.select_related("series_type")
             .filter(publisher=self.publisher)
             .prefetch_related("issues")
-            .annotate(issue_count=Subquery(_issue_count_sq))
+            .annotate(issue_count=F("stats__issue_count"))
         )
 
     def get_context_data(self, **kwargs):
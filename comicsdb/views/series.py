@@ -2,7 +2,7 @@ import logging
 
 from django.conf import global_settings
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.db.models import Avg, Count, DecimalField, OuterRef, Subquery
+from django.db.models import Count, F
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
 from django.views.generic import DetailView, ListView
@@ -11,7 +11,6 @@ from django.views.generic.edit import CreateView, DeleteView, UpdateView
 from comicsdb.filters.series import SeriesViewFilter
 from comicsdb.forms.series import SeriesForm
 from comicsdb.models import Series, SeriesType
-from comicsdb.models.issue import Issue
 from comicsdb.views.constants import PAGINATE_BY
 from comicsdb.views.history import HistoryListView
 from comicsdb.views.issue_list_helpers import SORT_OPTIONS, apply_sort
@@ -21,32 +20,10 @@ from comicsdb.views.mixins import (
     SlugRedirectView,
 )
 from comicsdb.views.series_list_helpers import build_active_filters
-from issue_ratings.models import IssueRating
 from pull_list.models import PullListSeries
 
 LOGGER = logging.getLogger(__name__)
 
-_issue_count_sq = (
-    Issue.objects.filter(series=OuterRef("pk"))
-    .values("series")
-    .annotate(count=Count("pk"))
-    .values("count")
-)
-
-_series_average_rating_sq = (
-    IssueRating.objects.filter(issue__series=OuterRef("pk"))
-    .values("issue__series")
-    .annotate(avg=Avg("rating", output_field=DecimalField(max_digits=3, decimal_places=2)))
-    .values("avg")
-)
-
-_series_rating_count_sq = (
-    IssueRating.objects.filter(issue__series=OuterRef("pk"))
-    .values("issue__series")
-    .annotate(count=Count("pk"))
-    .values("count")
-)
-
 
 class SeriesList(ListView):
     model = Series
@@ -56,7 +33,7 @@ class SeriesList(ListView):
         queryset = (
             Series.objects.select_related("series_type", "publisher", "imprint")
             .prefetch_related("issues")
-            .annotate(issue_count=Subquery(_issue_count_sq))
+            .annotate(issue_count=F("stats__issue_count"))
         )
         # Apply filters
         filtered = SeriesViewFilter(self.request.GET, queryset=queryset)
@@ -97,9 +74,9 @@ class SeriesDetail(DetailView):
         Series.objects.select_related("publisher", "imprint", "edited_by", "series_type")
         .prefetch_related("issues")
         .annotate(
-            issue_count=Subquery(_issue_count_sq),
-            average_rating=Subquery(_series_average_rating_sq),
-            rating_count=Subquery(_series_rating_count_sq),
+            issue_count=F("stats__issue_count"),
+            average_rating=F("stats__average_rating"),
+            rating_count=F("stats__rating_count"),
         )
     )
 
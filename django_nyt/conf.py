@@ -120,6 +120,13 @@ class AppSettings:
     """The swappable user model of Django Nyt.
     The default is to use the contents of ``AUTH_USER_MODEL``."""
 
+    NYT_DEFER_NOTIFICATIONS: bool = False
+    """Create notifications from a background task instead of inside the request
+    that calls ``notify()``, so that notifying thousands of subscribers doesn't
+    hold up e.g. saving a wiki article. The task is enqueued with Django's tasks
+    framework (configure a worker backend in the ``TASKS`` setting) once the
+    current transaction commits, and ``notify()`` returns an empty list."""
+
     ############
     # CHANNELS #
     ############
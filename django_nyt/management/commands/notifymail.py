@@ -2,7 +2,9 @@ import logging
 import os
 import smtplib
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 
@@ -20,6 +22,25 @@ from django_nyt.conf import app_settings
 # Daemon / mail loop sleep between each database poll (seconds)
 SLEEP_TIME = 120
 
+# Number of SMTP connections (one per worker thread) used to send a batch
+SMTP_WORKERS = 4
+
+# Number of digests rendered, sent and marked as emailed together
+BATCH_SIZE = 200
+
+# Attempts per email on a transient SMTP error, and the back-off between them
+# (seconds, multiplied by the attempt number)
+SMTP_ATTEMPTS = 3
+SMTP_RETRY_DELAY = 5
+
+# Outcomes of sending one digest
+SENT = "sent"
+# Transient failure: the notifications are sent again on the next run
+FAILED = "failed"
+# The SMTP server rejected the sender or recipient: sending it again would be
+# refused the same way, so the notifications are marked as emailed
+REFUSED = "refused"
+
 
 class Command(BaseCommand):
     can_import_settings = True
@@ -85,6 +106,14 @@ class Command(BaseCommand):
             help="Minimum sleep between each polling of the database.",
             default=SLEEP_TIME,
         )
+        parser.add_argument(
+            "--workers",
+            action="store",
+            dest="workers",
+            type=int,
+            help="Number of SMTP connections to send emails through in parallel.",
+            default=SMTP_WORKERS,
+        )
         parser.add_argument(
             "--now",
             action="store",
@@ -92,9 +121,8 @@ class Command(BaseCommand):
             help="Simulate when to start sending from (mainly for testing purposes)",
         )
 
-    def _render_and_send(
-        self, template_name, template_subject_name, context, connection
-    ):
+    def _render(self, template_name, template_subject_name, context):
+        """Render one digest into an email message, ready to be sent."""
 
         # This setting overrides everything
         if app_settings.NYT_EMAIL_SUBJECT:
@@ -106,15 +134,12 @@ class Command(BaseCommand):
         subject = subject.replace("\n", "").strip()
 
         message = render_to_string(template_name, context)
-        email = mail.EmailMessage(
+        return mail.EmailMessage(
             subject,
             message,
             app_settings.NYT_EMAIL_SENDER,
             [context["user"].email],
-            connection=connection,
         )
-        self.logger.info("Sending to: %s", context["user"].email)
-        email.send(fail_silently=False)
 
     def _daemonize(self):
         self.logger.info("Daemon mode enabled, forking")
@@ -172,9 +197,6 @@ class Command(BaseCommand):
         if daemon:
             self._daemonize()
 
-        # create a connection to smtp server for reuse
-        connection = mail.get_connection()
-
         if cron:
             if self.options.get("now"):
                 now = self.options.get("now")
@@ -182,20 +204,20 @@ class Command(BaseCommand):
             else:
                 now = timezone.now()
 
-            self.send_mails(connection, now)
+            self.send_mails(now)
             return
 
         if not daemon:
             print("Entering send-loop, CTRL+C to exit")
         try:
-            self.send_loop(connection, int(options["sleep_time"]))
+            self.send_loop(int(options["sleep_time"]))
         except KeyboardInterrupt:
             print("\nQuitting...")
 
         # deactivate the language
         deactivate()
 
-    def send_loop(self, connection, sleep_time):
+    def send_loop(self, sleep_time):
 
         last_sent = None
 
@@ -209,7 +231,7 @@ class Command(BaseCommand):
             if last_sent:
                 user_settings = models.Settings.objects.filter(
                     interval__lte=((started_sending_at - last_sent).seconds // 60) // 60
-                ).order_by("user")
+                )
                 now = self.options.get("now") or timezone.now()
             else:
                 # TOD: This isn't perfect. If we are simulating a "now", we should also
@@ -217,83 +239,152 @@ class Command(BaseCommand):
                 now = timezone.now()
                 user_settings = None
 
-            self.send_mails(
-                connection, now, last_sent=last_sent, user_settings=user_settings
-            )
+            self.send_mails(now, last_sent=last_sent, user_settings=user_settings)
 
-            connection.close()
             last_sent = timezone.now()
             time.sleep(sleep_time)
 
-    def _send_with_retry(
-        self, template_name, subject_template_name, context, connection, setting
-    ):
+    def _get_connection(self):
+        """The calling worker thread's SMTP connection, opened on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = mail.get_connection()
+            connection.open()
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _send(self, email, notification_ids):
         """
-        Loops through emails in a list of notifications and tries to send
-        to each recipient
+        Send one digest from a worker thread. Transient SMTP errors are retried
+        a few times on a fresh connection; if the email still can't be sent, it
+        is left for the next run. Returns SENT, FAILED or REFUSED.
         """
-        # STMP connection send loop
-        notifications = context["notifications"]
-
-        if len(context["notifications"]) == 0:
-            return
-
-        while True:
-            notification_ids = [n.id for n in notifications]
+        for attempt in range(1, SMTP_ATTEMPTS + 1):
             try:
-                self.logger.info("Sending to notification ids %s", notification_ids)
-                self._render_and_send(
-                    template_name, subject_template_name, context, connection
+                self.logger.info(
+                    "Sending to %s, notification ids %s", email.to[0], notification_ids
                 )
-                for n in notifications:
-                    n.is_emailed = True
-                    n.save()
-                    n.subscription.last_sent = timezone.now()
-                    n.subscription.save()
-                models.Subscription.objects.filter(
-                    notification__id__in=notification_ids
-                ).update(last_sent=timezone.now())
-                break
-            except smtplib.SMTPSenderRefused:
+                email.connection = self._get_connection()
+                email.send(fail_silently=False)
+            except (smtplib.SMTPSenderRefused, smtplib.SMTPRecipientsRefused):
                 self.logger.error(
-                    "E-mail refused by SMTP server (%s), skipping!", setting.user.email
+                    "E-mail refused by SMTP server (%s), skipping!", email.to[0]
                 )
-                continue
+                return REFUSED
             except smtplib.SMTPException as e:
                 self.logger.error(
                     "You have an error with your SMTP server connection, error is: %s", e
                 )
-                self.logger.error("Sleeping for 30s then retrying...")
-                time.sleep(30)
-            except Exception as e:
-                self.logger.error("Unhandled exception while sending, giving up: %s", e)
-                raise
-
-    def send_mails(
-        self, connection, now, last_sent=None, user_settings=None
-    ):
+                # Start over on a new connection
+                if getattr(self._local, "connection", None) is not None:
+                    self._local.connection.close()
+                    self._local.connection = None
+                if attempt == SMTP_ATTEMPTS:
+                    self.logger.error("Giving up on %s until the next run", email.to[0])
+                    return FAILED
+                time.sleep(SMTP_RETRY_DELAY * attempt)
+            else:
+                return SENT
+        return FAILED
+
+    def _send_batch(self, pool, batch):
+        """
+        Render a batch of digests, send them through the worker pool and mark
+        what was sent with one UPDATE per table. Refused digests are marked as
+        emailed too, so they aren't retried on every run.
+        """
+        futures = [
+            (
+                notifications,
+                pool.submit(
+                    self._send,
+                    self._render(template_name, subject_template_name, context),
+                    [n.id for n in notifications],
+                ),
+            )
+            for template_name, subject_template_name, context, notifications in batch
+        ]
+
+        sent = []
+        refused = []
+        try:
+            for notifications, future in futures:
+                result = future.result()
+                if result == SENT:
+                    sent += notifications
+                elif result == REFUSED:
+                    refused += notifications
+        finally:
+            # Even when a worker raised, record what did go out so it isn't
+            # sent twice.
+            if sent or refused:
+                models.Notification.objects.filter(
+                    id__in=[n.id for n in sent + refused]
+                ).update(is_emailed=True)
+            if sent:
+                now = timezone.now()
+                models.Subscription.objects.filter(
+                    id__in={n.subscription_id for n in sent}
+                ).update(last_sent=now)
+
+    def _pending_notifications(self, now, user_settings=None):
+        """
+        All notifications that are due to be emailed, for every user, in a
+        single query. Ordered by settings and then notification type so that
+        each digest is a run of consecutive rows.
+        """
+        due = Q()
+        for interval, _label in app_settings.NYT_INTERVALS:
+            if not interval:
+                due |= Q(subscription__settings__interval=interval)
+                continue
+
+            threshold = now - timedelta(minutes=interval)
+            # How much time must have passed since either
+            # a) the subscription was created (in case nothing hast been sent)
+            # b) the subscription was last active (in case something has been sent)
+            due |= Q(subscription__settings__interval=interval) & (
+                Q(subscription__created__lte=threshold, subscription__last_sent=None)
+                | Q(
+                    subscription__last_sent__lte=threshold,
+                    subscription__latest__is_emailed=False,
+                )
+            )
+
+        # We assume that if we are sending a digest and we've missed sending it,
+        # we can still just summarize ALL notifications that haven't been emailed.
+        notifications = models.Notification.objects.filter(
+            due, is_emailed=False, subscription__send_emails=True
+        )
+        if user_settings is not None:
+            notifications = notifications.filter(subscription__settings__in=user_settings)
+
+        # The ordering by notification_type__key is because we want a predictable
+        # order currently just for testing purposes.
+        return notifications.select_related(
+            "subscription__notification_type", "subscription__settings__user"
+        ).order_by(
+            "subscription__settings__user",
+            "subscription__settings",
+            "subscription__notification_type__key",
+            "subscription",
+            "-id",
+        )
+
+    def send_mails(self, now, last_sent=None, user_settings=None):
         """
         Does the lookups and sends out email digests to anyone who has them due.
         Since the system may have different templates depending on which notification
-        is being sent, we will generate a call for each template.
+        is being sent, we will generate an email per template and user's Settings
+        object.
         """
 
         self.logger.debug(
             "Entering send_mails(now=%s, last_sent=%s, ...)", now, last_sent
         )
 
-        connection.open()
-
-        if not user_settings:
-            user_settings = (
-                models.Settings.objects.all()
-                .select_related("user")
-                .prefetch_related(
-                    "subscription_set", "subscription_set__notification_type"
-                )
-                .order_by("user")
-            )
-
         if self.options["domain"]:
             site_object = None
             domain = self.options["domain"]
@@ -304,82 +395,52 @@ class Command(BaseCommand):
             domain = site_object.domain
 
         http_scheme = "http" if self.options["http"] else "https"
+        digests = dict(app_settings.NYT_INTERVALS)
+
+        # Group the pending notifications by (settings, template, subject template)
+        emails_per_template = {}
+        for notification in self._pending_notifications(now, user_settings):
+            subscription = notification.subscription
+            notification_type = subscription.notification_type
+            key = (
+                subscription.settings_id,
+                notification_type.get_email_template_name(),
+                notification_type.get_email_subject_template_name(),
+            )
+            emails_per_template.setdefault(key, []).append(notification)
 
-        # We look up what to send for each user's Settings object
-        for setting in user_settings:
-
-            threshold = now - timedelta(minutes=setting.interval)
-
-            context = {
-                "user": None,
-                "username": None,
-                "notifications": None,
-                "digest": None,
-                "site": site_object,
-                "domain": domain,
-                "http_scheme": http_scheme,
-            }
-
-            context["user"] = setting.user
-            context["username"] = getattr(setting.user, setting.user.USERNAME_FIELD)
-            # get the index of the tuple corresponding to the interval and
-            # get the string name
-            idx = [y[0] for y in app_settings.NYT_INTERVALS].index(setting.interval)
-            context["digest"] = app_settings.NYT_INTERVALS[idx][1]
-
-            emails_per_template = {}
-
-            filter_qs = Q()
-
-            if setting.interval:
-
-                # How much time must have passed since either
-                # a) the subscription was created (in case nothing hast been sent)
-                # b) the subscription was last active (in case something has been sent)
-                filter_qs = Q(Q(created__lte=threshold) & Q(last_sent=None)) | Q(
-                    Q(last_sent__lte=threshold) & Q(latest__is_emailed=False)
-                )
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        workers = max(1, int(self.options.get("workers") or SMTP_WORKERS))
 
-            # The ordering by notification_type__key is because we want a predictable
-            # order currently just for testing purposes.
-            for subscription in setting.subscription_set.filter(
-                filter_qs, send_emails=True
-            ).order_by("notification_type__key"):
-                try:
-                    template_name = (
-                        subscription.notification_type.get_email_template_name()
-                    )
-                except models.NotificationType.DoesNotExist:
-                    self.logger.warning(
-                        "Subscription has non-existent notification type %s",
-                        subscription.notification_type_id,
+        batch = []
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for (
+                    _settings_id,
+                    template_name,
+                    subject_template_name,
+                ), notifications in emails_per_template.items():
+                    setting = notifications[0].subscription.settings
+                    context = {
+                        "user": setting.user,
+                        "username": getattr(setting.user, setting.user.USERNAME_FIELD),
+                        "notifications": notifications,
+                        "digest": digests[setting.interval],
+                        "site": site_object,
+                        "domain": domain,
+                        "http_scheme": http_scheme,
+                    }
+                    batch.append(
+                        (template_name, subject_template_name, context, notifications)
                     )
-                    continue
-                subject_template_name = (
-                    subscription.notification_type.get_email_subject_template_name()
-                )
-
-                emails_per_template.setdefault(
-                    (template_name, subject_template_name), []
-                )
-
-                # We assume that if we are sending a digest and we've missed sending it,
-                # we can still just summarize ALL notifications that haven't been emailed.
-                emails_per_template[(template_name, subject_template_name)] += list(
-                    subscription.notification_set.filter(is_emailed=False),
-                )
-
-            # Send the prepared template names, subjects and context to the user
-            for (
-                template_name,
-                subject_template_name,
-            ), notifications in emails_per_template.items():
-
-                if not notifications:
-                    continue
-
-                context["notifications"] = notifications
-
-                self._send_with_retry(
-                    template_name, subject_template_name, context, connection, setting
-                )
+                    if len(batch) >= BATCH_SIZE:
+                        self._send_batch(pool, batch)
+                        batch = []
+
+                if batch:
+                    self._send_batch(pool, batch)
+        finally:
+            for connection in self._connections:
+                connection.close()
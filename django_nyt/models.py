@@ -3,9 +3,10 @@ import re
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Q
+from django.db.models import F, Q
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from django_nyt.conf import app_settings
@@ -405,7 +406,6 @@ class Notification(models.Model):
         if filter_exclude is None:
             filter_exclude = {}
 
-        objects_created = []
         subscriptions = Subscription.objects.filter(notification_type__key=key).exclude(
             **filter_exclude
         )
@@ -420,40 +420,55 @@ class Notification(models.Model):
                 settings__user__in=recipient_users,
             )
 
-        subscriptions = subscriptions.prefetch_related("latest", "settings")
-        subscriptions = subscriptions.order_by("settings__user")
-
-        seen_key_for_settings = {}
+        # The fan-out is set-based: one query to read the subscriptions, then
+        # one UPDATE, one INSERT and one bulk UPDATE however many there are.
+        rows = subscriptions.order_by("settings__user", "pk").values_list(
+            "pk",
+            "settings_id",
+            "settings__user_id",
+            "latest_id",
+            "latest__message",
+            "latest__url",
+            "latest__is_viewed",
+        )
 
-        for subscription in subscriptions:
+        repeated_ids = []
+        new_objects = []
+        seen_settings = set()
+        for pk, settings_id, user_id, latest_id, message, url, is_viewed in rows:
             # Don't alert the same user several times even though overlapping
-            # subscriptions occur.
-
-            # If this settings has already been notified in this loop, skip.
-            # This happens when there are several overlapping subscriptions for the same key.
-            seen_key_for_settings.setdefault(subscription.settings.id, [])
-            if key in seen_key_for_settings[subscription.settings.id]:
+            # subscriptions occur: only the first subscription per settings
+            # object counts.
+            if settings_id in seen_settings:
                 continue
+            seen_settings.add(settings_id)
 
-            seen_key_for_settings[subscription.settings.id].append(key)
-
-            # Check if it's the same as the previous message
-            latest = subscription.latest
-            if latest and (
-                latest.message == kwargs.get("message")
-                and latest.url == kwargs.get("url")
-                and latest.is_viewed is False
+            if (
+                latest_id
+                and message == kwargs.get("message")
+                and url == kwargs.get("url")
+                and is_viewed is False
             ):
                 # Both message and URL are the same, and it hasn't been viewed
                 # so just increment occurrence count.
-                latest.occurrences = latest.occurrences + 1
-                latest.is_emailed = False
-                latest.save()
+                repeated_ids.append(latest_id)
             else:
-                # Insert a new notification
-                new_obj = cls.objects.create(subscription=subscription, **kwargs)
-                objects_created.append(new_obj)
-                subscription.latest = new_obj
-                subscription.save()
+                new_objects.append(cls(subscription_id=pk, user_id=user_id, **kwargs))
 
+        now = timezone.now()
+        if repeated_ids:
+            cls.objects.filter(pk__in=repeated_ids).update(
+                occurrences=F("occurrences") + 1, is_emailed=False, modified=now
+            )
+        if not new_objects:
+            return []
+
+        objects_created = cls.objects.bulk_create(new_objects)
+        Subscription.objects.bulk_update(
+            [
+                Subscription(pk=obj.subscription_id, latest_id=obj.pk, modified=now)
+                for obj in objects_created
+            ],
+            ["latest", "modified"],
+        )
         return objects_created
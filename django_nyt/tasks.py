@@ -0,0 +1,28 @@
+from django.tasks import task
+
+from django_nyt.utils import fan_out
+
+
+@task
+def create_notifications(  # noqa: PLR0913
+    message: str,
+    key: str,
+    *,
+    object_id: int | None = None,
+    url: str | None = None,
+    filter_exclude: dict | None = None,
+    recipient_user_ids: list[int] | None = None,
+) -> int:
+    """
+    Background counterpart of ``notify()``, enqueued by it when
+    ``NYT_DEFER_NOTIFICATIONS`` is set. Returns the number of notifications created.
+    """
+    notifications = fan_out(
+        message,
+        key,
+        object_id=object_id,
+        url=url,
+        filter_exclude=filter_exclude,
+        recipient_users=recipient_user_ids,
+    )
+    return len(notifications)
@@ -1,6 +1,8 @@
+from functools import partial
 from typing import Any
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.db.models import Model
 from django.utils.translation import gettext as _
 
@@ -73,6 +75,55 @@ def notify(  # noqa: PLR0913
     else:
         object_id = None
 
+    if app_settings.NYT_DEFER_NOTIFICATIONS:
+        from django_nyt.tasks import create_notifications  # noqa: PLC0415
+
+        # Task arguments have to be JSON serializable: pass primary keys
+        # instead of model instances, and render lazy translations.
+        transaction.on_commit(
+            partial(
+                create_notifications.enqueue,
+                str(message),
+                key,
+                object_id=object_id,
+                url=url,
+                filter_exclude={
+                    name: getattr(value, "pk", value)
+                    for name, value in (filter_exclude or {}).items()
+                },
+                recipient_user_ids=(
+                    None
+                    if recipient_users is None
+                    else [getattr(user, "pk", user) for user in recipient_users]
+                ),
+            )
+        )
+        return []
+
+    return fan_out(
+        message,
+        key,
+        object_id=object_id,
+        url=url,
+        filter_exclude=filter_exclude,
+        recipient_users=recipient_users,
+    )
+
+
+def fan_out(  # noqa: PLR0913
+    message: str,
+    key: str,
+    *,
+    object_id: int | None = None,
+    url: str | None = None,
+    filter_exclude: dict | None = None,
+    recipient_users: list | None = None,
+) -> list[models.Notification]:
+    """
+    Create the notifications for an event and tell channel subscribers about
+    them. This is the part of ``notify()`` that ``NYT_DEFER_NOTIFICATIONS``
+    moves to a background task.
+    """
     notifications = models.Notification.create_notifications(
         key,
         object_id=object_id,
@@ -196,6 +196,16 @@ CACHES = {
         "LOCATION": config("REDIS_URL"),
     },
 }
+# Seconds an API list response keeps being served after a data change, while
+# one worker re-renders it (see api/cache.py). 0 disables it.
+API_CACHE_STALE_TTL = config("API_CACHE_STALE_TTL", default=30, cast=int)
+# Cached API response bodies at least this many bytes are zlib-compressed in
+# Redis (see api/cache.py). 0 disables compression.
+API_CACHE_COMPRESS_MIN_BYTES = config("API_CACHE_COMPRESS_MIN_BYTES", default=1024, cast=int)
+
+# Seconds a successful Basic Auth verification is reused instead of hashing
+# the password again (see api/authentication.py). 0 disables it.
+API_BASIC_AUTH_CACHE_TTL = config("API_BASIC_AUTH_CACHE_TTL", default=300, cast=int)
 
 # sorl-thumbnail settings
 THUMBNAIL_KVSTORE = "sorl.thumbnail.kvstores.redis_kvstore.KVStore"
@@ -207,7 +217,7 @@ THUMBNAIL_DEBUG = DEBUG
 REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.DjangoModelPermissions",),
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework.authentication.BasicAuthentication",
+        "api.authentication.CachedBasicAuthentication",
         "rest_framework.authentication.SessionAuthentication",
         "knox.auth.TokenAuthentication",
     ),
@@ -217,7 +227,7 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_THROTTLE_RATES": {"burst": "20/minute", "sustained": "5000/day"},
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.KeysetPageNumberPagination",
     "PAGE_SIZE": 100,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
@@ -1,7 +1,12 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
 from django.db.models.signals import post_delete, post_save
 
-from pull_list.signals import update_pull_list_modified_on_series_change
+from pull_list.signals import (
+    update_pull_list_modified_on_series_change,
+    update_release_index_on_issue_delete,
+    update_release_index_on_issue_save,
+    update_release_index_on_series_save,
+)
 
 
 class PullListConfig(AppConfig):
@@ -20,3 +25,21 @@ class PullListConfig(AppConfig):
             sender=pull_list_series,
             dispatch_uid="post_delete_pull_list_series_modified",
         )
+
+        # Keep the upcoming release index (pull_list/release_index.py) current.
+        issue = apps.get_model("comicsdb", "Issue")
+        post_save.connect(
+            update_release_index_on_issue_save,
+            sender=issue,
+            dispatch_uid="post_save_issue_release_index",
+        )
+        post_delete.connect(
+            update_release_index_on_issue_delete,
+            sender=issue,
+            dispatch_uid="post_delete_issue_release_index",
+        )
+        post_save.connect(
+            update_release_index_on_series_save,
+            sender=apps.get_model("comicsdb", "Series"),
+            dispatch_uid="post_save_series_release_index",
+        )
@@ -0,0 +1,164 @@
+"""Shared index of upcoming releases, grouped by release week and series.
+
+Every user's pull list used to run its own `Issue.objects.filter(series_id__in=...)`
+scan with a store-date range, and on new comic book day thousands of users
+ask for nearly the same range at once. This index holds every issue with a
+store date in the current release week or later, as
+`week -> series id -> [issue ids]`, so a pull list becomes an in-memory
+intersection of the user's series ids with the index, followed by a
+primary-key fetch of that one page of issues.
+
+Each worker process keeps its own copy, built from a snapshot that is also
+cached in Redis so a rebuild costs the first worker one query and everyone
+else a cache read. The same Redis generation counters as the response cache
+(see api/cache.py) keep the copies fresh: the signal handlers in
+pull_list/signals.py bump a dedicated counter when a change can move an
+upcoming release, and a copy built under an older generation -- or for an
+earlier release week, or more than RELEASE_INDEX_TTL ago -- is rebuilt on
+its next use.
+"""
+
+import threading
+import time
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from api.cache import bump_model_version, get_model_version
+
+RELEASE_INDEX_VERSION_LABEL = "release_week"
+#: Upper bound on how long a snapshot (process-local or in Redis) is used,
+#: so one built while a write was still uncommitted can't outlive it for long.
+RELEASE_INDEX_TTL = 60 * 10
+
+
+def release_week(day: date) -> date:
+    """The Monday starting the release week `day` falls in."""
+    return day - timedelta(days=day.weekday())
+
+
+class ReleaseWeekIndex:
+    """Issue ids per release week and series, for weeks from `first_week` on.
+
+    `rows` are `(issue_id, series_id, store_date)` tuples in the order pull
+    lists are displayed (store date, series sort name, number), which is
+    kept as each issue's rank.
+    """
+
+    def __init__(self, first_week: date, rows=()):
+        self.first_week = first_week
+        self._weeks: dict[date, dict[int, list[int]]] = {}
+        self._store_dates: dict[int, date] = {}
+        self._rank: dict[int, int] = {}
+        for rank, (issue_id, series_id, store_date) in enumerate(rows):
+            week = self._weeks.setdefault(release_week(store_date), {})
+            week.setdefault(series_id, []).append(issue_id)
+            self._store_dates[issue_id] = store_date
+            self._rank[issue_id] = rank
+
+    def __len__(self) -> int:
+        return len(self._rank)
+
+    def covers(self, start: date) -> bool:
+        """Whether every issue on or after `start` is in the index."""
+        return start >= self.first_week
+
+    def issue_ids(self, series_ids, start: date, end: date | None = None) -> list[int]:
+        """Ids of the issues in `series_ids` with a store date from `start`
+        through `end` (inclusive, open-ended if None), in display order.
+        `start` must be covered by the index."""
+        wanted = set(series_ids)
+        first, last = release_week(start), end and release_week(end)
+        found = []
+        for week, by_series in self._weeks.items():
+            if week < first or (last is not None and week > last):
+                continue
+            for series_id in wanted & by_series.keys():
+                found.extend(by_series[series_id])
+        found = [
+            issue_id
+            for issue_id in found
+            if start <= self._store_dates[issue_id]
+            and (end is None or self._store_dates[issue_id] <= end)
+        ]
+        found.sort(key=self._rank.__getitem__)
+        return found
+
+
+_lock = threading.Lock()
+_index: ReleaseWeekIndex | None = None
+_index_version: int | None = None
+_index_built_at = 0.0
+
+
+def _snapshot_key(version: int, first_week: date) -> str:
+    return f"pull_list:release_index:{version}:{first_week.isoformat()}"
+
+
+def _load_index(version: int, first_week: date) -> ReleaseWeekIndex:
+    from comicsdb.models import Issue  # noqa: PLC0415
+
+    key = _snapshot_key(version, first_week)
+    rows = cache.get(key)
+    if rows is None:
+        rows = list(
+            Issue.objects.filter(store_date__gte=first_week)
+            .order_by("store_date", "series__sort_name", "number", "pk")
+            .values_list("pk", "series_id", "store_date")
+        )
+        cache.set(key, rows, RELEASE_INDEX_TTL)
+    return ReleaseWeekIndex(first_week, rows)
+
+
+def get_release_index() -> ReleaseWeekIndex:
+    """Return this process's index, rebuilding it first if it's out of date."""
+    global _index, _index_version, _index_built_at  # noqa: PLW0603
+
+    version = get_model_version(RELEASE_INDEX_VERSION_LABEL)
+    first_week = release_week(timezone.localdate())
+    with _lock:
+        if (
+            _index is None
+            or _index_version != version
+            or _index.first_week != first_week
+            or time.monotonic() - _index_built_at > RELEASE_INDEX_TTL
+        ):
+            _index = _load_index(version, first_week)
+            _index_version = version
+            _index_built_at = time.monotonic()
+        return _index
+
+
+def upcoming_issue_ids(series_ids, start: date, end: date | None = None) -> list[int] | None:
+    """Ids of the issues in `series_ids` released from `start` through `end`,
+    in display order, or None when `start` is before the current release
+    week (the caller then queries Issue directly)."""
+    index = get_release_index()
+    if not index.covers(start):
+        return None
+    return index.issue_ids(series_ids, start, end)
+
+
+def load_issues(issue_ids) -> list:
+    """Fetch `issue_ids` (e.g. one page of upcoming_issue_ids()) in order."""
+    from comicsdb.models import Issue  # noqa: PLC0415
+
+    issues = Issue.objects.select_related("series__series_type", "series__publisher").in_bulk(
+        issue_ids
+    )
+    return [issues[pk] for pk in issue_ids if pk in issues]
+
+
+def record_release_change() -> None:
+    """Signal-side hook: make every process rebuild its index on next use."""
+    bump_model_version(RELEASE_INDEX_VERSION_LABEL)
+
+
+def reset_release_index() -> None:
+    """Drop this process's index (tests, or to force a rebuild)."""
+    global _index, _index_version  # noqa: PLW0603
+
+    with _lock:
+        _index = None
+        _index_version = None
@@ -1,7 +1,60 @@
+from datetime import datetime
+
+from django.db import transaction
 from django.utils import timezone
 
+from pull_list.release_index import record_release_change, release_week
+
 
 def update_pull_list_modified_on_series_change(sender, instance, **kwargs):
     from pull_list.models import PullList  # noqa: PLC0415
 
     PullList.objects.filter(pk=instance.pull_list_id).update(modified=timezone.now())
+
+
+def _is_upcoming(store_date) -> bool:
+    if store_date is None:
+        return False
+    # The field accepts datetimes, and the instance keeps whatever was assigned.
+    if isinstance(store_date, datetime):
+        store_date = store_date.date()
+    return store_date >= release_week(timezone.localdate())
+
+
+def update_release_index_on_issue_save(sender, instance, created, **kwargs):
+    """Edits to issues that were and still are outside the upcoming weeks, or
+    that don't touch the store date, series or number, leave the index alone.
+    Where the issue was before the save comes from the row
+    pre_save_remember_saved_row (comicsdb/models/issue.py) already fetched.
+    The rebuild is published after commit, so no process can cache an index
+    built from the uncommitted rows under the new version."""
+    saved_row = getattr(instance, "_saved_row", None)
+    previous = saved_row and (saved_row["store_date"], saved_row["series_id"], saved_row["number"])
+    current = (instance.store_date, instance.series_id, instance.number)
+    if created or previous is None:
+        changed = _is_upcoming(instance.store_date)
+    else:
+        changed = previous != current and (
+            _is_upcoming(previous[0]) or _is_upcoming(instance.store_date)
+        )
+    if changed:
+        transaction.on_commit(record_release_change)
+
+
+def update_release_index_on_issue_delete(sender, instance, **kwargs):
+    if _is_upcoming(instance.store_date):
+        transaction.on_commit(record_release_change)
+
+
+def update_release_index_on_series_save(sender, instance, created, **kwargs):
+    """The index is ordered by series sort name, so a renamed series with
+    upcoming issues needs a rebuild too."""
+    from comicsdb.models import Issue  # noqa: PLC0415
+
+    if created:
+        return
+    upcoming = Issue.objects.filter(
+        series_id=instance.pk, store_date__gte=release_week(timezone.localdate())
+    )
+    if upcoming.exists():
+        transaction.on_commit(record_release_change)
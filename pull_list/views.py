@@ -8,10 +8,10 @@ from django.utils.translation import gettext as _
 from django.views.decorators.http import require_POST
 from django.views.generic import DeleteView, FormView
 
-from comicsdb.models.issue import Issue
 from comicsdb.models.series import Series
 from pull_list.forms import AddSeriesToPullListForm
 from pull_list.models import PullList, PullListSeries
+from pull_list.release_index import load_issues, upcoming_issue_ids
 
 
 def get_or_create_pull_list(user):
@@ -54,13 +54,9 @@ class PullListDetailView(LoginRequiredMixin, FormView):
             "series__series_type",
             "series__publisher",
         ).order_by("series__sort_name")
-        today = timezone.now().date()
+        today = timezone.localdate()
         series_ids = list(pull_list.pull_list_series.values_list("series_id", flat=True))
-        context["upcoming_issues"] = (
-            Issue.objects.filter(series_id__in=series_ids, store_date__gte=today)
-            .select_related("series__series_type", "series__publisher")
-            .order_by("store_date", "series__sort_name")[:50]
-        )
+        context["upcoming_issues"] = load_issues(upcoming_issue_ids(series_ids, today)[:50])
         context["is_owner"] = True
         return context
 
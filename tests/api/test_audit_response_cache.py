@@ -25,6 +25,37 @@ def test_categorize_list_key_extracts_model_label():
     assert Command._categorize(key) == "api:list:arc"
 
 
+def test_categorize_stale_and_lock_keys():
+    assert Command._categorize(":1:api:stale:arc::abcdef0123456789") == "api:stale:arc"
+    assert Command._categorize(":1:api:lock:api:list:arc::4:abcdef0123456789") == "api:lock"
+    assert Command._categorize(":1:api:etag:api:list:arc::4:abcdef0123456789") == "api:etag"
+
+
+def test_categorize_outcome_key():
+    assert Command._categorize(":1:api:outcome:list:issue@series:HIT") == "api:outcome"
+
+
+def test_outcome_report_shows_hit_rate_per_bucket():
+    class _Client:
+        values = {
+            b":1:api:outcome:list:issue@series:HIT": b"3",
+            b":1:api:outcome:list:issue@series:MISS": b"1",
+            b":1:api:outcome:list:issue:MISS": b"2",
+        }
+
+        def get(self, key):
+            return self.values.get(key)
+
+    command = Command(stdout=io.StringIO())
+    command._print_outcome_report(_Client(), list(_Client.values))
+
+    output = command.stdout.getvalue()
+    assert "Hit rate by scope" in output
+    assert "list:issue@series" in output
+    assert "75.0%" in output
+    assert "0.0%" in output
+
+
 def test_categorize_cachever_key():
     assert Command._categorize(":1:cachever:issue") == "cachever"
 
@@ -0,0 +1,108 @@
+import base64
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.hashers import check_password
+from django.urls import reverse
+from rest_framework import status
+
+from api.authentication import _classify_authenticator, reset_local_verifications
+
+
+@pytest.fixture(autouse=True)
+def _fresh_local_verifications():
+    reset_local_verifications()
+    yield
+    reset_local_verifications()
+
+
+@pytest.fixture
+def basic_client(api_client):
+    def login(username, password):
+        credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+        api_client.credentials(HTTP_AUTHORIZATION=f"Basic {credentials}")
+        return api_client
+
+    return login
+
+
+@pytest.fixture
+def hasher_calls():
+    with patch("django.contrib.auth.base_user.check_password", wraps=check_password) as mock:
+        yield mock
+
+
+URL = reverse("api:arc-list")
+
+
+def test_repeat_requests_skip_the_password_hasher(
+    create_user, test_password, basic_client, hasher_calls
+):
+    user = create_user()
+    client = basic_client(user.username, test_password)
+
+    assert client.get(URL).status_code == status.HTTP_200_OK
+    assert client.get(URL).status_code == status.HTTP_200_OK
+
+    assert hasher_calls.call_count == 1
+
+
+def test_verifications_are_shared_through_redis(
+    create_user, test_password, basic_client, hasher_calls
+):
+    user = create_user()
+    client = basic_client(user.username, test_password)
+    client.get(URL)
+    reset_local_verifications()
+
+    assert client.get(URL).status_code == status.HTTP_200_OK
+    assert hasher_calls.call_count == 1
+
+
+def test_failed_attempts_are_always_hashed(create_user, basic_client, hasher_calls):
+    user = create_user()
+    client = basic_client(user.username, "not-the-password")
+
+    assert client.get(URL).status_code == status.HTTP_401_UNAUTHORIZED
+    assert client.get(URL).status_code == status.HTTP_401_UNAUTHORIZED
+    assert hasher_calls.call_count == 2
+
+
+def test_password_change_invalidates_the_cached_verification(
+    create_user, test_password, basic_client
+):
+    user = create_user()
+    client = basic_client(user.username, test_password)
+    client.get(URL)
+
+    user.set_password("a-brand-new-password")
+    user.save()
+
+    assert client.get(URL).status_code == status.HTTP_401_UNAUTHORIZED
+    assert basic_client(user.username, "a-brand-new-password").get(URL).status_code == (
+        status.HTTP_200_OK
+    )
+
+
+def test_deactivation_invalidates_the_cached_verification(create_user, test_password, basic_client):
+    user = create_user()
+    client = basic_client(user.username, test_password)
+    client.get(URL)
+
+    user.is_active = False
+    user.save()
+
+    assert client.get(URL).status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_cached_requests_are_still_counted_as_basic_auth(create_user, test_password, basic_client):
+    user = create_user()
+    client = basic_client(user.username, test_password)
+
+    with patch("api.throttle.record_auth_method_usage") as record:
+        client.get(URL)
+        client.get(URL)
+
+    authenticators = [call.args[0].successful_authenticator for call in record.call_args_list]
+    assert len(authenticators) == 2
+    assert [_classify_authenticator(a) for a in authenticators] == ["basic", "basic"]
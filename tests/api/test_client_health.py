@@ -16,9 +16,10 @@ def _date_str(days_ago: int) -> str:
     return (datetime.now(UTC) - timedelta(days=days_ago)).date().isoformat()
 
 
-def _set_count(scope: str, identity: str, days_ago: int, count: int) -> None:
-    key = f"throttled:{scope}:{identity}:{_date_str(days_ago)}"
-    cache.set(key, count, timeout=60 * 60 * 24 * 35)
+def _set_count(scope: str, username: str, days_ago: int, count: int) -> None:
+    client = cache._cache.get_client(write=True)
+    client.hset(cache.make_key(f"throttled:{scope}:{_date_str(days_ago)}"), username, count)
+    client.sadd(cache.make_key("throttled:scopes"), scope)
 
 
 class DummyUser:
@@ -72,6 +73,19 @@ def test_record_throttled_request_increments_on_repeat():
     assert cache.get(f"throttled:burst:user:{username}:{TODAY}") == 2
 
 
+def test_record_throttled_request_indexes_users_per_scope_and_day():
+    username = _unique()
+    request = RequestFactory().get("/")
+    request.user = DummyUser(username)
+
+    record_throttled_request(request, "sustained")
+    record_throttled_request(request, "sustained")
+
+    client = cache._cache.get_client()
+    assert client.hget(cache.make_key(f"throttled:sustained:{TODAY}"), username) == b"2"
+    assert client.sismember(cache.make_key("throttled:scopes"), "sustained")
+
+
 # ---------------------------------------------------------------------------
 # Integration test — verify a real throttled request is tracked.
 # ---------------------------------------------------------------------------
@@ -110,7 +124,7 @@ def test_exceeding_burst_limit_returns_429_and_is_tracked(create_user, api_clien
 def test_finds_user_with_min_days_at_or_above_threshold():
     username = _unique()
     for days_ago in (0, 1, 2):
-        _set_count("burst", f"user:{username}", days_ago, 60)
+        _set_count("burst", username, days_ago, 60)
 
     offenders = find_repeat_offenders(lookback_days=7, min_days=3, single_day_threshold=50)
 
@@ -125,8 +139,8 @@ def test_ignores_user_with_too_few_days_at_threshold():
     username = _unique()
     # Only 2 of the 3 required days reach the threshold.
     for days_ago in (0, 1):
-        _set_count("burst", f"user:{username}", days_ago, 60)
-    _set_count("burst", f"user:{username}", 2, 5)
+        _set_count("burst", username, days_ago, 60)
+    _set_count("burst", username, 2, 5)
 
     offenders = find_repeat_offenders(lookback_days=7, min_days=3, single_day_threshold=50)
 
@@ -138,7 +152,7 @@ def test_ignores_user_with_many_low_volume_days():
     # shouldn't be flagged - low-volume repeated throttling isn't worth an email.
     username = _unique()
     for days_ago in (0, 1, 2):
-        _set_count("burst", f"user:{username}", days_ago, 3)
+        _set_count("burst", username, days_ago, 3)
 
     offenders = find_repeat_offenders(lookback_days=7, min_days=3, single_day_threshold=50)
 
@@ -149,7 +163,7 @@ def test_single_bad_day_below_extreme_threshold_does_not_trigger_alone():
     # A single day above single_day_threshold but below extreme_day_threshold
     # shouldn't flag an account on its own - it takes min_days separate days.
     username = _unique()
-    _set_count("sustained", f"user:{username}", 0, 90)
+    _set_count("sustained", username, 0, 90)
 
     offenders = find_repeat_offenders(
         lookback_days=7, min_days=3, single_day_threshold=50, extreme_day_threshold=100
@@ -162,7 +176,7 @@ def test_extreme_single_day_triggers_alone():
     # A single day at or above extreme_day_threshold flags the account outright,
     # even though it's only one day (well short of min_days).
     username = _unique()
-    _set_count("sustained", f"user:{username}", 0, 150)
+    _set_count("sustained", username, 0, 150)
 
     offenders = find_repeat_offenders(
         lookback_days=7, min_days=3, single_day_threshold=50, extreme_day_threshold=100
@@ -176,7 +190,7 @@ def test_extreme_single_day_triggers_alone():
 
 def test_ignores_dates_outside_lookback_window():
     username = _unique()
-    _set_count("burst", f"user:{username}", 40, 1000)
+    _set_count("burst", username, 40, 1000)
 
     offenders = find_repeat_offenders(lookback_days=7, min_days=1, single_day_threshold=1)
 
@@ -185,7 +199,9 @@ def test_ignores_dates_outside_lookback_window():
 
 def test_ignores_ip_identities():
     ip = f"203.0.113.{uuid.uuid4().int % 255}"
-    _set_count("burst", f"ip:{ip}", 0, 1000)
+    request = RequestFactory().get("/", REMOTE_ADDR=ip)
+    request.user = DummyUser("irrelevant", is_authenticated=False)
+    record_throttled_request(request, "burst")
 
     offenders = find_repeat_offenders(lookback_days=7, min_days=1, single_day_threshold=1)
 
@@ -194,8 +210,8 @@ def test_ignores_ip_identities():
 
 def test_sums_counts_across_scopes_for_the_same_day():
     username = _unique()
-    _set_count("burst", f"user:{username}", 0, 3)
-    _set_count("sustained", f"user:{username}", 0, 4)
+    _set_count("burst", username, 0, 3)
+    _set_count("sustained", username, 0, 4)
 
     offenders = find_repeat_offenders(lookback_days=7, min_days=1, single_day_threshold=1)
 
@@ -210,7 +226,7 @@ def test_exclude_through_hides_a_day_already_covered_by_a_prior_notice():
     # run's lookback window and would otherwise get reported a second time.
     username = _unique()
     spike_day = (datetime.now(UTC) - timedelta(days=7)).date()
-    _set_count("sustained", f"user:{username}", days_ago=7, count=1000)
+    _set_count("sustained", username, days_ago=7, count=1000)
 
     offenders = find_repeat_offenders(
         lookback_days=7,
@@ -224,7 +240,7 @@ def test_exclude_through_hides_a_day_already_covered_by_a_prior_notice():
 
 def test_exclude_through_does_not_hide_days_after_the_cutoff():
     username = _unique()
-    _set_count("sustained", f"user:{username}", days_ago=0, count=1000)
+    _set_count("sustained", username, days_ago=0, count=1000)
     # Notice cutoff is yesterday, so today's spike is still new and unreported.
     yesterday = (datetime.now(UTC) - timedelta(days=1)).date()
 
@@ -242,7 +258,7 @@ def test_exclude_through_does_not_hide_days_after_the_cutoff():
 def test_exclude_through_only_affects_the_named_user():
     username = _unique()
     other_username = _unique()
-    _set_count("sustained", f"user:{username}", days_ago=0, count=1000)
+    _set_count("sustained", username, days_ago=0, count=1000)
 
     offenders = find_repeat_offenders(
         lookback_days=7,
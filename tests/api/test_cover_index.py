@@ -0,0 +1,49 @@
+from api.cover_index import CoverHashIndex, parse_hash
+
+BASE = "c3d4e1f0a5b69788"
+
+
+def _flip(hash_hex: str, *bits: int) -> str:
+    value = int(hash_hex, 16)
+    for bit in bits:
+        value ^= 1 << bit
+    return f"{value:016x}"
+
+
+def test_parse_hash_rejects_empty_and_malformed_values():
+    assert parse_hash(BASE) == int(BASE, 16)
+    assert parse_hash("") is None
+    assert parse_hash("zzzzzzzzzzzzzzzz") is None
+    assert parse_hash("abc") is None
+
+
+def test_search_returns_matches_nearest_first():
+    index = CoverHashIndex(
+        [
+            (1, BASE),
+            (2, _flip(BASE, 0)),
+            (3, _flip(BASE, 5, 21, 40)),
+            (4, _flip(BASE, 1, 2, 3, 4, 17, 18, 33, 34, 50, 51, 52)),
+        ]
+    )
+    assert index.search(int(BASE, 16), 3) == [(1, 0), (2, 1), (3, 3)]
+
+
+def test_search_finds_matches_spread_across_every_band():
+    # Two bit flips in each 16-bit band: no band matches exactly, so this
+    # only succeeds if neighbouring band values are probed.
+    near = _flip(BASE, 0, 1, 16, 17, 32, 33, 48, 49)
+    index = CoverHashIndex([(1, near)])
+    assert index.search(int(BASE, 16), 8) == [(1, 8)]
+    assert index.search(int(BASE, 16), 7) == []
+
+
+def test_add_replaces_and_remove_drops_an_issue():
+    index = CoverHashIndex([(1, BASE)])
+    index.add(1, _flip(BASE, 63))
+    assert index.search(int(BASE, 16), 0) == []
+    assert index.search(int(BASE, 16), 1) == [(1, 1)]
+
+    index.add(1, "")
+    assert len(index) == 0
+    assert index.search(int(BASE, 16), 10) == []
@@ -1,6 +1,8 @@
+import time
 from datetime import timedelta
 
 import pytest
+from django.core.cache import cache
 from django.http import HttpResponse
 from django.test import RequestFactory
 from django.urls import reverse
@@ -185,3 +187,36 @@ def test_expired_supporter_gets_default_sustained_limit(create_user, api_client)
 
     assert resp.status_code == status.HTTP_200_OK
     assert resp["X-RateLimit-Sustained-Limit"] == "5000"
+
+
+# ---------------------------------------------------------------------------
+# Redis GCRA backend
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.django_db
+def test_burst_limit_refuses_with_retry_after(create_user, api_client):
+    user = create_user()
+    api_client.force_authenticate(user=user)
+    url = reverse("api:arc-list")
+
+    for _ in range(20):
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+    resp = api_client.get(url)
+
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert resp["X-RateLimit-Burst-Remaining"] == "0"
+    assert 0 < int(resp["Retry-After"]) <= 3
+
+
+@pytest.mark.django_db
+def test_throttle_state_is_a_single_timestamp(create_user, api_client):
+    """The whole sustained history is one small value, not a list of timestamps."""
+    user = create_user()
+    api_client.force_authenticate(user=user)
+    for _ in range(3):
+        api_client.get(reverse("api:arc-list"))
+
+    raw = cache._cache.get_client().get(cache.make_key(f"throttle_sustained_{user.pk}"))
+
+    assert int(raw) > time.time() * 1000
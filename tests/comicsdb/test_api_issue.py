@@ -1,4 +1,5 @@
-from datetime import date
+import json
+from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
@@ -6,7 +7,11 @@ from django.urls import reverse
 from django.utils import timezone
 from djmoney.money import Money
 from rest_framework import status
+from rest_framework.pagination import PageNumberPagination
 
+from api.cache import get_model_version
+from api.cover_index import COVER_HASH_VERSION_LABEL, get_cover_index, reset_cover_index
+from api.pagination import _encode_position
 from comicsdb.models import Credits, Issue
 from comicsdb.models.arc import Arc
 from comicsdb.models.character import Character
@@ -463,3 +468,225 @@ def test_filter_by_upc_starts_with_no_match(api_client_with_credentials, basic_i
     )
     assert resp.status_code == status.HTTP_200_OK
     assert resp.data["count"] == 0
+
+
+@pytest.fixture
+def fresh_cover_index():
+    reset_cover_index()
+    yield
+    reset_cover_index()
+
+
+def test_cover_search_returns_near_matches(
+    api_client_with_credentials, list_of_issues, fresh_cover_index
+):
+    issues = list(Issue.objects.order_by("pk")[:3])
+    # cover_hash is recomputed from the image on save(), so seed it directly.
+    Issue.objects.filter(pk=issues[0].pk).update(cover_hash="ffd5a1c0b0e08080")
+    Issue.objects.filter(pk=issues[1].pk).update(cover_hash="ffd5a1c0b0e08081")
+    Issue.objects.filter(pk=issues[2].pk).update(cover_hash="0000000000000000")
+
+    resp = api_client_with_credentials.get(
+        reverse("api:issue-cover-search"), {"hash": "ffd5a1c0b0e08080", "max_distance": 2}
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.data["count"] == 2
+    assert [(r["id"], r["distance"]) for r in resp.data["results"]] == [
+        (issues[0].pk, 0),
+        (issues[1].pk, 1),
+    ]
+
+
+def test_cover_hash_change_is_published_after_commit(
+    list_of_issues, fresh_cover_index, django_capture_on_commit_callbacks
+):
+    issue = Issue.objects.order_by("pk").first()
+    Issue.objects.filter(pk=issue.pk).update(cover_hash="ffd5a1c0b0e08080")
+    issue.refresh_from_db()
+    assert len(get_cover_index()) == 1
+    version = get_model_version(COVER_HASH_VERSION_LABEL)
+
+    # Without an image, save() clears the cover hash.
+    with django_capture_on_commit_callbacks() as callbacks:
+        issue.save()
+    assert issue.cover_hash == ""
+    assert get_model_version(COVER_HASH_VERSION_LABEL) == version
+    assert len(get_cover_index()) == 1
+
+    for callback in callbacks:
+        callback()
+    assert get_model_version(COVER_HASH_VERSION_LABEL) == version + 1
+    assert len(get_cover_index()) == 0
+
+
+def test_cover_search_rejects_invalid_params(api_client_with_credentials, fresh_cover_index):
+    url = reverse("api:issue-cover-search")
+    assert api_client_with_credentials.get(url, {"hash": "xyz"}).status_code == (
+        status.HTTP_400_BAD_REQUEST
+    )
+    resp = api_client_with_credentials.get(url, {"hash": "ffd5a1c0b0e08080", "max_distance": 11})
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def _read_ndjson(resp) -> list[dict]:
+    body = b"".join(resp.streaming_content).decode()
+    return [json.loads(line) for line in body.splitlines()]
+
+
+def test_export_streams_issues_as_ndjson(api_client_with_credentials, list_of_issues):
+    resp = api_client_with_credentials.get(reverse("api:issue-export"))
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["Content-Type"] == "application/x-ndjson"
+    rows = _read_ndjson(resp)
+    assert [row["id"] for row in rows] == list(
+        Issue.objects.order_by("pk").values_list("pk", flat=True)
+    )
+    # Rows use the retrieve shape, not the compact list one.
+    assert {"arcs", "credits", "variants", "resource_url"} <= set(rows[0])
+
+
+def test_export_honours_modified_gt(api_client_with_credentials, list_of_issues):
+    cutoff = timezone.now()
+    issue = Issue.objects.order_by("pk").last()
+    Issue.objects.filter(pk=issue.pk).update(modified=cutoff + timedelta(seconds=1))
+    resp = api_client_with_credentials.get(
+        reverse("api:issue-export"), {"modified_gt": cutoff.isoformat()}
+    )
+    assert [row["id"] for row in _read_ndjson(resp)] == [issue.pk]
+
+
+def test_unauthorized_export(db, api_client):
+    resp = api_client.get(reverse("api:issue-export"))
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def _walk_cursor_pages(client, url, params=None) -> list[int]:
+    ids = []
+    resp = client.get(url, {**(params or {}), "cursor": ""})
+    while True:
+        assert resp.status_code == status.HTTP_200_OK
+        assert "count" not in resp.data
+        ids.extend(row["id"] for row in resp.data["results"])
+        if resp.data["next"] is None:
+            return ids
+        resp = client.get(resp.data["next"])
+
+
+def test_cursor_pagination_matches_page_number_order(
+    api_client_with_credentials, list_of_issues, monkeypatch
+):
+    monkeypatch.setattr(PageNumberPagination, "page_size", 7)
+    # A NULL store_date sorts last among equal cover dates and must not be
+    # skipped or repeated across a page boundary.
+    Issue.objects.filter(number="3").update(store_date=None)
+    url = reverse("api:issue-list")
+
+    expected = []
+    page = 1
+    while True:
+        resp = api_client_with_credentials.get(url, {"page": page})
+        expected.extend(row["id"] for row in resp.data["results"])
+        if resp.data["next"] is None:
+            break
+        page += 1
+
+    assert len(expected) == Issue.objects.count()
+    assert _walk_cursor_pages(api_client_with_credentials, url) == expected
+
+
+def test_cursor_pagination_applies_filters(api_client_with_credentials, list_of_issues):
+    resp = api_client_with_credentials.get(reverse("api:issue-list"), {"number": "7", "cursor": ""})
+    assert resp.status_code == status.HTTP_200_OK
+    assert [row["number"] for row in resp.data["results"]] == ["7"]
+    assert resp.data["next"] is None
+
+
+def test_invalid_cursor_returns_404(api_client_with_credentials, list_of_issues):
+    resp = api_client_with_credentials.get(reverse("api:issue-list"), {"cursor": "not-a-cursor"})
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.parametrize(
+    "position",
+    [
+        ["Final Crisis", "not-a-date", None, "1", 5],
+        ["Final Crisis", "2020-01-01", None, "1", "x"],
+        ["Final Crisis", "2020-01-01", None, "1", [1]],
+    ],
+)
+def test_tampered_cursor_returns_404(api_client_with_credentials, list_of_issues, position):
+    resp = api_client_with_credentials.get(
+        reverse("api:issue-list"), {"cursor": _encode_position(position)}
+    )
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_bulk_lookup_resolves_mixed_identifiers(api_client_with_credentials, list_of_issues):
+    first, second, third = Issue.objects.order_by("pk")[:3]
+    Issue.objects.filter(pk=first.pk).update(upc="76194137738400111")
+    Issue.objects.filter(pk=second.pk).update(cv_id=4242)
+    Issue.objects.filter(pk=third.pk).update(gcd_id=99, isbn="9781401245245")
+
+    resp = api_client_with_credentials.post(
+        reverse("api:issue-bulk-lookup"),
+        {
+            "id": [first.pk, 999999],
+            "upc": ["76194137738400111"],
+            "cv_id": [4242],
+            "gcd_id": [99],
+            "isbn": ["9781401245245", "0000000000"],
+        },
+        format="json",
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+    data = resp.json()
+    assert [issue["id"] for issue in data["id"][str(first.pk)]] == [first.pk]
+    assert data["id"]["999999"] == []
+    assert data["upc"]["76194137738400111"][0]["id"] == first.pk
+    assert data["cv_id"]["4242"][0]["id"] == second.pk
+    assert data["gcd_id"]["99"][0]["id"] == third.pk
+    assert data["isbn"]["9781401245245"][0]["id"] == third.pk
+    assert data["isbn"]["0000000000"] == []
+    # Compact list shape.
+    assert set(data["cv_id"]["4242"][0]) == {
+        "id",
+        "series",
+        "number",
+        "issue",
+        "cover_date",
+        "store_date",
+        "image",
+        "cover_hash",
+        "modified",
+    }
+
+
+def test_bulk_lookup_uses_one_query_per_identifier_type(
+    api_client_with_credentials, list_of_issues, django_assert_max_num_queries
+):
+    issue_ids = list(Issue.objects.values_list("pk", flat=True))
+    url = reverse("api:issue-bulk-lookup")
+    with django_assert_max_num_queries(8) as few:
+        api_client_with_credentials.post(url, {"id": issue_ids[:1]}, format="json")
+    with django_assert_max_num_queries(len(few)):
+        api_client_with_credentials.post(url, {"id": issue_ids}, format="json")
+
+
+def test_bulk_lookup_rejects_empty_and_oversized_batches(api_client_with_credentials):
+    url = reverse("api:issue-bulk-lookup")
+    resp = api_client_with_credentials.post(url, {}, format="json")
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+    resp = api_client_with_credentials.post(url, {"id": list(range(1, 102))}, format="json")
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_bulk_lookup_charges_throttle_per_batch(api_client_with_credentials):
+    url = reverse("api:issue-bulk-lookup")
+    small = api_client_with_credentials.post(url, {"id": [1]}, format="json")
+    large = api_client_with_credentials.post(url, {"id": list(range(1, 101))}, format="json")
+
+    assert (
+        int(small["X-RateLimit-Burst-Remaining"]) - int(large["X-RateLimit-Burst-Remaining"]) == 4
+    )
@@ -1,5 +1,5 @@
 import uuid
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from django.core.cache.backends.locmem import LocMemCache
@@ -11,7 +11,8 @@ from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.request import Request
 
-from api import views as api_views
+from api import cache as api_cache, views as api_views
+from api.cache import CacheStatus, ModelLabel, bump_model_version, get_or_render
 from api.views import CollectionViewSet, PullListViewSet, WishListViewSet
 from comicsdb.models import Credits, Issue, Variant
 
@@ -22,7 +23,7 @@ def local_cache():
     behavior aren't affected by concurrent xdist workers sharing the real
     Redis backend (the `cachever:*` counters are global-per-model)."""
     test_cache = LocMemCache(f"test-api-response-caching-{uuid.uuid4()}", {})
-    with patch("api.views.cache", test_cache), patch("api.cache.cache", test_cache):
+    with patch("api.cache.cache", test_cache):
         yield test_cache
 
 
@@ -635,3 +636,243 @@ def test_user_scoped_viewsets_are_not_list_cached():
     that intentional exclusion; see api/views.py."""
     for viewset in (CollectionViewSet, PullListViewSet, WishListViewSet):
         assert getattr(viewset, "cache_model_label", None) is None
+
+
+def test_get_or_render_serves_stale_while_another_worker_renders(local_cache):
+    render = MagicMock(return_value={"fresh": True})
+    local_cache.set("stale-key", {"fresh": False})
+    local_cache.add("api:lock:fresh-key", 1)
+
+    payload, cache_status = get_or_render("fresh-key", render, 60, stale_key="stale-key")
+
+    assert payload == {"fresh": False}
+    assert cache_status == CacheStatus.STALE
+    render.assert_not_called()
+
+
+def test_get_or_render_waits_for_concurrent_render(local_cache):
+    render = MagicMock(return_value={"mine": True})
+    local_cache.add("api:lock:key", 1)
+
+    def other_worker_finishes(_seconds):
+        local_cache.set("key", {"theirs": True})
+
+    with patch("api.cache.time.sleep", side_effect=other_worker_finishes):
+        payload, cache_status = get_or_render("key", render, 60)
+
+    assert payload == {"theirs": True}
+    assert cache_status == CacheStatus.HIT
+    render.assert_not_called()
+
+
+def test_get_or_render_renders_itself_when_wait_times_out(local_cache):
+    local_cache.add("api:lock:key", 1)
+
+    with (
+        patch("api.cache.RENDER_WAIT_TIMEOUT", 0),
+        patch("api.cache.time.sleep"),
+    ):
+        payload, cache_status = get_or_render("key", lambda: {"mine": True}, 60)
+
+    assert payload == {"mine": True}
+    assert cache_status == CacheStatus.MISS
+
+
+def test_get_or_render_does_not_cache_uncacheable_render(local_cache):
+    payload, cache_status = get_or_render("key", lambda: None, 60, stale_key="stale")
+
+    assert payload is None
+    assert cache_status == CacheStatus.MISS
+    assert local_cache.get("key") is None
+    assert local_cache.get("stale") is None
+    assert local_cache.get("api:lock:key") is None
+
+
+def test_arc_list_serves_stale_payload_during_rerender(
+    api_client_with_credentials, wwh_arc, local_cache
+):
+    url = reverse("api:arc-list")
+    resp = api_client_with_credentials.get(url)
+    assert resp["X-Cache"] == "MISS"
+
+    bump_model_version(ModelLabel.ARC)
+    # Another worker holds the lock for the new generation's key.
+    with patch.object(api_cache.cache, "add", return_value=False):
+        resp = api_client_with_credentials.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["X-Cache"] == "STALE"
+    assert resp.json()["results"][0]["name"] == wwh_arc.name
+
+
+def _add_issue(series, user, number):
+    return Issue.objects.create(
+        series=series,
+        number=number,
+        slug=f"{series.slug}-{number}",
+        cover_date=timezone.now().date(),
+        edited_by=user,
+        created_by=user,
+    )
+
+
+def test_series_scoped_issue_list_survives_edits_to_other_series(
+    api_client_with_credentials, create_user, basic_issue, fc_series, omnibus_series, local_cache
+):
+    url = reverse("api:issue-list")
+    params = {"series_id": fc_series.pk}
+    assert api_client_with_credentials.get(url, params)["X-Cache"] == "MISS"
+
+    _add_issue(omnibus_series, create_user(), "1")
+    resp = api_client_with_credentials.get(url, params)
+    assert resp["X-Cache"] == "HIT"
+
+    _add_issue(fc_series, create_user(), "2")
+    resp = api_client_with_credentials.get(url, params)
+    assert resp["X-Cache"] == "MISS"
+    assert resp.json()["count"] == 2
+
+
+def test_unscoped_issue_list_still_invalidates_on_any_issue_edit(
+    api_client_with_credentials, create_user, basic_issue, omnibus_series, local_cache
+):
+    url = reverse("api:issue-list")
+    assert api_client_with_credentials.get(url)["X-Cache"] == "MISS"
+
+    _add_issue(omnibus_series, create_user(), "1")
+    resp = api_client_with_credentials.get(url)
+    assert resp["X-Cache"] == "MISS"
+    assert resp.json()["count"] == 2
+
+
+def test_publisher_series_list_survives_issue_edits_under_other_publisher(
+    api_client_with_credentials, create_user, dc_comics, fc_series, omnibus_series, local_cache
+):
+    url = reverse("api:publisher-series-list", kwargs={"pk": dc_comics.pk})
+    assert api_client_with_credentials.get(url)["X-Cache"] == "MISS"
+
+    _add_issue(omnibus_series, create_user(), "1")
+    assert api_client_with_credentials.get(url)["X-Cache"] == "HIT"
+
+    _add_issue(fc_series, create_user(), "1")
+    resp = api_client_with_credentials.get(url)
+    assert resp["X-Cache"] == "MISS"
+    assert resp.json()["results"][0]["issue_count"] == 1
+
+
+def test_moving_series_invalidates_old_publishers_scoped_list(
+    api_client_with_credentials, dc_comics, marvel, fc_series, local_cache
+):
+    url = reverse("api:series-list")
+    params = {"publisher_id": dc_comics.pk}
+    assert api_client_with_credentials.get(url, params).json()["count"] == 1
+
+    fc_series.publisher = marvel
+    fc_series.save()
+
+    resp = api_client_with_credentials.get(url, params)
+    assert resp["X-Cache"] == "MISS"
+    assert resp.json()["count"] == 0
+
+
+def test_cache_outcomes_are_counted_per_scope(api_client_with_credentials, fc_series, local_cache):
+    url = reverse("api:issue-list")
+    api_client_with_credentials.get(url, {"series_id": fc_series.pk})
+    api_client_with_credentials.get(url, {"series_id": fc_series.pk})
+    api_client_with_credentials.get(url)
+
+    assert local_cache.get("api:outcome:list:issue@series:MISS") == 1
+    assert local_cache.get("api:outcome:list:issue@series:HIT") == 1
+    assert local_cache.get("api:outcome:list:issue:MISS") == 1
+
+
+def test_issue_retrieve_hit_serves_the_cached_bytes(
+    api_client_with_credentials, basic_issue, local_cache
+):
+    url = reverse("api:issue-detail", kwargs={"pk": basic_issue.pk})
+    miss = api_client_with_credentials.get(url)
+    with patch.object(api_views.IssueViewSet, "get_serializer") as get_serializer:
+        hit = api_client_with_credentials.get(url)
+
+    get_serializer.assert_not_called()
+    assert hit["X-Cache"] == "HIT"
+    assert hit.content == miss.content
+    assert hit["Content-Type"] == "application/json"
+    assert hit["ETag"] == miss["ETag"]
+
+
+def test_large_cached_bodies_are_compressed(api_client_with_credentials, wwh_arc, local_cache):
+    with patch.object(api_cache, "COMPRESS_MIN_BYTES", 1):
+        resp = api_client_with_credentials.get(reverse("api:arc-list"))
+
+    # LocMemCache stores keys as ":<version>:<key>".
+    (key,) = (key[3:] for key in local_cache._cache if key.startswith(":1:api:list:arc:"))
+    entry = local_cache.get(key)
+    assert entry.compressed
+    assert entry.body() == resp.content
+    assert api_client_with_credentials.get(reverse("api:arc-list")).content == resp.content
+
+
+def test_browsable_api_responses_are_not_cached(api_client_with_credentials, wwh_arc, local_cache):
+    url = reverse("api:arc-list")
+    resp = api_client_with_credentials.get(url, HTTP_ACCEPT="text/html")
+    assert resp.status_code == status.HTTP_200_OK
+    assert "X-Cache" not in resp
+    assert api_client_with_credentials.get(url)["X-Cache"] == "MISS"
+
+
+def test_arc_list_if_none_match_returns_304_without_rendering(
+    api_client_with_credentials, wwh_arc, local_cache
+):
+    url = reverse("api:arc-list")
+    etag = api_client_with_credentials.get(url)["ETag"]
+
+    with patch.object(api_views.ArcViewSet, "paginate_queryset") as paginate_queryset:
+        resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    paginate_queryset.assert_not_called()
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+    assert resp["ETag"] == etag
+    assert resp.content == b""
+
+
+def test_arc_list_if_none_match_after_change_returns_new_body(
+    api_client_with_credentials, wwh_arc, local_cache
+):
+    url = reverse("api:arc-list")
+    etag = api_client_with_credentials.get(url)["ETag"]
+
+    wwh_arc.name = "Renamed"
+    wwh_arc.save()
+
+    resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["ETag"] != etag
+    assert resp.json()["results"][0]["name"] == "Renamed"
+
+
+def test_arc_issue_list_if_none_match_returns_304(
+    api_client_with_credentials, issue_with_arc, fc_arc, local_cache
+):
+    url = reverse("api:arc-issue-list", kwargs={"pk": fc_arc.pk})
+    etag = api_client_with_credentials.get(url)["ETag"]
+
+    resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=f'W/{etag}, "other"')
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_not_modified_response_is_refunded_from_sustained_limit(
+    api_client_with_credentials, wwh_arc, local_cache
+):
+    url = reverse("api:arc-list")
+    first = api_client_with_credentials.get(url)
+    remaining = int(first["X-RateLimit-Sustained-Remaining"])
+    burst_remaining = int(first["X-RateLimit-Burst-Remaining"])
+
+    resp = api_client_with_credentials.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+    assert int(resp["X-RateLimit-Sustained-Remaining"]) == remaining
+    assert int(resp["X-RateLimit-Burst-Remaining"]) == burst_remaining - 1
+
+    resp = api_client_with_credentials.get(url)
+    assert int(resp["X-RateLimit-Sustained-Remaining"]) == remaining - 1
@@ -1,3 +1,4 @@
+import json
 import operator
 from functools import reduce
 from urllib.parse import quote_plus
@@ -386,3 +387,11 @@ def test_list_series_year_end_set(
     assert resp.status_code == status.HTTP_200_OK
     completed = next(r for r in resp.data["results"] if r["year_end"] is not None)
     assert completed["year_end"] == 2005
+
+
+def test_export_streams_series_as_ndjson(api_client_with_credentials, fc_series, bat_sups_series):
+    resp = api_client_with_credentials.get(reverse("api:series-export"))
+    assert resp.status_code == status.HTTP_200_OK
+    rows = [json.loads(line) for line in b"".join(resp.streaming_content).decode().splitlines()]
+    assert [row["id"] for row in rows] == sorted([fc_series.pk, bat_sups_series.pk])
+    assert rows[0]["issue_count"] == 0
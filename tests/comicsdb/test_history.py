@@ -1,7 +1,13 @@
 """Tests for django-simple-history integration."""
 
+from datetime import date
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import RequestFactory
+from django.urls import reverse
+from djmoney.money import Money
 
 from comicsdb.models import (
     Arc,
@@ -928,3 +934,125 @@ def test_fk_and_m2m_changes_together(create_user, john_byrne):
     character.save()
 
     assert character.history.count() == 3  # Create + M2M + FK change
+
+
+# Stored Delta Tests
+
+
+def test_history_delta_stored_on_write(create_user, dc_comics, marvel):
+    """Test that each history record stores its changes against the previous one."""
+    user = create_user()
+    universe = Universe.objects.create(
+        name="Test Universe",
+        slug="test-universe",
+        publisher=dc_comics,
+        created_by=user,
+        edited_by=user,
+    )
+    universe.publisher = marvel
+    universe.name = "Renamed Universe"
+    universe.save()
+
+    latest, first = universe.history.all()
+
+    assert first.history_delta is None
+    assert latest.history_delta == [
+        ["name", "Test Universe", "Renamed Universe"],
+        ["publisher", dc_comics.id, marvel.id],
+    ]
+
+
+def test_history_delta_stores_m2m_changes(create_user, john_byrne):
+    """Test that M2M changes are stored once the record's M2M rows exist."""
+    user = create_user()
+    character = Character.objects.create(
+        name="Test Character",
+        slug="test-character",
+        created_by=user,
+        edited_by=user,
+    )
+
+    character.creators.add(john_byrne)
+
+    latest = character.history.first()
+    expected = [
+        [change.field, change.old, change.new]
+        for change in latest.diff_against(latest.get_previous_record()).changes
+    ]
+    assert latest.history_delta == expected
+    assert [field for field, _, _ in latest.history_delta] == ["creators"]
+
+
+def test_stored_delta_restores_dates_and_money(create_user, fc_series):
+    """Test that dates and prices come back from the stored delta as the objects
+    diff_against() returns, so the history page formats them the same way."""
+    user = create_user()
+    issue = Issue.objects.create(
+        series=fc_series,
+        number="1",
+        slug=f"{fc_series.slug}-1",
+        cover_date=date(2024, 1, 1),
+        price=Money("3.99", "USD"),
+        created_by=user,
+        edited_by=user,
+    )
+    issue.cover_date = date(2024, 2, 1)
+    issue.price = Money("4.99", "USD")
+    issue.save()
+
+    latest = issue.history.first()
+    latest.refresh_from_db()
+
+    expected = latest.diff_against(latest.get_previous_record()).changes
+    assert latest.stored_delta.changes == expected
+    changes = {change.field: change for change in latest.stored_delta.changes}
+    assert changes["cover_date"].old == date(2024, 1, 1)
+    assert changes["price"].new == Money("4.99", "USD")
+
+
+def test_backfill_history_deltas(create_user, dc_comics, marvel):
+    """Test that the backfill command fills in records written without a delta."""
+    user = create_user()
+    universe = Universe.objects.create(
+        name="Test Universe",
+        slug="test-universe",
+        publisher=dc_comics,
+        created_by=user,
+        edited_by=user,
+    )
+    universe.publisher = marvel
+    universe.save()
+    universe.history.update(history_delta=None)
+
+    out = StringIO()
+    call_command("backfill_history_deltas", model=["universe"], stdout=out)
+
+    assert "Stored 1 universe history deltas" in out.getvalue()
+    latest, first = universe.history.all()
+    assert first.history_delta is None
+    assert latest.history_delta == [["publisher", dc_comics.id, marvel.id]]
+
+
+def test_history_page_does_not_diff_records(
+    create_user, client, john_byrne, django_assert_max_num_queries
+):
+    """Test that the history page reads stored deltas instead of diffing each
+    record, which for a model with M2M history was a query per field per record."""
+    user = create_user()
+    character = Character.objects.create(
+        name="Test Character",
+        slug="test-character",
+        created_by=user,
+        edited_by=user,
+    )
+    character.creators.add(john_byrne)
+    for i in range(20):
+        character.name = f"Test Character {i}"
+        character.save()
+    client.force_login(user)
+
+    with django_assert_max_num_queries(10):
+        resp = client.get(reverse("character:history", args=[character.slug]))
+
+    assert resp.status_code == 200
+    assert resp.context["history_list"][0].delta.changes[0].new == "Test Character 19"
@@ -1,6 +1,9 @@
+from django.core.cache import cache
 from django.urls import reverse
 from pytest_django.asserts import assertTemplateUsed
 
+from comicsdb.views.statistics import CACHE_KEY
+
 HTML_OK_CODE = 200
 HTML_REDIRECT = 302
 
@@ -23,6 +26,16 @@ def test_statistics_view_accessible_when_logged_in(auto_login_user):
     assert resp.status_code == HTML_OK_CODE
 
 
+def test_statistics_view_totals_come_from_daily_rollup(auto_login_user, list_of_issues):
+    cache.delete(CACHE_KEY)
+    client, _ = auto_login_user()
+    resp = client.get(reverse("statistics"))
+    assert resp.status_code == HTML_OK_CODE
+    assert resp.context["issues_total"] == 35
+    assert resp.context["series_total"] == 1
+    assert resp.context["publishers_total"] == 1
+
+
 def test_view_uses_correct_template(db, client):
     resp = client.get(reverse("home"))
     assert resp.status_code == HTML_OK_CODE
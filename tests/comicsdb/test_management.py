@@ -1,3 +1,5 @@
+from io import StringIO
+
 import pytest
 from django.core.management import CommandError, call_command
 from django.utils import timezone
@@ -9,6 +11,7 @@ from comicsdb.models.creator import Creator
 from comicsdb.models.credits import Credits, Role
 from comicsdb.models.issue import Issue
 from comicsdb.models.series import Series
+from comicsdb.models.stats import CreatorStats, DailyCatalogStats, PublisherStats, SeriesStats
 from comicsdb.models.team import Team
 from comicsdb.models.universe import Universe
 from users.models import CustomUser
@@ -352,3 +355,42 @@ def test_add_universe_to_series_empty_series(
 
     # Should not raise error, just exit gracefully
     call_command("add_universe_to_series", series=empty_series.id, universe=earth_2_universe.id)
+
+
+def test_rebuild_stats_repairs_drift(basic_issue: Issue, john_byrne: Creator, dc_comics) -> None:
+    Credits.objects.create(issue=basic_issue, creator=john_byrne)
+    SeriesStats.objects.all().delete()
+    CreatorStats.objects.update(credit_count=42)
+    PublisherStats.objects.update(series_count=0)
+
+    call_command("rebuild_stats")
+
+    assert SeriesStats.objects.get(series=basic_issue.series).issue_count == 1
+    assert CreatorStats.objects.get(creator=john_byrne).credit_count == 1
+    assert PublisherStats.objects.get(publisher=dc_comics).series_count == 1
+
+
+def test_rebuild_stats_single_model(basic_issue: Issue, john_byrne: Creator) -> None:
+    SeriesStats.objects.all().delete()
+    CreatorStats.objects.update(credit_count=42)
+
+    call_command("rebuild_stats", model=["series"])
+
+    assert SeriesStats.objects.get(series=basic_issue.series).issue_count == 1
+    assert CreatorStats.objects.get(creator=john_byrne).credit_count == 42
+
+
+def test_rebuild_stats_daily(list_of_issues, dc_comics) -> None:
+    DailyCatalogStats.objects.all().delete()
+
+    call_command("rebuild_stats", model=["daily"])
+
+    assert DailyCatalogStats.totals([DailyCatalogStats.Kind.ISSUE]) == {"issue": 35}
+    assert DailyCatalogStats.objects.get(kind="issue").publisher == dc_comics
+
+
+def test_annual_stats_reads_daily_rollup(list_of_issues) -> None:
+    out = StringIO()
+    call_command("annual_stats", timezone.localdate().year, stdout=out)
+    assert "Issue: 35" in out.getvalue()
+    assert "Series: 1" in out.getvalue()
@@ -15,6 +15,7 @@ from comicsdb.models import (
     Team,
     Universe,
 )
+from comicsdb.models.announcement import reset_announcement_cache
 from comicsdb.models.common import generate_slug_from_name
 from comicsdb.models.genre import Genre
 
@@ -27,6 +28,25 @@ def test_announcement_model(announcement):
     assert announcement.active_announcements()
 
 
+def test_cached_active_announcements_skip_the_database(announcement, django_assert_num_queries):
+    reset_announcement_cache()
+    assert Announcement.cached_active_announcements() == [announcement]
+
+    with django_assert_num_queries(0):
+        assert Announcement.cached_active_announcements() == [announcement]
+
+
+def test_announcement_changes_refresh_the_cache(announcement, django_capture_on_commit_callbacks):
+    reset_announcement_cache()
+    Announcement.cached_active_announcements()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        announcement.active = False
+        announcement.save()
+
+    assert Announcement.cached_active_announcements() == []
+
+
 def test_team_creation(avengers):
     assert isinstance(avengers, Team)
     assert str(avengers) == avengers.name
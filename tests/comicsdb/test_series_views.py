@@ -70,7 +70,7 @@ def test_series_detail_average_rating_no_ratings(sandman_series, auto_login_user
     resp = client.get(f"/series/{sandman_series.slug}/")
     assert resp.status_code == HTML_OK_CODE
     assert resp.context["series"].average_rating is None
-    assert resp.context["series"].rating_count is None
+    assert resp.context["series"].rating_count == 0
 
 
 def test_series_detail_average_rating_across_issues(sandman_series, auto_login_user, create_user):
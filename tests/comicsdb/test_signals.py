@@ -1,14 +1,29 @@
 from datetime import timedelta
+from decimal import Decimal
 from unittest.mock import MagicMock
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from comicsdb.models import Arc, Character, Issue, Series, Team
+from comicsdb.models import (
+    Arc,
+    Character,
+    CreatorStats,
+    Credits,
+    DailyCatalogStats,
+    Issue,
+    PublisherStats,
+    Series,
+    SeriesStats,
+    Team,
+)
 from comicsdb.signals import (
     update_related_modified,
     update_series_modified_on_issue_delete,
     update_series_modified_on_issue_save,
 )
+from issue_ratings.models import IssueRating
 
 
 def test_issue_save_updates_series_modified_on_create(basic_issue):
@@ -218,3 +233,131 @@ def test_deleting_issue_updates_series_modified(basic_issue):
     basic_issue.delete()
     series.refresh_from_db()
     assert series.modified > old_modified
+
+
+def test_series_stats_follow_issue_create_move_and_delete(basic_issue, bat_sups_series):
+    fc_series = basic_issue.series
+    assert SeriesStats.objects.get(series=fc_series).issue_count == 1
+    assert SeriesStats.objects.get(series=bat_sups_series).issue_count == 0
+
+    basic_issue.series = bat_sups_series
+    basic_issue.save()
+    assert SeriesStats.objects.get(series=fc_series).issue_count == 0
+    assert SeriesStats.objects.get(series=bat_sups_series).issue_count == 1
+
+    basic_issue.delete()
+    assert SeriesStats.objects.get(series=bat_sups_series).issue_count == 0
+
+
+def test_series_stats_follow_issue_ratings(create_user, basic_issue):
+    stats = SeriesStats.objects.get(series=basic_issue.series)
+    assert stats.rating_count == 0
+    assert stats.average_rating is None
+
+    IssueRating.objects.create(issue=basic_issue, user=create_user(), rating=4)
+    rating = IssueRating.objects.create(issue=basic_issue, user=create_user(), rating=1)
+    stats.refresh_from_db()
+    assert stats.rating_count == 2
+    assert stats.average_rating == Decimal("2.50")
+
+    rating.delete()
+    stats.refresh_from_db()
+    assert stats.rating_count == 1
+    assert stats.average_rating == Decimal("4.00")
+
+
+def test_creator_stats_follow_credits(basic_issue, john_byrne, walter_simonson):
+    credit = Credits.objects.create(issue=basic_issue, creator=john_byrne)
+    assert CreatorStats.objects.get(creator=john_byrne).credit_count == 1
+
+    credit.creator = walter_simonson
+    credit.save()
+    assert CreatorStats.objects.get(creator=john_byrne).credit_count == 0
+    assert CreatorStats.objects.get(creator=walter_simonson).credit_count == 1
+
+    credit.delete()
+    assert CreatorStats.objects.get(creator=walter_simonson).credit_count == 0
+
+
+def test_publisher_stats_follow_series(fc_series, bat_sups_series, dc_comics):
+    assert PublisherStats.objects.get(publisher=dc_comics).series_count == 2
+
+    bat_sups_series.delete()
+    assert PublisherStats.objects.get(publisher=dc_comics).series_count == 1
+
+
+def test_deleting_series_removes_its_stats(basic_issue):
+    series = basic_issue.series
+    series.delete()
+    assert not SeriesStats.objects.filter(series_id=series.pk).exists()
+
+
+def test_daily_catalog_stats_follow_issue_create_and_delete(basic_issue, dc_comics):
+    today = timezone.localdate(basic_issue.created_on)
+    row = DailyCatalogStats.objects.get(
+        day=today, kind=DailyCatalogStats.Kind.ISSUE, publisher=dc_comics
+    )
+    assert row.count == 1
+    assert DailyCatalogStats.objects.get(day=today, kind=DailyCatalogStats.Kind.SERIES).count == 1
+
+    basic_issue.delete()
+    row.refresh_from_db()
+    assert row.count == 0
+
+
+def _daily_issue_counts(day):
+    return dict(
+        DailyCatalogStats.objects.filter(day=day, kind=DailyCatalogStats.Kind.ISSUE).values_list(
+            "publisher", "count"
+        )
+    )
+
+
+def test_daily_catalog_stats_follow_series_publisher_change(basic_issue, dc_comics, marvel):
+    today = timezone.localdate(basic_issue.created_on)
+    series = basic_issue.series
+
+    series.publisher = marvel
+    series.save()
+    assert _daily_issue_counts(today) == {dc_comics.pk: 0, marvel.pk: 1}
+
+    basic_issue.delete()
+    assert _daily_issue_counts(today) == {dc_comics.pk: 0, marvel.pk: 0}
+
+
+def test_daily_catalog_stats_follow_issue_series_change(
+    basic_issue, dc_comics, marvel, single_issue_type
+):
+    today = timezone.localdate(basic_issue.created_on)
+    marvel_series = Series.objects.create(
+        name="Marvel Series",
+        slug="marvel-series",
+        publisher=marvel,
+        volume="1",
+        year_began=2020,
+        series_type=single_issue_type,
+        edited_by=basic_issue.edited_by,
+        created_by=basic_issue.created_by,
+    )
+
+    basic_issue.series = marvel_series
+    basic_issue.save()
+    assert _daily_issue_counts(today) == {dc_comics.pk: 0, marvel.pk: 1}
+
+    basic_issue.delete()
+    assert _daily_issue_counts(today) == {dc_comics.pk: 0, marvel.pk: 0}
+
+
+def test_issue_save_reads_its_saved_row_once(basic_issue):
+    basic_issue.number = "1A"
+
+    with CaptureQueriesContext(connection) as ctx:
+        basic_issue.save()
+
+    own_row_reads = [
+        query["sql"]
+        for query in ctx.captured_queries
+        if query["sql"].startswith("SELECT")
+        and 'FROM "comicsdb_issue" WHERE "comicsdb_issue"."id" =' in query["sql"]
+    ]
+    assert len(own_row_reads) == 1
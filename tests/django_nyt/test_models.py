@@ -8,6 +8,7 @@ from django_nyt.models import (
     Notification,
     NotificationType,
     Settings,
+    Subscription,
     _glob_matches_path,
 )
 
@@ -133,3 +134,38 @@ class TestNotificationCreateNotifications:
             "test/event", message="Hello", recipient_users=[other_user]
         )
         assert notifications == []
+
+    def test_sets_latest_on_subscription(self, subscription):
+        notifications = Notification.create_notifications("test/event", message="Hello")
+        subscription.refresh_from_db()
+        assert subscription.latest == notifications[0]
+
+    def test_overlapping_subscriptions_notify_once(
+        self, subscription, nyt_settings
+    ):
+        Subscription.objects.create(
+            settings=nyt_settings,
+            notification_type=subscription.notification_type,
+            object_id="1",
+        )
+        notifications = Notification.create_notifications("test/event", message="Hello")
+        assert len(notifications) == 1
+
+    def test_query_count_is_independent_of_subscribers(
+        self, notification_type, create_user, django_assert_num_queries
+    ):
+        for _ in range(5):
+            Subscription.objects.create(
+                settings=Settings.get_default_settings(create_user()),
+                notification_type=notification_type,
+            )
+
+        # select, insert, bulk update of Subscription.latest
+        with django_assert_num_queries(3):
+            created = Notification.create_notifications("test/event", message="Hello")
+        assert len(created) == 5
+
+        # select, update of the repeated notifications
+        with django_assert_num_queries(2):
+            assert Notification.create_notifications("test/event", message="Hello") == []
+        assert {n.occurrences for n in Notification.objects.all()} == {2}
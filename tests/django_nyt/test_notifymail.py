@@ -0,0 +1,88 @@
+"""Tests for the vendored django_nyt notifymail command."""
+
+import io
+import smtplib
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+
+from django_nyt.management.commands import notifymail
+from django_nyt.models import Notification, Settings, Subscription
+
+pytestmark = pytest.mark.django_db
+
+
+def _notifymail():
+    call_command("notifymail", "--cron", "--domain=example.com", stdout=io.StringIO())
+
+
+@pytest.fixture
+def second_subscription(notification_type, create_user):
+    return Subscription.objects.create(
+        settings=Settings.get_default_settings(create_user()),
+        notification_type=notification_type,
+    )
+
+
+def test_sends_one_digest_per_user(subscription, second_subscription, nyt_user):
+    Notification.create_notifications("test/event", message="First", url="/first/")
+    Notification.create_notifications("test/event", message="Second", url="/second/")
+
+    _notifymail()
+
+    assert len(mail.outbox) == 2
+    digest = next(m for m in mail.outbox if m.to == [nyt_user.email])
+    assert "First" in digest.body
+    assert "https://example.com/second/" in digest.body
+    assert not Notification.objects.filter(is_emailed=False).exists()
+    assert not Subscription.objects.filter(last_sent=None).exists()
+
+    _notifymail()
+    assert len(mail.outbox) == 2
+
+
+def test_query_count_is_independent_of_recipients(
+    subscription, second_subscription, django_assert_num_queries
+):
+    Notification.create_notifications("test/event", message="Hello")
+
+    # pending notifications, then one UPDATE each for notifications and subscriptions
+    with django_assert_num_queries(3):
+        _notifymail()
+    assert len(mail.outbox) == 2
+
+
+def test_smtp_errors_leave_notifications_for_next_run(monkeypatch, subscription):
+    Notification.create_notifications("test/event", message="Hello")
+    attempts = []
+
+    def fail(email, fail_silently=False):
+        attempts.append(email)
+        raise smtplib.SMTPException("unavailable")
+
+    monkeypatch.setattr(notifymail, "SMTP_RETRY_DELAY", 0)
+    monkeypatch.setattr(mail.EmailMessage, "send", fail)
+
+    _notifymail()
+
+    assert len(attempts) == notifymail.SMTP_ATTEMPTS
+    assert Notification.objects.get().is_emailed is False
+
+
+def test_refused_recipients_are_not_retried(monkeypatch, subscription):
+    Notification.create_notifications("test/event", message="Hello")
+    attempts = []
+
+    def refuse(email, fail_silently=False):
+        attempts.append(email)
+        raise smtplib.SMTPRecipientsRefused({email.to[0]: (550, b"No such user")})
+
+    monkeypatch.setattr(mail.EmailMessage, "send", refuse)
+
+    _notifymail()
+    _notifymail()
+
+    assert len(attempts) == 1
+    assert Notification.objects.get().is_emailed is True
+    assert Subscription.objects.get().last_sent is None
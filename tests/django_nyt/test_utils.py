@@ -32,6 +32,31 @@ class TestNotify:
         result = utils.notify("Hello", "no/subscribers")
         assert result == []
 
+    def test_deferred_notifications_are_created_after_commit(
+        self,
+        settings,
+        subscription,
+        nyt_user,
+        create_user,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.NYT_DEFER_NOTIFICATIONS = True
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            result = utils.notify(
+                "Deferred",
+                "test/event",
+                target_object=subscription,
+                filter_exclude={"settings__user": create_user()},
+                recipient_users=[nyt_user],
+            )
+            assert result == []
+            assert not Notification.objects.exists()
+
+        assert len(callbacks) == 1
+        notification = Notification.objects.get()
+        assert notification.user == nyt_user
+        assert notification.message == "Deferred"
+
 
 class TestSubscribe:
     def test_creates_subscription(self, nyt_settings):
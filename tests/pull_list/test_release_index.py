@@ -0,0 +1,173 @@
+"""Tests for the upcoming release index."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from comicsdb.models.issue import Issue
+from pull_list.release_index import (
+    ReleaseWeekIndex,
+    get_release_index,
+    record_release_change,
+    release_week,
+    reset_release_index,
+)
+
+MONDAY = date(2026, 1, 5)
+
+
+def test_release_week_starts_on_monday():
+    assert release_week(date(2026, 1, 7)) == MONDAY
+    assert release_week(MONDAY) == MONDAY
+    assert release_week(date(2026, 1, 11)) == MONDAY
+
+
+def test_issue_ids_intersects_series_and_keeps_display_order():
+    index = ReleaseWeekIndex(
+        MONDAY,
+        [
+            (10, 1, date(2026, 1, 7)),
+            (11, 2, date(2026, 1, 7)),
+            (12, 1, date(2026, 1, 14)),
+            (13, 3, date(2026, 1, 21)),
+        ],
+    )
+
+    assert index.issue_ids({1, 3}, MONDAY) == [10, 12, 13]
+    assert index.issue_ids({1, 2}, date(2026, 1, 8)) == [12]
+    assert index.issue_ids({1, 2, 3}, MONDAY, date(2026, 1, 14)) == [10, 11, 12]
+    assert index.issue_ids(set(), MONDAY) == []
+
+
+def test_covers_only_the_current_week_onwards():
+    index = ReleaseWeekIndex(MONDAY)
+    assert index.covers(MONDAY)
+    assert not index.covers(MONDAY - timedelta(days=1))
+
+
+@pytest.fixture
+def fresh_release_index():
+    """Start from an unused generation, so no snapshot cached in Redis by an
+    earlier test (with since rolled-back rows) can be picked up."""
+    record_release_change()
+    reset_release_index()
+    yield
+    reset_release_index()
+
+
+@pytest.fixture
+def next_week_issue(create_user, pull_list_series):
+    user = create_user()
+    return Issue.objects.create(
+        series=pull_list_series,
+        number="2",
+        slug="pull-list-series-2",
+        cover_date=timezone.localdate(),
+        store_date=timezone.localdate() + timedelta(days=7),
+        edited_by=user,
+        created_by=user,
+    )
+
+
+def test_issue_changes_rebuild_the_index(
+    fresh_release_index, next_week_issue, django_capture_on_commit_callbacks
+):
+    assert next_week_issue.pk in get_release_index()._rank
+
+    next_week_issue.store_date = timezone.localdate() + timedelta(days=14)
+    with django_capture_on_commit_callbacks(execute=True):
+        next_week_issue.save()
+    index = get_release_index()
+    assert index._store_dates[next_week_issue.pk] == next_week_issue.store_date
+
+    with django_capture_on_commit_callbacks(execute=True):
+        next_week_issue.delete()
+    assert next_week_issue.pk not in get_release_index()._rank
+
+
+def test_issue_changes_are_published_after_commit(
+    fresh_release_index, next_week_issue, django_capture_on_commit_callbacks
+):
+    index = get_release_index()
+
+    next_week_issue.store_date = timezone.localdate() + timedelta(days=14)
+    with django_capture_on_commit_callbacks() as callbacks:
+        next_week_issue.save()
+    assert get_release_index() is index
+
+    for callback in callbacks:
+        callback()
+    assert get_release_index() is not index
+
+
+def test_issue_saved_with_a_datetime_store_date(fresh_release_index, create_user, pull_list_series):
+    """DateField keeps an assigned datetime on the instance until it's reloaded."""
+    user = create_user()
+    store_date = timezone.localdate() + timedelta(days=7)
+    issue = Issue.objects.create(
+        series=pull_list_series,
+        number="3",
+        slug="pull-list-series-3",
+        cover_date=timezone.localdate(),
+        store_date=datetime.combine(store_date, datetime.min.time()),
+        edited_by=user,
+        created_by=user,
+    )
+
+    assert get_release_index()._store_dates[issue.pk] == store_date
+
+
+def test_edits_outside_the_upcoming_weeks_keep_the_index(fresh_release_index, pull_list_issue):
+    index = get_release_index()
+
+    pull_list_issue.number = "1A"
+    pull_list_issue.save()
+
+    assert get_release_index() is index
+
+
+def test_issues_action_uses_index_for_upcoming_range(
+    fresh_release_index,
+    api_client,
+    pull_list_user,
+    pull_list_with_series,
+    pull_list_issue,
+    next_week_issue,
+    pull_list_series_2,
+    create_user,
+    django_assert_max_num_queries,
+):
+    user = create_user()
+    Issue.objects.create(
+        series=pull_list_series_2,
+        number="1",
+        slug="not-on-pull-list-1",
+        cover_date=timezone.localdate(),
+        store_date=next_week_issue.store_date,
+        edited_by=user,
+        created_by=user,
+    )
+    get_release_index()
+    api_client.force_authenticate(user=pull_list_user)
+
+    with django_assert_max_num_queries(6):
+        resp = api_client.get(
+            reverse("api:pull_list-issues"),
+            {"store_date_after": timezone.localdate().isoformat()},
+        )
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert [issue["id"] for issue in resp.data["results"]] == [next_week_issue.pk]
+
+
+def test_detail_view_lists_upcoming_issues(
+    fresh_release_index, client, pull_list_user, pull_list_with_series, next_week_issue
+):
+    client.force_login(pull_list_user)
+
+    resp = client.get(reverse("pull-list:detail"))
+
+    assert list(resp.context["upcoming_issues"]) == [next_week_issue]
@@ -0,0 +1,131 @@
+"""Tests for the bulk scrobble action on Collection API."""
+
+from datetime import UTC, datetime
+
+from django.urls import reverse
+from rest_framework import status
+
+from api.v1_0.serializers.collection import BULK_SCROBBLE_MAX_ENTRIES
+from comicsdb.models import SeriesStats
+from issue_ratings.models import IssueRating
+from user_collection.models import CollectionItem, CollectionStats, ReadDate
+
+URL = reverse("api:collection-bulk-scrobble")
+
+
+def test_unauthenticated_bulk_scrobble_requires_auth(api_client, collection_issue_1):
+    resp = api_client.post(URL, [{"issue_id": collection_issue_1.id}], format="json")
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_bulk_scrobble_creates_and_updates_items(
+    api_client, collection_user, collection_item, collection_issue_2
+):
+    """collection_item (issue 1) already exists; issue 2 is new and read twice."""
+    api_client.force_authenticate(user=collection_user)
+
+    resp = api_client.post(
+        URL,
+        [
+            {"issue_id": collection_item.issue_id, "date_read": "2024-01-10T12:00:00Z"},
+            {"issue_id": collection_issue_2.id, "date_read": "2024-02-01T12:00:00Z"},
+            {"issue_id": collection_issue_2.id, "date_read": "2024-03-01T12:00:00Z"},
+        ],
+        format="json",
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.data["created"] == 1
+    assert resp.data["updated"] == 1
+    assert resp.data["read_dates"] == 3
+    assert [(r["issue"]["id"], r["created"]) for r in resp.data["results"]] == [
+        (collection_item.issue_id, False),
+        (collection_issue_2.id, True),
+    ]
+
+    new_item = CollectionItem.objects.get(user=collection_user, issue=collection_issue_2)
+    assert new_item.book_format == CollectionItem.BookFormat.DIGITAL
+    assert new_item.is_read is True
+    assert new_item.date_read == datetime(2024, 3, 1, 12, tzinfo=UTC)
+    assert new_item.get_read_count() == 2
+
+    collection_item.refresh_from_db()
+    assert collection_item.is_read is True
+    assert collection_item.book_format == CollectionItem.BookFormat.PRINT
+    assert collection_item.quantity == 1
+
+
+def test_bulk_scrobble_syncs_ratings(api_client, collection_user, collection_item_read):
+    """The last rating given for an issue wins, and entries without a rating
+    leave an existing one alone."""
+    api_client.force_authenticate(user=collection_user)
+    issue = collection_item_read.issue
+
+    api_client.post(
+        URL,
+        [{"issue_id": issue.id, "rating": 2}, {"issue_id": issue.id, "rating": 5}],
+        format="json",
+    )
+    api_client.post(URL, [{"issue_id": issue.id}], format="json")
+
+    collection_item_read.refresh_from_db()
+    assert collection_item_read.rating == 5
+    assert IssueRating.objects.get(issue=issue, user=collection_user).rating == 5
+    assert SeriesStats.objects.get(series_id=issue.series_id).rating_count == 1
+
+
+def test_bulk_scrobble_drops_collection_stats(api_client, collection_user, collection_issue_1):
+    CollectionStats.for_user(collection_user)
+    api_client.force_authenticate(user=collection_user)
+
+    api_client.post(URL, [{"issue_id": collection_issue_1.id}], format="json")
+
+    assert CollectionStats.for_user(collection_user).read_count == 1
+
+
+def test_bulk_scrobble_unknown_issue_rejects_whole_batch(
+    api_client, collection_user, collection_issue_1
+):
+    api_client.force_authenticate(user=collection_user)
+
+    resp = api_client.post(
+        URL, [{"issue_id": collection_issue_1.id}, {"issue_id": 999999}], format="json"
+    )
+
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert resp.data["missing_issue_ids"] == [999999]
+    assert not CollectionItem.objects.filter(user=collection_user).exists()
+    assert not ReadDate.objects.exists()
+
+
+def test_bulk_scrobble_validates_entries(api_client, collection_user, collection_issue_1):
+    api_client.force_authenticate(user=collection_user)
+
+    assert api_client.post(URL, [], format="json").status_code == status.HTTP_400_BAD_REQUEST
+    resp = api_client.post(URL, [{"issue_id": collection_issue_1.id, "rating": 6}], format="json")
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    resp = api_client.post(
+        URL, [{"issue_id": collection_issue_1.id}] * (BULK_SCROBBLE_MAX_ENTRIES + 1), format="json"
+    )
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_bulk_scrobble_query_count_is_independent_of_size(
+    api_client,
+    collection_user,
+    collection_issue_1,
+    collection_issue_2,
+    django_assert_max_num_queries,
+):
+    api_client.force_authenticate(user=collection_user)
+    entries = [
+        {"issue_id": issue.id, "date_read": f"2024-01-{day:02d}T12:00:00Z", "rating": 4}
+        for day in range(1, 26)
+        for issue in (collection_issue_1, collection_issue_2)
+    ]
+
+    with django_assert_max_num_queries(20):
+        resp = api_client.post(URL, entries, format="json")
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert ReadDate.objects.filter(collection_item__user=collection_user).count() == 50
@@ -0,0 +1,138 @@
+"""Tests for the precomputed CollectionStats snapshot."""
+
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from djmoney.money import Money
+
+from comicsdb.models.creator import Creator
+from comicsdb.models.credits import Credits, Role
+from user_collection.models import CollectionItem, CollectionStats, ReadDate
+
+SNAPSHOT_FIELDS = [
+    "total_items",
+    "total_quantity",
+    "total_value",
+    "read_count",
+    "format_counts",
+    "series_counts",
+    "publisher_counts",
+    "series_type_counts",
+    "writer_counts",
+    "artist_counts",
+    "reads_by_day",
+]
+
+
+def _values(stats):
+    return {field: getattr(stats, field) for field in SNAPSHOT_FIELDS}
+
+
+@pytest.fixture
+def credited_issue(create_user, collection_issue_1):
+    """collection_issue_1 with a writer who is also its penciller."""
+    user = create_user()
+    creator = Creator.objects.create(
+        name="Stats Creator", slug="stats-creator", edited_by=user, created_by=user
+    )
+    credit = Credits.objects.create(issue=collection_issue_1, creator=creator)
+    credit.role.add(
+        Role.objects.create(name="Writer", order=10),
+        Role.objects.create(name="Penciller", order=20),
+    )
+    return collection_issue_1
+
+
+def test_for_user_builds_missing_snapshot(collection_user, collection_item_with_details):
+    assert not CollectionStats.objects.filter(user=collection_user).exists()
+
+    stats = CollectionStats.for_user(collection_user)
+
+    assert stats.total_items == 1
+    assert stats.total_quantity == 2
+    assert stats.total_value == Decimal("4.99")
+    assert stats.format_counts == {CollectionItem.BookFormat.BOTH: 1}
+    assert stats.series_counts == {str(collection_item_with_details.issue.series_id): 1}
+
+
+def test_for_user_rebuilds_stale_snapshot(collection_user, collection_item):
+    stats = CollectionStats.for_user(collection_user)
+    CollectionStats.objects.filter(pk=stats.pk).update(
+        total_items=99, rebuilt_on=timezone.now() - CollectionStats.MAX_AGE - timedelta(hours=1)
+    )
+
+    assert CollectionStats.for_user(collection_user).total_items == 1
+
+
+def test_changes_are_applied_incrementally(
+    collection_user, credited_issue, collection_issue_2, django_assert_max_num_queries
+):
+    CollectionStats.for_user(collection_user)
+
+    item = CollectionItem.objects.create(
+        user=collection_user, issue=credited_issue, quantity=3, purchase_price=Money(2, "USD")
+    )
+    other = CollectionItem.objects.create(user=collection_user, issue=collection_issue_2)
+    item.add_read_date(datetime(2024, 6, 15, 12, 0, tzinfo=UTC))
+    item.book_format = CollectionItem.BookFormat.DIGITAL
+    item.save()
+    other.delete()
+
+    stats = CollectionStats.objects.get(user=collection_user)
+    assert stats.total_items == 1
+    assert stats.total_quantity == 3
+    assert stats.read_count == 1
+    assert stats.format_counts == {CollectionItem.BookFormat.DIGITAL: 1}
+    assert stats.top_writers() == {"Stats Creator": 1}
+    assert stats.top_artists() == {"Stats Creator": 1}
+    assert stats.reads_on(date(2024, 6, 15)) == 1
+
+    # The running totals match a full recompute.
+    assert _values(stats) == _values(CollectionStats.rebuild(collection_user))
+
+    # Reading the snapshot doesn't touch the collection tables.
+    with django_assert_max_num_queries(1):
+        CollectionStats.for_user(collection_user)
+
+
+def test_read_date_changes_move_daily_counts(collection_user, collection_item):
+    CollectionStats.for_user(collection_user)
+    collection_item.add_read_date(datetime(2024, 1, 10, 12, 0, tzinfo=UTC))
+    read = ReadDate.objects.get(collection_item=collection_item)
+
+    read.read_date = datetime(2024, 2, 20, 12, 0, tzinfo=UTC)
+    read.save()
+    stats = CollectionStats.objects.get(user=collection_user)
+    assert stats.reads_by_day == {"2024-02-20": 1}
+    assert stats.monthly_reads() == [(date(2024, 2, 1), 1)]
+
+    read.delete()
+    assert CollectionStats.objects.get(user=collection_user).reads_by_day == {}
+
+
+def test_deleting_an_item_with_reads_empties_the_snapshot(collection_user, collection_item):
+    CollectionStats.for_user(collection_user)
+    collection_item.add_read_date(datetime(2024, 1, 10, 12, 0, tzinfo=UTC))
+
+    collection_item.delete()
+
+    stats = CollectionStats.objects.get(user=collection_user)
+    assert _values(stats) == _values(CollectionStats.rebuild(collection_user))
+    assert stats.total_items == 0
+    assert stats.reads_by_day == {}
+
+
+def test_bulk_add_invalidates_snapshot(client, collection_user, collection_issue_1, test_password):
+    """bulk_create() skips the signals, so the bulk-add view drops the row instead."""
+    CollectionStats.for_user(collection_user)
+    client.login(username=collection_user.username, password=test_password)
+
+    client.post(
+        reverse("user_collection:add-from-series"),
+        {"series": collection_issue_1.series_id, "range_type": "all"},
+    )
+
+    assert not CollectionStats.objects.filter(user=collection_user).exists()
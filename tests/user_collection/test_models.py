@@ -683,3 +683,44 @@ class TestReadDateModel:
         assert item2.read_dates.count() == 1
         assert item1.read_dates.first().read_date == same_datetime
         assert item2.read_dates.first().read_date == same_datetime
+
+
+class TestMissingSeriesCounts:
+    """Tests for CollectionItem.missing_series_counts()."""
+
+    def test_counts_owned_series_with_missing_issues(
+        self, collection_user, collection_series, collection_item
+    ):
+        Issue.objects.create(
+            series=collection_series,
+            number="2",
+            slug="collection-series-2",
+            cover_date=date(2023, 2, 1),
+            edited_by=collection_user,
+            created_by=collection_user,
+        )
+
+        assert CollectionItem.missing_series_counts(collection_user) == [
+            (collection_series.pk, 1, 2)
+        ]
+
+    def test_result_is_reused_until_collection_changes(
+        self,
+        collection_user,
+        collection_series,
+        collection_item,
+        collection_issue_2,
+        django_assert_num_queries,
+    ):
+        expected = [(collection_series.pk, 1, 2)]
+        assert CollectionItem.missing_series_counts(collection_user) == expected
+
+        # Only the high-water mark query runs on a cache hit.
+        with django_assert_num_queries(1):
+            assert CollectionItem.missing_series_counts(collection_user) == expected
+
+        item = CollectionItem.objects.create(user=collection_user, issue=collection_issue_2)
+        assert CollectionItem.missing_series_counts(collection_user) == []
+
+        item.delete()
+        assert CollectionItem.missing_series_counts(collection_user) == expected
@@ -285,6 +285,14 @@ def test_form_invalid(db):
 # --- get_rate_limit_usage tests ---
 
 
+def _use_sustained_units(user, used):
+    """Put `used` units on the user's sustained throttle, the way
+    api.throttle's GCRA script stores them."""
+    key = cache.make_key(f"throttle_sustained_{user.pk}")
+    tat = time.time() + used * SUSTAINED_DURATION / SUSTAINED_LIMIT
+    cache._cache.get_client(write=True).set(key, round(tat * 1000), ex=SUSTAINED_DURATION)
+
+
 def test_rate_limit_usage_no_history(create_user):
     user = create_user()
     cache.delete(f"throttle_sustained_{user.pk}")
@@ -297,31 +305,27 @@ def test_rate_limit_usage_no_history(create_user):
 
 def test_rate_limit_usage_with_history(create_user):
     user = create_user()
-    now = time.time()
     # Simulate 10 recent requests
-    cache.set(f"throttle_sustained_{user.pk}", [now - i for i in range(10)])
+    _use_sustained_units(user, 10)
     result = get_rate_limit_usage(user)
     assert result["used"] == 10
     assert result["remaining"] == SUSTAINED_LIMIT - 10
     cache.delete(f"throttle_sustained_{user.pk}")
 
 
-def test_rate_limit_usage_filters_old_timestamps(create_user):
+def test_rate_limit_usage_ignores_expired_state(create_user):
     user = create_user()
-    now = time.time()
-    recent = [now - 100, now - 200]
-    old = [now - SUSTAINED_DURATION - 1, now - SUSTAINED_DURATION - 3600]
-    cache.set(f"throttle_sustained_{user.pk}", recent + old)
+    key = cache.make_key(f"throttle_sustained_{user.pk}")
+    cache._cache.get_client(write=True).set(key, round((time.time() - 60) * 1000), ex=60)
     result = get_rate_limit_usage(user)
-    assert result["used"] == 2
+    assert result["used"] == 0
     cache.delete(f"throttle_sustained_{user.pk}")
 
 
 def test_rate_limit_percent_used(create_user):
     user = create_user()
-    now = time.time()
     used = 500
-    cache.set(f"throttle_sustained_{user.pk}", [now - i for i in range(used)])
+    _use_sustained_units(user, used)
     result = get_rate_limit_usage(user)
     assert result["percent_used"] == round(used / SUSTAINED_LIMIT * 100, 1)
     cache.delete(f"throttle_sustained_{user.pk}")
@@ -4,6 +4,7 @@ import pytest
 from django.contrib.sites.models import Site
 
 from wiki.core.exceptions import NoRootURL
+from wiki.core.plugins import registry as plugin_registry
 from wiki.models import Article, ArticleRevision, URLPath
 
 pytestmark = pytest.mark.django_db
@@ -89,6 +90,28 @@ class TestArticle:
         content2 = article.get_cached_content()
         assert content == content2
 
+    def test_cached_content_is_shared_by_readers(self, monkeypatch, create_user):
+        """One render serves every user; user_postprocessors adapt it per user."""
+        article = Article()
+        article.add_revision(ArticleRevision(title="Shared", content="*hi*"), save=True)
+        article.clear_cache()
+        monkeypatch.setattr(
+            plugin_registry,
+            "_user_postprocessors",
+            [lambda html, article, user: f"{html}<p>{user.username if user else '-'}</p>"],
+        )
+        renders = []
+        original_render = Article.render
+        monkeypatch.setattr(
+            Article, "render", lambda self, **kw: renders.append(1) or original_render(self, **kw)
+        )
+        alice, bob = create_user(username="alice"), create_user(username="bob")
+
+        assert article.get_cached_content(user=alice).endswith("<p>alice</p>")
+        assert article.get_cached_content(user=bob).endswith("<p>bob</p>")
+        assert article.get_cached_content().endswith("<p>-</p>")
+        assert len(renders) == 1
+
     def test_clear_cache(self):
         """clear_cache() removes the cached rendered content."""
         article = Article()
@@ -190,6 +213,46 @@ class TestURLPath:
         found = URLPath.get_by_path("HEROES")
         assert found.slug == "heroes"
 
+    def test_get_by_path_unknown_raises(self):
+        """get_by_path raises DoesNotExist when a segment is missing."""
+        root = URLPath.create_root(title="Root")
+        URLPath.create_urlpath(root, "heroes", title="Heroes")
+
+        with pytest.raises(URLPath.DoesNotExist):
+            URLPath.get_by_path("heroes/villains")
+
+    def test_get_by_path_is_one_query(self, django_assert_num_queries):
+        """get_by_path fetches the node and its ancestors together, however deep."""
+        root = URLPath.create_root(title="Root")
+        parent = URLPath.create_urlpath(root, "a", title="A")
+        child = URLPath.create_urlpath(parent, "b", title="B")
+        grandchild = URLPath.create_urlpath(child, "c", title="C")
+        Site.objects.get_current()
+
+        with django_assert_num_queries(1):
+            found = URLPath.get_by_path("a/b/c/")
+            assert found.pk == grandchild.pk
+            assert [a.pk for a in found.cached_ancestors] == [root.pk, parent.pk, child.pk]
+            assert found.path == "a/b/c/"
+
+    def test_full_path_follows_renames_and_moves(self):
+        """Renaming or moving a node rewrites the stored paths of its subtree."""
+        root = URLPath.create_root(title="Root")
+        parent = URLPath.create_urlpath(root, "parent", title="Parent")
+        other = URLPath.create_urlpath(root, "other", title="Other")
+        child = URLPath.create_urlpath(parent, "child", title="Child")
+        assert child.full_path == "parent/child/"
+
+        parent.slug = "renamed"
+        parent.save()
+        assert URLPath.get_by_path("renamed/child").pk == child.pk
+
+        other.refresh_from_db()
+        parent.move_to(other)
+        child.refresh_from_db()
+        assert child.full_path == "other/renamed/child/"
+        assert URLPath.get_by_path("other/renamed/child").pk == child.pk
+
     def test_root_raises_without_root(self):
         """URLPath.root() raises NoRootURL when no root exists."""
 
@@ -0,0 +1,47 @@
+"""Tests for the wiki redlinks Markdown extension.
+
+Note: wiki.plugins.redlinks is not in INSTALLED_APPS, so the extension is
+exercised directly on a Markdown instance.
+"""
+
+import markdown
+import pytest
+
+from wiki.models import URLPath
+from wiki.plugins.redlinks.mdx.redlinks import makeExtension
+
+pytestmark = pytest.mark.django_db
+
+
+def _convert(article, text):
+    md = markdown.Markdown(extensions=[makeExtension()])
+    md.article = article
+    return md.convert(text)
+
+
+def test_classifies_links(wiki_root, wiki_child):
+    html = _convert(
+        wiki_root.article,
+        "[a](/wiki/test-article/) [b](/wiki/missing/) [c](https://example.com/) "
+        f"[d](/wiki/{wiki_child.article.pk}/) [e](/wiki/999999/) [f](/wiki/TEST-ARTICLE)",
+    )
+
+    assert html.count('class="wiki-internal"') == 3
+    assert html.count('class="wiki-broken"') == 2
+    assert html.count('class="wiki-external"') == 1
+
+
+def test_query_count_is_independent_of_links(wiki_root, wiki_child, django_assert_max_num_queries):
+    for i in range(10):
+        URLPath.create_urlpath(wiki_child, f"page-{i}", title=f"Page {i}")
+    text = " ".join(
+        f"[{i}](/wiki/test-article/page-{i}/) [missing {i}](/wiki/test-article/gone-{i}/)"
+        for i in range(10)
+    )
+
+    # The article's own URL, plus one lookup for all of the linked paths
+    with django_assert_max_num_queries(3):
+        html = _convert(wiki_root.article, text)
+
+    assert html.count('class="wiki-internal"') == 10
+    assert html.count('class="wiki-broken"') == 10
@@ -248,3 +248,21 @@ class TestSearchView:
         """Searching for content that exists returns results."""
         resp = client.get("/wiki/_search/", {"q": "Test Article"})
         assert resp.status_code == HTTP_200_OK
+        assert list(resp.context["articles"]) == [wiki_child.article]
+
+    def test_search_ranks_titles_first_and_highlights(self, logged_in_client, wiki_root):
+        """Stemmed matches are found, title matches rank first, and each result
+        has an escaped snippet with the matched words highlighted."""
+        in_content = URLPath.create_urlpath(
+            wiki_root, "mentions", title="Mentions", content="Villains & henchmen appear here."
+        )
+        in_title = URLPath.create_urlpath(wiki_root, "villains", title="Villain", content="A list.")
+        URLPath.create_urlpath(wiki_root, "heroes", title="Heroes", content="Nothing else.")
+
+        resp = logged_in_client.get("/wiki/_search/", {"q": "villain"})
+
+        articles = list(resp.context["articles"])
+        assert articles == [in_title.article, in_content.article]
+        assert articles[1].search_headline == (
+            "<strong>Villains</strong> &amp; henchmen appear here."
+        )
@@ -1,7 +1,15 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 
-from user_collection.signals import sync_issue_rating_from_collection_item
+from user_collection.signals import (
+    remember_collection_item_snapshot,
+    remember_read_date_day,
+    sync_issue_rating_from_collection_item,
+    update_collection_stats_on_item_delete,
+    update_collection_stats_on_item_save,
+    update_collection_stats_on_read_delete,
+    update_collection_stats_on_read_save,
+)
 
 
 class UserCollectionConfig(AppConfig):
@@ -10,8 +18,41 @@ class UserCollectionConfig(AppConfig):
 
     def ready(self):
         collection_item = self.get_model("CollectionItem")
+        read_date = self.get_model("ReadDate")
         post_save.connect(
             sync_issue_rating_from_collection_item,
             sender=collection_item,
             dispatch_uid="post_save_sync_issue_rating_from_collection_item",
         )
+
+        # Keep each user's CollectionStats snapshot current.
+        pre_save.connect(
+            remember_collection_item_snapshot,
+            sender=collection_item,
+            dispatch_uid="pre_save_remember_collection_item_snapshot",
+        )
+        post_save.connect(
+            update_collection_stats_on_item_save,
+            sender=collection_item,
+            dispatch_uid="post_save_update_collection_stats_on_item_save",
+        )
+        post_delete.connect(
+            update_collection_stats_on_item_delete,
+            sender=collection_item,
+            dispatch_uid="post_delete_update_collection_stats_on_item_delete",
+        )
+        pre_save.connect(
+            remember_read_date_day,
+            sender=read_date,
+            dispatch_uid="pre_save_remember_read_date_day",
+        )
+        post_save.connect(
+            update_collection_stats_on_read_save,
+            sender=read_date,
+            dispatch_uid="post_save_update_collection_stats_on_read_save",
+        )
+        post_delete.connect(
+            update_collection_stats_on_read_delete,
+            sender=read_date,
+            dispatch_uid="post_delete_update_collection_stats_on_read_delete",
+        )
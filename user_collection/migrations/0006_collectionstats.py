@@ -0,0 +1,51 @@
+# Generated by Django 6.0.7 on 2026-10-17 09:36
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("user_collection", "0005_alter_collectionitem_purchase_price_currency"),
+        ("users", "0009_signupsettings"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CollectionStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="collection_stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("total_items", models.PositiveIntegerField(default=0)),
+                ("total_quantity", models.PositiveIntegerField(default=0)),
+                (
+                    "total_value",
+                    models.DecimalField(decimal_places=2, default=Decimal("0"), max_digits=14),
+                ),
+                ("read_count", models.PositiveIntegerField(default=0)),
+                ("format_counts", models.JSONField(default=dict)),
+                ("series_counts", models.JSONField(default=dict)),
+                ("publisher_counts", models.JSONField(default=dict)),
+                ("series_type_counts", models.JSONField(default=dict)),
+                ("writer_counts", models.JSONField(default=dict)),
+                ("artist_counts", models.JSONField(default=dict)),
+                ("reads_by_day", models.JSONField(default=dict)),
+                ("rebuilt_on", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name": "Collection Stats",
+                "verbose_name_plural": "Collection Stats",
+            },
+        ),
+    ]
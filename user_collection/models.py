@@ -1,15 +1,37 @@
+from datetime import date, timedelta
 from decimal import Decimal
 
-from django.db import models
-from django.db.models.functions import Now
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Count, F, Max, Q, Sum
+from django.db.models.functions import Now, TruncDate
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from djmoney.models.fields import MoneyField
 
+from comicsdb.models.credits import Credits
 from comicsdb.models.issue import Issue
 from users.models import CustomUser
 
+# Credit roles tallied for the "Top Writers" / "Top Artists" statistics.
+WRITER_ROLES = ["Writer", "Script", "Story", "Plot"]
+ARTIST_ROLES = [
+    "Artist",
+    "Penciller",
+    "Illustrator",
+    "Layouts",
+    "Breakdowns",
+    "Inker",
+    "Embellisher",
+    "Finishes",
+    "Ink Assists",
+]
+
+# Bounds how stale missing_series_counts() can get from catalog changes (new
+# issues in an owned series), which don't move the cache key.
+MISSING_SERIES_CACHE_TTL = 60 * 60
+
 # CGC Grading Scale choices
 GRADE_CHOICES = [
     (Decimal("10.0"), _("10.0 (Gem Mint)")),
@@ -174,6 +196,146 @@ class CollectionItem(models.Model):
         self.date_read = read_date
         self.save(update_fields=["is_read", "date_read"])
 
+    @classmethod
+    def missing_series_counts(cls, user) -> list[tuple[int, int, int]]:
+        """Return `(series id, owned issues, total issues)` for each series the
+        user owns some but not all issues of, most missing first.
+
+        Starts from the user's own items (a GROUP BY over CollectionItem joined
+        to the precomputed SeriesStats.issue_count), so the cost follows the
+        size of the collection rather than the catalog. The result is cached
+        under the collection's item count and latest `modified`: any add, edit
+        or removal moves one of the two, so paging through the list reuses one
+        computation until the collection changes.
+        """
+        items = cls.objects.filter(user=user)
+        mark = items.aggregate(count=Count("pk"), modified=Max("modified"))
+        modified = mark["modified"].timestamp() if mark["modified"] else 0
+        key = f"collection:missing_series:{user.pk}:{mark['count']}:{modified}"
+        rows = cache.get(key)
+        if rows is None:
+            rows = list(
+                items.values("issue__series", total=F("issue__series__stats__issue_count"))
+                .annotate(owned=Count("pk"))
+                .annotate(missing=F("total") - F("owned"))
+                .filter(missing__gt=0)
+                .order_by("-missing", "issue__series__sort_name")
+                .values_list("issue__series", "owned", "total")
+            )
+            cache.set(key, rows, MISSING_SERIES_CACHE_TTL)
+        return rows
+
+    @staticmethod
+    def series_with_missing_counts(rows) -> list:
+        """Load the Series for a page of missing_series_counts() rows, with
+        `owned_issues`, `total_issues` and `missing_count` set on each."""
+        from comicsdb.models.series import Series  # noqa: PLC0415
+
+        series = Series.objects.select_related("publisher", "series_type", "imprint").in_bulk(
+            [series_id for series_id, _owned, _total in rows]
+        )
+        result = []
+        for series_id, owned, total in rows:
+            if obj := series.get(series_id):
+                obj.owned_issues, obj.total_issues = owned, total
+                obj.missing_count = total - owned
+                result.append(obj)
+        return result
+
+    @classmethod
+    def scrobble_many(cls, user, entries: list[dict], now=None) -> list[CollectionItem]:
+        """Record many reads at once: the set-based counterpart of the scrobble
+        API's get_or_create() + add_read_date() per issue.
+
+        `entries` are `{"issue_id", "date_read", "rating"}` dicts whose issues
+        are known to exist; a missing/None `date_read` means `now`, and when an
+        issue is listed more than once, its last non-null rating wins. Returns
+        the scrobbled items (one per issue, in first-seen order), each with a
+        `created` attribute.
+
+        bulk_create() and update() send no signals, so this does the work of
+        the CollectionItem/ReadDate/IssueRating handlers itself: the community
+        IssueRating rows and their SeriesStats are synced, and the user's
+        CollectionStats snapshot is dropped to be rebuilt on its next read.
+        """
+        from comicsdb.models.stats import SeriesStats  # noqa: PLC0415
+        from issue_ratings.models import IssueRating  # noqa: PLC0415
+
+        now = now or timezone.now()
+        issue_ids = list(dict.fromkeys(entry["issue_id"] for entry in entries))
+        ratings = {
+            entry["issue_id"]: entry["rating"]
+            for entry in entries
+            if entry.get("rating") is not None
+        }
+
+        with transaction.atomic():
+            existing = set(
+                cls.objects.filter(user=user, issue_id__in=issue_ids).values_list(
+                    "issue_id", flat=True
+                )
+            )
+            # Two upserts, so that entries without a rating leave an existing
+            # item's rating alone.
+            item_ids = {}
+            for rated, update_fields in ((True, ["rating", "modified"]), (False, ["modified"])):
+                rows = [
+                    cls(
+                        user=user,
+                        issue_id=issue_id,
+                        quantity=1,
+                        book_format=cls.BookFormat.DIGITAL,
+                        rating=ratings.get(issue_id),
+                    )
+                    for issue_id in issue_ids
+                    if (issue_id in ratings) == rated
+                ]
+                if rows:
+                    cls.objects.bulk_create(
+                        rows,
+                        update_conflicts=True,
+                        unique_fields=["user", "issue"],
+                        update_fields=update_fields,
+                    )
+                    item_ids.update((row.issue_id, row.pk) for row in rows)
+
+            ReadDate.objects.bulk_create(
+                ReadDate(
+                    collection_item_id=item_ids[entry["issue_id"]],
+                    read_date=entry.get("date_read") or now,
+                )
+                for entry in entries
+            )
+            latest_read = (
+                ReadDate.objects.filter(collection_item=models.OuterRef("pk"))
+                .order_by("-read_date")
+                .values("read_date")[:1]
+            )
+            cls.objects.filter(pk__in=item_ids.values()).update(
+                is_read=True, date_read=models.Subquery(latest_read)
+            )
+
+            if ratings:
+                IssueRating.objects.bulk_create(
+                    [
+                        IssueRating(issue_id=issue_id, user=user, rating=rating)
+                        for issue_id, rating in ratings.items()
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["issue", "user"],
+                    update_fields=["rating", "modified"],
+                )
+                SeriesStats.refresh(
+                    Issue.objects.filter(pk__in=ratings).values_list("series_id", flat=True)
+                )
+            CollectionStats.invalidate(user)
+
+        items = cls.objects.filter(pk__in=item_ids.values()).select_related("issue__series")
+        by_issue = {item.issue_id: item for item in items}
+        for item in by_issue.values():
+            item.created = item.issue_id not in existing
+        return [by_issue[issue_id] for issue_id in issue_ids]
+
 
 class ReadDate(models.Model):
     """Track individual read dates for collection items."""
@@ -197,3 +359,257 @@ class ReadDate(models.Model):
 
     def __str__(self) -> str:
         return f"{self.collection_item} - {self.read_date}"
+
+
+def _bump(counts: dict, key, delta: int) -> None:
+    """Add `delta` to a JSON tally, dropping keys that reach zero."""
+    if key is None or not delta:
+        return
+    key = str(key)
+    value = counts.get(key, 0) + delta
+    if value > 0:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+def _tally(queryset, field: str, count: str = "pk") -> dict[str, int]:
+    return {
+        str(key): value
+        for key, value in queryset.order_by()
+        .values(field)
+        .annotate(n=Count(count, distinct=count != "pk"))
+        .values_list(field, "n")
+        if key is not None
+    }
+
+
+def _top(counts: dict, limit: int) -> list[tuple[int, int]]:
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], int(item[0])))
+    return [(int(key), value) for key, value in ranked[:limit]]
+
+
+class CollectionStats(models.Model):
+    """A user's collection statistics, kept as one precomputed row.
+
+    The statistics page and the API `stats` action used to aggregate the
+    whole collection (plus two Credits joins over every owned issue) on each
+    request. The signal handlers in user_collection/signals.py instead apply
+    each CollectionItem/ReadDate change to this row as a delta, and the row
+    is computed in full by `rebuild()` the first time it's needed.
+
+    The tallies are keyed by id, so renames need no bookkeeping. Catalog
+    edits that change an owned issue's contribution (credits added to it,
+    the issue moved to another series) aren't tracked, which is why a
+    snapshot older than MAX_AGE is rebuilt on its next read.
+    """
+
+    MAX_AGE = timedelta(days=7)
+
+    user = models.OneToOneField(
+        CustomUser, on_delete=models.CASCADE, primary_key=True, related_name="collection_stats"
+    )
+    total_items = models.PositiveIntegerField(default=0)
+    total_quantity = models.PositiveIntegerField(default=0)
+    total_value = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal(0))
+    read_count = models.PositiveIntegerField(default=0)
+    #: JSON tallies: {book_format | id | "YYYY-MM-DD": count}.
+    format_counts = models.JSONField(default=dict)
+    series_counts = models.JSONField(default=dict)
+    publisher_counts = models.JSONField(default=dict)
+    series_type_counts = models.JSONField(default=dict)
+    writer_counts = models.JSONField(default=dict)
+    artist_counts = models.JSONField(default=dict)
+    reads_by_day = models.JSONField(default=dict)
+    rebuilt_on = models.DateTimeField()
+
+    class Meta:
+        verbose_name = _("Collection Stats")
+        verbose_name_plural = _("Collection Stats")
+
+    def __str__(self) -> str:
+        return f"Collection stats for user {self.user_id}"
+
+    @property
+    def unread_count(self) -> int:
+        return self.total_items - self.read_count
+
+    @classmethod
+    def for_user(cls, user) -> CollectionStats:
+        """Return the user's snapshot, computing it first if there is none
+        yet or it's older than MAX_AGE."""
+        stats = cls.objects.filter(user=user).first()
+        if stats is None or stats.rebuilt_on < timezone.now() - cls.MAX_AGE:
+            stats = cls.rebuild(user)
+        return stats
+
+    @classmethod
+    def invalidate(cls, user) -> None:
+        """Drop the snapshot after a change the signals don't see (e.g. a
+        bulk_create), so the next read rebuilds it."""
+        cls.objects.filter(user=user).delete()
+
+    @classmethod
+    def rebuild(cls, user) -> CollectionStats:
+        """Recompute the user's snapshot from scratch."""
+        items = CollectionItem.objects.filter(user=user)
+        totals = items.aggregate(
+            total_items=Count("pk"),
+            total_quantity=Sum("quantity"),
+            total_value=Sum("purchase_price"),
+            read_count=Count("pk", filter=Q(is_read=True)),
+        )
+        credits_ = Credits.objects.filter(issue__in_collections__user=user)
+        reads = ReadDate.objects.filter(collection_item__user=user).annotate(
+            day=TruncDate("read_date")
+        )
+        stats, _created = cls.objects.update_or_create(
+            user=user,
+            defaults={
+                "total_items": totals["total_items"],
+                "total_quantity": totals["total_quantity"] or 0,
+                "total_value": totals["total_value"] or Decimal(0),
+                "read_count": totals["read_count"],
+                "format_counts": _tally(items, "book_format"),
+                "series_counts": _tally(items, "issue__series"),
+                "publisher_counts": _tally(items, "issue__series__publisher"),
+                "series_type_counts": _tally(items, "issue__series__series_type"),
+                "writer_counts": _tally(
+                    credits_.filter(role__name__in=WRITER_ROLES), "creator", count="issue"
+                ),
+                "artist_counts": _tally(
+                    credits_.filter(role__name__in=ARTIST_ROLES), "creator", count="issue"
+                ),
+                "reads_by_day": {
+                    day.isoformat(): n
+                    for day, n in reads.values("day")
+                    .annotate(n=Count("pk"))
+                    .values_list("day", "n")
+                },
+                "rebuilt_on": timezone.now(),
+            },
+        )
+        return stats
+
+    @staticmethod
+    def item_snapshot(item: CollectionItem) -> dict:
+        """The parts of a CollectionItem its statistics depend on."""
+        price = item.purchase_price
+        return {
+            "issue_id": item.issue_id,
+            "quantity": item.quantity,
+            "book_format": item.book_format,
+            "price": getattr(price, "amount", price) or Decimal(0),
+            "is_read": item.is_read,
+        }
+
+    @classmethod
+    def record_item_change(cls, user_id: int, old: dict | None, new: dict | None) -> None:
+        """Apply a CollectionItem change, given its item_snapshot() before
+        (None when created) and after (None when deleted)."""
+        with transaction.atomic():
+            stats = cls.objects.select_for_update().filter(user_id=user_id).first()
+            if stats is None:
+                return  # Not computed yet; for_user() will build it in full.
+            same_issue = old is not None and new is not None and old["issue_id"] == new["issue_id"]
+            for snapshot, sign in ((old, -1), (new, 1)):
+                if snapshot is not None:
+                    stats._apply_item(snapshot, sign, with_issue=not same_issue)
+            stats.save()
+
+    def _apply_item(self, snapshot: dict, sign: int, *, with_issue: bool) -> None:
+        self.total_items += sign
+        self.total_quantity += sign * snapshot["quantity"]
+        self.total_value += sign * snapshot["price"]
+        self.read_count += sign * snapshot["is_read"]
+        _bump(self.format_counts, snapshot["book_format"], sign)
+        if not with_issue:
+            return
+
+        issue_id = snapshot["issue_id"]
+        series_id, publisher_id, series_type_id = (
+            Issue.objects.filter(pk=issue_id)
+            .values_list("series_id", "series__publisher_id", "series__series_type_id")
+            .first()
+        ) or (None, None, None)
+        _bump(self.series_counts, series_id, sign)
+        _bump(self.publisher_counts, publisher_id, sign)
+        _bump(self.series_type_counts, series_type_id, sign)
+
+        credits_ = set(
+            Credits.objects.filter(issue_id=issue_id, role__name__in=WRITER_ROLES + ARTIST_ROLES)
+            .values_list("creator_id", "role__name")
+            .distinct()
+        )
+        for creator_id in {creator for creator, role in credits_ if role in WRITER_ROLES}:
+            _bump(self.writer_counts, creator_id, sign)
+        for creator_id in {creator for creator, role in credits_ if role in ARTIST_ROLES}:
+            _bump(self.artist_counts, creator_id, sign)
+
+    @classmethod
+    def record_read_change(cls, user_id: int, old_day, new_day) -> None:
+        """Move one read from `old_day` to `new_day` (either may be None)."""
+        with transaction.atomic():
+            stats = cls.objects.select_for_update().filter(user_id=user_id).first()
+            if stats is None:
+                return
+            _bump(stats.reads_by_day, old_day and old_day.isoformat(), -1)
+            _bump(stats.reads_by_day, new_day and new_day.isoformat(), 1)
+            stats.save(update_fields=["reads_by_day"])
+
+    def format_breakdown(self) -> list[dict]:
+        return [
+            {"book_format": book_format, "count": count}
+            for book_format, count in sorted(
+                self.format_counts.items(), key=lambda item: (-item[1], item[0])
+            )
+        ]
+
+    def top_series(self, limit: int = 10) -> list[dict]:
+        from comicsdb.models.series import Series  # noqa: PLC0415
+
+        top = _top(self.series_counts, limit)
+        names = dict(Series.objects.filter(pk__in=[pk for pk, _n in top]).values_list("pk", "name"))
+        return [
+            {"issue__series__id": pk, "issue__series__name": names[pk], "count": count}
+            for pk, count in top
+            if pk in names
+        ]
+
+    def publisher_breakdown(self) -> dict[str, int]:
+        from comicsdb.models.publisher import Publisher  # noqa: PLC0415
+
+        return self._named(Publisher, self.publisher_counts)
+
+    def series_type_breakdown(self) -> dict[str, int]:
+        from comicsdb.models.series import SeriesType  # noqa: PLC0415
+
+        return self._named(SeriesType, self.series_type_counts)
+
+    def top_writers(self, limit: int = 10) -> dict[str, int]:
+        from comicsdb.models.creator import Creator  # noqa: PLC0415
+
+        return self._named(Creator, self.writer_counts, limit)
+
+    def top_artists(self, limit: int = 10) -> dict[str, int]:
+        from comicsdb.models.creator import Creator  # noqa: PLC0415
+
+        return self._named(Creator, self.artist_counts, limit)
+
+    @staticmethod
+    def _named(model, counts: dict, limit: int | None = None) -> dict[str, int]:
+        top = _top(counts, limit if limit is not None else len(counts))
+        names = dict(model.objects.filter(pk__in=[pk for pk, _n in top]).values_list("pk", "name"))
+        return {names[pk]: count for pk, count in top if pk in names}
+
+    def reads_on(self, day) -> int:
+        return self.reads_by_day.get(day.isoformat(), 0)
+
+    def monthly_reads(self, limit: int = 12) -> list[tuple]:
+        """(first day of month, reads) for the `limit` latest months with
+        any reads, oldest first."""
+        months: dict = {}
+        for day, count in self.reads_by_day.items():
+            month = date.fromisoformat(day).replace(day=1)
+            months[month] = months.get(month, 0) + count
+        return sorted(months.items())[-limit:]
@@ -1,3 +1,6 @@
+from django.utils import timezone
+
+
 def sync_issue_rating_from_collection_item(sender, instance, **kwargs):
     """Keep the community IssueRating in sync with a user's personal collection rating."""
     from issue_ratings.models import IssueRating  # noqa: PLC0415
@@ -13,3 +16,60 @@ def sync_issue_rating_from_collection_item(sender, instance, **kwargs):
             issue_id=instance.issue_id,
             user_id=instance.user_id,
         ).delete()
+
+
+def remember_collection_item_snapshot(sender, instance, **kwargs):
+    """pre_save: note what an existing item contributed to its owner's
+    CollectionStats, so the post_save handler can swap it for the new values."""
+    from user_collection.models import CollectionStats  # noqa: PLC0415
+
+    previous = None
+    if not instance._state.adding:
+        previous = sender._default_manager.filter(pk=instance.pk).first()
+    instance._stats_previous = previous and CollectionStats.item_snapshot(previous)
+
+
+def update_collection_stats_on_item_save(sender, instance, created, **kwargs):
+    from user_collection.models import CollectionStats  # noqa: PLC0415
+
+    previous = getattr(instance, "_stats_previous", None)
+    current = CollectionStats.item_snapshot(instance)
+    if created or previous != current:
+        CollectionStats.record_item_change(instance.user_id, previous, current)
+
+
+def update_collection_stats_on_item_delete(sender, instance, **kwargs):
+    from user_collection.models import CollectionStats  # noqa: PLC0415
+
+    CollectionStats.record_item_change(
+        instance.user_id, CollectionStats.item_snapshot(instance), None
+    )
+
+
+def remember_read_date_day(sender, instance, **kwargs):
+    """pre_save: note which day an existing ReadDate was counted under."""
+    previous = None
+    if not instance._state.adding:
+        previous = (
+            sender._default_manager.filter(pk=instance.pk)
+            .values_list("read_date", flat=True)
+            .first()
+        )
+    instance._stats_previous_day = previous and timezone.localdate(previous)
+
+
+def update_collection_stats_on_read_save(sender, instance, created, **kwargs):
+    from user_collection.models import CollectionStats  # noqa: PLC0415
+
+    previous = getattr(instance, "_stats_previous_day", None)
+    current = timezone.localdate(instance.read_date)
+    if created or previous != current:
+        CollectionStats.record_read_change(instance.collection_item.user_id, previous, current)
+
+
+def update_collection_stats_on_read_delete(sender, instance, **kwargs):
+    from user_collection.models import CollectionStats  # noqa: PLC0415
+
+    CollectionStats.record_read_change(
+        instance.collection_item.user_id, timezone.localdate(instance.read_date), None
+    )
@@ -5,8 +5,8 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.db import models
-from django.db.models import Count, F, Sum
-from django.db.models.functions import TruncDate, TruncMonth
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
@@ -24,13 +24,12 @@ from django.views.generic import (
 )
 
 from comicsdb.filters.collection import CollectionViewFilter
-from comicsdb.models.credits import Credits
 from comicsdb.models.issue import Issue
 from comicsdb.models.publisher import Publisher
 from comicsdb.models.series import Series, SeriesType
 from comicsdb.views.ratings import parse_rating_action
 from user_collection.forms import AddIssuesFromSeriesForm, CollectionItemForm
-from user_collection.models import GRADE_CHOICES, CollectionItem, ReadDate
+from user_collection.models import GRADE_CHOICES, CollectionItem, CollectionStats, ReadDate
 
 
 class CollectionListView(LoginRequiredMixin, ListView):
@@ -177,41 +176,13 @@ class CollectionStatsView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        queryset = CollectionItem.objects.filter(user=self.request.user)
-
-        # Calculate statistics
-        total_items = queryset.count()
-        total_quantity = queryset.aggregate(Sum("quantity"))["quantity__sum"] or 0
-
-        # Calculate total value
-        total_value_result = queryset.aggregate(Sum("purchase_price"))
-        total_value = total_value_result["purchase_price__sum"]
-
-        # Reading statistics
-        read_count = queryset.filter(is_read=True).count()
-        unread_count = queryset.filter(is_read=False).count()
-
-        # Format breakdown
-        format_counts = queryset.values("book_format").annotate(count=Count("id"))
-
-        # Get top series
-        top_series = (
-            queryset.values("issue__series__name", "issue__series__id")
-            .annotate(count=Count("id"))
-            .order_by("-count")[:10]
-        )
+        # Precomputed and kept current by the signals in user_collection/signals.py.
+        stats = CollectionStats.for_user(self.request.user)
+        format_counts = stats.format_breakdown()
 
         # Create chart data
         # Publisher distribution
-        publisher_data = (
-            queryset.values("issue__series__publisher__name")
-            .annotate(count=Count("id"))
-            .order_by("-count")
-        )
-        publisher_dict = {
-            item["issue__series__publisher__name"] or _("Unknown"): item["count"]
-            for item in publisher_data
-        }
+        publisher_dict = stats.publisher_breakdown()
         publisher_chart = PieChart(
             publisher_dict,
             title=_("Issues by Publisher"),
@@ -220,15 +191,7 @@ class CollectionStatsView(LoginRequiredMixin, TemplateView):
         )
 
         # Series type distribution
-        series_type_data = (
-            queryset.values("issue__series__series_type__name")
-            .annotate(count=Count("id"))
-            .order_by("-count")
-        )
-        series_type_dict = {
-            item["issue__series__series_type__name"] or _("Unknown"): item["count"]
-            for item in series_type_data
-        }
+        series_type_dict = stats.series_type_breakdown()
         series_type_chart = PieChart(
             series_type_dict,
             title=_("Issues by Series Type"),
@@ -251,20 +214,9 @@ class CollectionStatsView(LoginRequiredMixin, TemplateView):
         )
 
         # Reading history charts
-        read_dates_qs = ReadDate.objects.filter(collection_item__user=self.request.user)
-
-        daily_reads = (
-            read_dates_qs.annotate(day=TruncDate("read_date"))
-            .values("day")
-            .annotate(c=Count("day"))
-            .order_by("-day")[:30]
-        )
-        daily_counts = {r["day"]: r["c"] for r in daily_reads}
-        today = datetime.now().date()
+        today = timezone.localdate()
         daily_dict = {
-            (today - timedelta(days=i)).strftime("%m/%d"): daily_counts.get(
-                today - timedelta(days=i), 0
-            )
+            (today - timedelta(days=i)).strftime("%m/%d"): stats.reads_on(today - timedelta(days=i))
             for i in range(29, -1, -1)
         }
         reading_daily_chart = ColumnChart(
@@ -273,13 +225,7 @@ class CollectionStatsView(LoginRequiredMixin, TemplateView):
             thousands=",",
         )
 
-        monthly_reads = (
-            read_dates_qs.annotate(month=TruncMonth("read_date"))
-            .values("month")
-            .annotate(c=Count("month"))
-            .order_by("-month")[:12]
-        )
-        monthly_dict = {r["month"].strftime("%b %Y"): r["c"] for r in monthly_reads[::-1]}
+        monthly_dict = {month.strftime("%b %Y"): count for month, count in stats.monthly_reads()}
         reading_monthly_chart = ColumnChart(
             monthly_dict,
             title=_("Issues Read (Last 12 Months)"),
@@ -287,43 +233,15 @@ class CollectionStatsView(LoginRequiredMixin, TemplateView):
         )
 
         # Favorite Creators charts
-        user_issue_ids = queryset.values_list("issue_id", flat=True)
-
-        writer_roles = ["Writer", "Script", "Story", "Plot"]
-        top_writers_data = (
-            Credits.objects.filter(issue_id__in=user_issue_ids, role__name__in=writer_roles)
-            .values("creator__name")
-            .annotate(count=Count("issue", distinct=True))
-            .order_by("-count")[:10]
-        )
-        writers_dict = {item["creator__name"]: item["count"] for item in top_writers_data}
         top_writers_chart = BarChart(
-            writers_dict,
+            stats.top_writers(),
             title=_("Top Writers"),
             thousands=",",
             library={"scales": {"x": {"ticks": {"precision": 0}}}},
         )
 
-        artist_roles = [
-            "Artist",
-            "Penciller",
-            "Illustrator",
-            "Layouts",
-            "Breakdowns",
-            "Inker",
-            "Embellisher",
-            "Finishes",
-            "Ink Assists",
-        ]
-        top_artists_data = (
-            Credits.objects.filter(issue_id__in=user_issue_ids, role__name__in=artist_roles)
-            .values("creator__name")
-            .annotate(count=Count("issue", distinct=True))
-            .order_by("-count")[:10]
-        )
-        artists_dict = {item["creator__name"]: item["count"] for item in top_artists_data}
         top_artists_chart = BarChart(
-            artists_dict,
+            stats.top_artists(),
             title=_("Top Artists"),
             thousands=",",
             library={"scales": {"x": {"ticks": {"precision": 0}}}},
@@ -331,13 +249,13 @@ class CollectionStatsView(LoginRequiredMixin, TemplateView):
 
         context.update(
             {
-                "total_items": total_items,
-                "total_quantity": total_quantity,
-                "total_value": total_value or 0,
-                "read_count": read_count,
-                "unread_count": unread_count,
+                "total_items": stats.total_items,
+                "total_quantity": stats.total_quantity,
+                "total_value": stats.total_value,
+                "read_count": stats.read_count,
+                "unread_count": stats.unread_count,
                 "format_counts": format_counts,
-                "top_series": top_series,
+                "top_series": stats.top_series(),
                 "publisher_chart": publisher_chart,
                 "series_type_chart": series_type_chart,
                 "format_chart": format_chart,
@@ -448,6 +366,8 @@ class AddIssuesFromSeriesView(LoginRequiredMixin, FormView):
         # Bulk create all new items
         if new_items:
             CollectionItem.objects.bulk_create(new_items)
+            # bulk_create() skips the signals that keep the stats current.
+            CollectionStats.invalidate(self.request.user)
             added_count = len(new_items)
 
             added_phrase = ngettext(
@@ -509,27 +429,14 @@ class MissingIssuesListView(LoginRequiredMixin, ListView):
     paginate_by = 50
 
     def get_queryset(self):
-        user = self.request.user
-
-        # Annotate all series with total and owned issue counts
-        # Then filter to only show series with missing issues
-        return (
-            Series.objects.annotate(
-                total_issues=Count("issues", distinct=True),
-                owned_issues=Count(
-                    "issues", filter=models.Q(issues__in_collections__user=user), distinct=True
-                ),
-            )
-            .annotate(missing_count=F("total_issues") - F("owned_issues"))
-            .filter(owned_issues__gt=0, missing_count__gt=0)
-            .select_related("publisher", "series_type", "imprint")
-            .order_by("-missing_count", "sort_name")
-        )
+        # (series id, owned, total) rows; the page's Series are loaded below.
+        return CollectionItem.missing_series_counts(self.request.user)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        context["series_list"] = CollectionItem.series_with_missing_counts(context["object_list"])
         # Add total count of series with missing issues
-        context["series_with_missing_count"] = self.get_queryset().count()
+        context["series_with_missing_count"] = len(self.object_list)
         return context
 
 
@@ -20,6 +20,7 @@ from django.utils.translation import gettext as _, gettext_lazy as _lazy
 from django.views.generic import DetailView, ListView
 
 # Import models for counting
+from api.throttle import units_in_use
 from comicsdb.models import (
     Arc,
     Character,
@@ -271,10 +272,12 @@ def user_profile_redirect(request, pk):
 
 def get_rate_limit_usage(user):
     limit = user.supporter_daily_limit or SUSTAINED_LIMIT
-    cache_key = f"throttle_sustained_{user.pk}"
-    history = cache.get(cache_key, [])
-    now = time.time()
-    used = sum(1 for ts in history if ts > now - SUSTAINED_DURATION)
+    used = min(
+        limit,
+        units_in_use(
+            cache, f"throttle_sustained_{user.pk}", SUSTAINED_DURATION / limit, time.time()
+        ),
+    )
     return {
         "limit": limit,
         "used": used,
@@ -246,6 +246,10 @@ URL_CONFIG_CLASS = getattr(django_settings, "WIKI_URL_CONFIG_CLASS", None)
 #: other objects that are changed.
 CACHE_TIMEOUT = getattr(django_settings, "WIKI_CACHE_TIMEOUT", 600)
 
+#: Postgres text search configuration used to index and search article revisions.
+#: Changing it requires rebuilding ``ArticleRevision.search_vector``.
+SEARCH_CONFIG = getattr(django_settings, "WIKI_SEARCH_CONFIG", "english")
+
 #: Choose the Group model to use for permission handling. Defaults to django's auth.Group.
 GROUP_MODEL = getattr(django_settings, "WIKI_GROUP_MODEL", "auth.Group")
 
@@ -43,6 +43,11 @@ class BasePlugin:
 
     markdown_extensions = []
 
+    # Callables run on every display of a cached article, as
+    # f(html, article, user) -> html. Markdown extensions render once for all
+    # readers, so anything that varies by user belongs here. Keep them cheap.
+    user_postprocessors = []
+
     class RenderMedia:
         js = []
         css = {}
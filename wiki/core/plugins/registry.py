@@ -3,6 +3,7 @@ from importlib import import_module
 _cache = {}
 _settings_forms = []
 _markdown_extensions = []
+_user_postprocessors = []
 _article_tabs = []
 _sidebar = []
 _html_whitelist = []
@@ -36,6 +37,8 @@ def register(plugin_class):
 
     _markdown_extensions.extend(getattr(plugin_class, "markdown_extensions", []))
 
+    _user_postprocessors.extend(getattr(plugin_class, "user_postprocessors", []))
+
     _html_whitelist.extend(getattr(plugin_class, "html_whitelist", []))
 
     _html_attributes.update(getattr(plugin_class, "html_attributes", {}))
@@ -51,6 +54,11 @@ def get_markdown_extensions():
     return _markdown_extensions
 
 
+def get_user_postprocessors():
+    """Get all per-user post-processing callables from plugins"""
+    return _user_postprocessors
+
+
 def get_article_tabs():
     """Get all article tab dictionaries from plugins"""
     return _article_tabs
@@ -0,0 +1,50 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from wiki.conf import settings
+
+# Markers PostgreSQL puts around matched words in a headline. They are private
+# use characters so they survive HTML escaping of the (user written) text.
+_START_SEL = "\ue000"
+_STOP_SEL = "\ue001"
+
+
+def search_query(text):
+    """
+    A full text query for ``ArticleRevision.search_vector``. Accepts the
+    usual web search syntax: quoted phrases, ``or`` and ``-excluded`` words.
+    """
+    return SearchQuery(text, search_type="websearch", config=settings.SEARCH_CONFIG)
+
+
+def get_headlines(revision_ids, query, max_words=30):
+    """
+    Returns ``{revision id: snippet}`` for the given revisions, where each
+    snippet is safe HTML with the matched words wrapped in a strong tag.
+    Meant for one page of search results, as headlines are computed from the
+    full content.
+    """
+    from wiki.models import ArticleRevision  # noqa: PLC0415
+
+    revisions = (
+        ArticleRevision.objects.filter(pk__in=revision_ids)
+        .annotate(
+            headline=SearchHeadline(
+                "content",
+                query,
+                config=settings.SEARCH_CONFIG,
+                start_sel=_START_SEL,
+                stop_sel=_STOP_SEL,
+                max_words=max_words,
+                min_words=max_words // 2,
+            )
+        )
+        .values_list("pk", "headline")
+    )
+    return {
+        pk: mark_safe(  # noqa: S308
+            escape(headline).replace(_START_SEL, "<strong>").replace(_STOP_SEL, "</strong>")
+        )
+        for pk, headline in revisions
+    }
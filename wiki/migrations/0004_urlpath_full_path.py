@@ -0,0 +1,49 @@
+# Generated by Django 6.0.7 on 2026-10-17 10:10
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def fill_full_paths(apps, schema_editor):
+    URLPath = apps.get_model("wiki", "URLPath")
+    full_paths = {}
+    urlpaths = []
+    # Parents come before their children in tree order.
+    for urlpath in URLPath.objects.order_by("tree_id", "lft").only("pk", "parent_id", "slug"):
+        if urlpath.parent_id is None:
+            urlpath.full_path = ""
+        else:
+            urlpath.full_path = f"{full_paths.get(urlpath.parent_id, '')}{urlpath.slug or ''}/"
+        full_paths[urlpath.pk] = urlpath.full_path
+        urlpaths.append(urlpath)
+    URLPath.objects.bulk_update(urlpaths, ["full_path"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sites", "0002_alter_domain_unique"),
+        ("wiki", "0003_mptt_upgrade"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="urlpath",
+            name="full_path",
+            field=models.TextField(
+                blank=True, default="", editable=False, verbose_name="full path"
+            ),
+        ),
+        migrations.RunPython(fill_full_paths, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="urlpath",
+            index=models.Index(fields=["site", "full_path"], name="wiki_urlpath_full_path"),
+        ),
+        migrations.AddIndex(
+            model_name="urlpath",
+            index=models.Index(
+                django.db.models.functions.text.Upper("full_path"),
+                models.F("site"),
+                name="wiki_urlpath_full_path_upper",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.7 on 2026-10-17 10:13
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from wiki.conf import settings as wiki_settings
+
+
+def fill_search_vectors(apps, schema_editor):
+    """Index the current revision of every article; older revisions are never searched."""
+    Article = apps.get_model("wiki", "Article")
+    ArticleRevision = apps.get_model("wiki", "ArticleRevision")
+    config = wiki_settings.SEARCH_CONFIG
+    ArticleRevision.objects.filter(pk__in=Article.objects.values("current_revision_id")).update(
+        search_vector=django.contrib.postgres.search.SearchVector(
+            "title", weight="A", config=config
+        )
+        + django.contrib.postgres.search.SearchVector("content", weight="B", config=config)
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wiki", "0004_urlpath_full_path"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="articlerevision",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="articlerevision",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="wiki_revision_search_gin"
+            ),
+        ),
+    ]
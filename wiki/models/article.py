@@ -1,6 +1,8 @@
 from django.conf import settings as django_settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.cache import cache
 from django.db import models
 from django.db.models.fields import GenericIPAddressField as IPAddressField
@@ -16,6 +18,7 @@ from wiki import managers
 from wiki.conf import settings
 from wiki.core import permissions
 from wiki.core.markdown import article_markdown
+from wiki.core.plugins import registry as plugin_registry
 from wiki.decorators import disable_signal_for_loaddata
 
 __all__ = [
@@ -213,16 +216,8 @@ class Article(models.Model):
         lang = translation.get_language()
 
         key_raw = (
-            f"wiki-article-{self.current_revision.id if self.current_revision else self.id}-{lang}"
-        )
-        # https://github.com/django-wiki/django-wiki/issues/1065
-        return slugify(key_raw, allow_unicode=True)
-
-    def get_cache_content_key(self, user=None):
-        """Returns per-article-user cache key."""
-        key_raw = "{key}-{user}".format(
-            key=self.get_cache_key(),
-            user=user.get_username() if user else "-anonymous",
+            f"wiki-article-html-{self.current_revision.id if self.current_revision else self.id}"
+            f"-{lang}"
         )
         # https://github.com/django-wiki/django-wiki/issues/1065
         return slugify(key_raw, allow_unicode=True)
@@ -230,32 +225,23 @@ class Article(models.Model):
     def get_cached_content(self, user=None):
         """Returns cached version of rendered article.
 
-        The cache contains one "per-article" entry plus multiple
-        "per-article-user" entries. The per-article-user entries contain the
-        rendered article, the per-article entry contains list of the
-        per-article-user keys. The rendered article in cache (per-article-user)
-        is used only if the key is in the per-article entry. To delete
-        per-article invalidates all article cache entries."""
+        The Markdown is rendered without a user and cached once per revision
+        and language, shared by all readers. The plugins' user_postprocessors
+        then adapt that copy to the reader on every call."""
 
         if user and user.is_anonymous:
             user = None
 
         cache_key = self.get_cache_key()
-        cache_content_key = self.get_cache_content_key(user)
-
-        cached_items = cache.get(cache_key, [])
+        content = cache.get(cache_key)
+        if content is None:
+            content = self.render()
+            cache.set(cache_key, content, settings.CACHE_TIMEOUT)
 
-        if cache_content_key in cached_items:
-            cached_content = cache.get(cache_content_key)
-            if cached_content is not None:
-                return mark_safe(cached_content)
+        for postprocess in plugin_registry.get_user_postprocessors():
+            content = postprocess(content, self, user)
 
-        cached_content = self.render(user=user)
-        cached_items.append(cache_content_key)
-        cache.set(cache_key, cached_items, settings.CACHE_TIMEOUT)
-        cache.set(cache_content_key, cached_content, settings.CACHE_TIMEOUT)
-
-        return mark_safe(cached_content)
+        return mark_safe(content)
 
     def clear_cache(self):
         cache.delete(self.get_cache_key())
@@ -395,9 +381,21 @@ class ArticleRevision(BaseRevisionMixin, models.Model):
     #                             of another article.'),
     #                             related_name='redirect_set')
 
+    # Do NOT modify this field - it is the full text search document for the
+    # title and content, updated in on_article_revision_post_save.
+    search_vector = SearchVectorField(null=True, editable=False)
+
     def __str__(self):
         return f"{self.title} ({self.revision_number})"
 
+    @staticmethod
+    def search_document():
+        """Expression building a revision's search_vector from its own columns.
+        Titles rank above content."""
+        return SearchVector("title", weight="A", config=settings.SEARCH_CONFIG) + SearchVector(
+            "content", weight="B", config=settings.SEARCH_CONFIG
+        )
+
     def clean(self):
         # Enforce DOS line endings \r\n. It is the standard for web browsers,
         # but when revisions are created programatically, they might
@@ -420,6 +418,7 @@ class ArticleRevision(BaseRevisionMixin, models.Model):
         get_latest_by = "revision_number"
         ordering = ("created",)
         unique_together = ("article", "revision_number")
+        indexes = [GinIndex(fields=["search_vector"], name="wiki_revision_search_gin")]
 
 
 ######################################################
@@ -469,6 +468,9 @@ def on_article_revision_pre_save(**kwargs):
 @disable_signal_for_loaddata
 def on_article_revision_post_save(**kwargs):
     instance = kwargs["instance"]
+    ArticleRevision.objects.filter(pk=instance.pk).update(
+        search_vector=ArticleRevision.search_document()
+    )
     if not instance.article.current_revision:
         # If I'm saved from Django admin, then article.current_revision is
         # me!
@@ -6,6 +6,8 @@ from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
+from django.db.models import Value
+from django.db.models.functions import Concat, Substr, Upper
 from django.db.models.signals import post_save, pre_delete
 from django.urls import reverse
 from django.utils.translation import gettext, gettext_lazy as _
@@ -88,6 +90,17 @@ class URLPath(MPTTModel):
         related_name="moved_from",
     )
 
+    # Do NOT modify this field - it is the slugs of all ancestors (except the
+    # root) and this node, each followed by a slash, i.e. the same as path. It
+    # is kept up to date on save() (which move_to() also goes through), so that
+    # get_by_path() is a single indexed lookup.
+    full_path = models.TextField(
+        verbose_name=_("full path"),
+        blank=True,
+        default="",
+        editable=False,
+    )
+
     def __cached_ancestors(self):
         """
         This returns the ancestors of this urlpath. These ancestors are hopefully
@@ -101,7 +114,7 @@ class URLPath(MPTTModel):
         # "not self.pk": HACK needed till PR#591 is included in all supported django-mptt
         #   versions. Prevent accessing a deleted URLPath when deleting it from the admin
         #   interface.
-        if not self.pk or not self.get_ancestors().exists():
+        if not self.pk or self.is_root_node():
             self._cached_ancestors = []
         if not hasattr(self, "_cached_ancestors"):
             self._cached_ancestors = list(self.get_ancestors().select_related_common())
@@ -145,6 +158,29 @@ class URLPath(MPTTModel):
                 return ancestor
         return None
 
+    def _build_full_path(self):
+        if not self.parent:
+            return ""
+        return f"{self.parent.full_path}{self.slug or ''}/"
+
+    def _rewrite_descendant_paths(self, old_full_path):
+        """Swap the old path prefix of every descendant for the new one, in
+        one UPDATE, after this node was renamed or moved."""
+        if not old_full_path or old_full_path == self.full_path:
+            return
+        descendants = URLPath.objects.filter(
+            site_id=self.site_id, full_path__startswith=old_full_path
+        ).exclude(pk=self.pk)
+        descendants.update(
+            full_path=Concat(Value(self.full_path), Substr("full_path", len(old_full_path) + 1))
+        )
+
+    def save(self, *args, **kwargs):
+        old_full_path = self.full_path if self.pk else None
+        self.full_path = self._build_full_path()
+        super().save(*args, **kwargs)
+        self._rewrite_descendant_paths(old_full_path)
+
     @transaction.atomic
     def _delete_subtree(self):
         for descendant in self.get_descendants(include_self=True).order_by("-level"):
@@ -187,6 +223,10 @@ class URLPath(MPTTModel):
         verbose_name = _("URL path")
         verbose_name_plural = _("URL paths")
         unique_together = ("site", "parent", "slug")
+        indexes = [
+            models.Index(fields=["site", "full_path"], name="wiki_urlpath_full_path"),
+            models.Index(Upper("full_path"), "site", name="wiki_urlpath_full_path_upper"),
+        ]
 
     def clean(self, *args, **kwargs):
         if self.slug and not self.parent:
@@ -205,10 +245,6 @@ class URLPath(MPTTModel):
         Accepts paths both starting with and without '/'
         """
 
-        # TODO: Save paths directly in the model for constant time lookups?
-
-        # Or: Save the parents in a lazy property because the parents are
-        # always fetched anyways so it's fine to fetch them here.
         path = path.lstrip("/")
         path = path.rstrip("/")
 
@@ -216,21 +252,39 @@ class URLPath(MPTTModel):
         if not path:
             return cls.root()
 
+        # Fetch the node and all of its ancestors in one query, by the full
+        # path of each of them.
         slugs = path.split("/")
-        level = 1
-        parent = cls.root()
-        for slug in slugs:
-            if settings.URL_CASE_SENSITIVE:
-                child = parent.get_children().select_related_common().get(slug=slug)
-                child.cached_ancestors = [*parent.cached_ancestors, parent]
-                parent = child
-            else:
-                child = parent.get_children().select_related_common().get(slug__iexact=slug)
-                child.cached_ancestors = [*parent.cached_ancestors, parent]
-                parent = child
-            level += 1
-
-        return parent
+        full_paths = [""] + ["/".join(slugs[: i + 1]) + "/" for i in range(len(slugs))]
+        site = Site.objects.get_current()
+        urlpaths = cls.objects.filter(site=site).select_related_common()
+        if settings.URL_CASE_SENSITIVE:
+            urlpaths = urlpaths.filter(full_path__in=full_paths)
+        else:
+            urlpaths = urlpaths.alias(upper_path=Upper("full_path")).filter(
+                upper_path__in=[full_path.upper() for full_path in full_paths]
+            )
+
+        by_level = {}
+        for urlpath in urlpaths:
+            by_level.setdefault(urlpath.level, []).append(urlpath)
+
+        if len(by_level.get(0, [])) != 1:
+            # Missing or duplicated root: have root() raise the right error.
+            cls.root()
+        for level in range(1, len(full_paths)):
+            matches = by_level.get(level, [])
+            if not matches:
+                raise cls.DoesNotExist(f"URLPath matching {full_paths[level]!r} does not exist.")
+            if len(matches) > 1:
+                raise cls.MultipleObjectsReturned(
+                    f"More than one URLPath matches {full_paths[level]!r}."
+                )
+
+        ancestors = [by_level[level][0] for level in range(len(full_paths))]
+        for level, urlpath in enumerate(ancestors):
+            urlpath.cached_ancestors = ancestors[:level]
+        return ancestors[-1]
 
     def get_absolute_url(self):
         return reverse("wiki:get", kwargs={"path": self.path})
@@ -9,6 +9,7 @@ from django.views.generic import FormView, ListView, TemplateView, View
 
 from wiki.core.http import send_file
 from wiki.core.paginator import WikiPaginator
+from wiki.core.search import search_query
 from wiki.decorators import get_article, response_forbidden
 from wiki.plugins.attachments import forms, models, settings
 from wiki.views.mixins import ArticleMixin
@@ -394,7 +395,7 @@ class AttachmentSearchView(ArticleMixin, ListView):
             qs = qs.filter(
                 Q(original_filename__contains=self.query)
                 | Q(current_revision__description__contains=self.query)
-                | Q(article__current_revision__title__contains=self.query)
+                | Q(article__current_revision__search_vector=search_query(self.query))
             )
         return qs.order_by("original_filename")
 
@@ -1,15 +1,16 @@
 import html
 from urllib.parse import urljoin, urlparse
 
+from django.contrib.sites.models import Site
+from django.db.models.functions import Upper
 from django.urls import resolve
 from django.urls.exceptions import Resolver404
 from markdown.extensions import Extension
 from markdown.postprocessors import AndSubstitutePostprocessor
 from markdown.treeprocessors import Treeprocessor
 
-import wiki
+from wiki.conf import settings
 from wiki.core.markdown import add_to_registry
-from wiki.decorators import which_article
 from wiki.models import Article, URLPath
 
 
@@ -29,10 +30,13 @@ class LinkTreeprocessor(Treeprocessor):
             self._my_urlpath = self.md.article.get_absolute_url()
             return self._my_urlpath
 
-    def get_class(self, el):  # noqa: max-complexity 11
-        href = el.get("href")
-        if not href:
-            return None
+    def get_target(self, href):  # noqa: PLR0911
+        """
+        Classify one href without touching the database. Returns a CSS class,
+        or a ``("path", full_path)`` / ``("article_id", id)`` key when the
+        link points into the wiki and only a lookup can tell whether the
+        target exists, or None for links that get no class.
+        """
         # The autolinker turns email links into links with many HTML entities.
         # These entities are further escaped using markdown-specific codes.
         # First unescape the markdown-specific, then use html.unescape.
@@ -59,22 +63,67 @@ class LinkTreeprocessor(Treeprocessor):
             # Links outside wiki
             return self.external_class
 
-        try:
-            _article, _urlpath = which_article(**target.kwargs)
-        except (
-            wiki.core.exceptions.NoRootURL,
-            URLPath.DoesNotExist,
-            Article.DoesNotExist,
-        ):
-            return self.broken_class
-
+        # Same normalization as URLPath.get_by_path()
+        path = target.kwargs.get("path")
+        if path is not None:
+            path = path.strip("/")
+            return ("path", f"{path}/" if path else "")
+        article_id = target.kwargs.get("article_id")
+        if article_id is not None:
+            return ("article_id", int(article_id))
         return self.internal_class
 
+    def find_existing(self, targets):
+        """
+        The subset of the ``get_target()`` lookup keys in ``targets`` whose
+        URLPath or Article exists, using at most one query for each kind.
+        """
+        paths = {value for kind, value in targets if kind == "path"}
+        article_ids = {value for kind, value in targets if kind == "article_id"}
+        existing = set()
+
+        if paths:
+            urlpaths = URLPath.objects.filter(site=Site.objects.get_current())
+            if settings.URL_CASE_SENSITIVE:
+                found = set(
+                    urlpaths.filter(full_path__in=paths).values_list("full_path", flat=True)
+                )
+                existing.update(("path", path) for path in paths if path in found)
+            else:
+                found = set(
+                    urlpaths.annotate(upper_path=Upper("full_path"))
+                    .filter(upper_path__in={path.upper() for path in paths})
+                    .values_list("upper_path", flat=True)
+                )
+                existing.update(("path", path) for path in paths if path.upper() in found)
+
+        if article_ids:
+            found = set(Article.objects.filter(id__in=article_ids).values_list("id", flat=True))
+            existing.update(("article_id", pk) for pk in article_ids if pk in found)
+
+        return existing
+
     def run(self, doc):
-        for el in doc.iter():
-            if el.tag != "a":
+        # Classify every link first (memoized per href), then look up all of
+        # the internal targets together.
+        targets = {}
+        links = []
+        for el in doc.iter("a"):
+            href = el.get("href")
+            if not href:
                 continue
-            class_ = self.get_class(el)
+            if href not in targets:
+                targets[href] = self.get_target(href)
+            links.append((el, targets[href]))
+
+        existing = self.find_existing(
+            {target for target in targets.values() if isinstance(target, tuple)}
+        )
+
+        for el, target in links:
+            class_ = target
+            if isinstance(target, tuple):
+                class_ = self.internal_class if target in existing else self.broken_class
             if class_:
                 # Append class
                 classes = (el.get("class", "") + " " + class_).strip()
@@ -4,8 +4,9 @@ from urllib.parse import urljoin
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.contrib.postgres.search import SearchRank
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import F, Q
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -21,6 +22,7 @@ from wiki.core.diff import simple_merge
 from wiki.core.exceptions import NoRootURL
 from wiki.core.paginator import WikiPaginator
 from wiki.core.plugins import registry as plugin_registry
+from wiki.core.search import get_headlines, search_query
 from wiki.core.utils import object_to_json_response
 from wiki.decorators import get_article
 from wiki.views.mixins import ArticleMixin
@@ -592,7 +594,7 @@ class Dir(ListView, ArticleMixin):
         children = self.urlpath.get_children().can_read(self.request.user)
         if self.query:
             children = children.filter(
-                Q(article__current_revision__title__icontains=self.query)
+                Q(article__current_revision__search_vector=search_query(self.query))
                 | Q(slug__icontains=self.query)
             )
         if not self.article.can_moderate(self.request.user):
@@ -649,16 +651,24 @@ class SearchView(ListView):
                 articles = articles.filter(id__in=article_ids)
             except NoRootURL, models.URLPath.DoesNotExist:
                 raise Http404 from None
-        articles = articles.filter(
-            Q(current_revision__title__icontains=self.query)
-            | Q(current_revision__content__icontains=self.query)
+        query = search_query(self.query)
+        articles = articles.filter(current_revision__search_vector=query).annotate(
+            rank=SearchRank(F("current_revision__search_vector"), query)
         )
         if not permissions.can_moderate(models.URLPath.root().article, self.request.user):
             articles = articles.active().can_read(self.request.user)
-        return articles.order_by("-current_revision__created")
+        return articles.order_by("-rank", "-current_revision__created")
 
     def get_context_data(self, **kwargs):
         kwargs = super().get_context_data(**kwargs)
+        if self.query:
+            # Only the articles on this page get a headline
+            articles = kwargs[self.context_object_name]
+            headlines = get_headlines(
+                [article.current_revision_id for article in articles], search_query(self.query)
+            )
+            for article in articles:
+                article.search_headline = headlines.get(article.current_revision_id, "")
         kwargs["search_form"] = self.search_form
         kwargs["search_query"] = self.query
         kwargs["urlpath"] = self.urlpath